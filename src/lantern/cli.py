@@ -1,31 +1,39 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+import functools
+import hashlib
 import json
 import os
 import re
 import shlex
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
 import urllib.parse
-from typing import Any, Dict, List, MutableMapping, Optional, Set, Tuple
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Set, Tuple
 
 try:
-    import argcomplete
-except ImportError:  # pragma: no cover - optional dependency in some environments
-    argcomplete = None
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup (pip install git-lantern[fast])
+    orjson = None
 
 from . import config as lantern_config
 from . import forge
 from . import git
 from . import github
-from . import todo_issues
+from . import http_pool
 from .table import render_table
 
 # Resolved path to the src/ directory for subprocess PYTHONPATH
 _SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Default number of repositories processed concurrently. Per-repo work is
+# spent waiting on git child processes, so threads overlap it well.
+DEFAULT_JOBS = 8
+
 
 # Common server presets for TUI setup
 SERVER_PRESETS = {
@@ -44,56 +52,226 @@ SERVER_PRESETS = {
 }
 
 
+# Commands that only read the local filesystem and never consult the forge
+# credentials or server selection that `.env` provides; main() skips reading it.
+_DOTENV_FREE_COMMANDS = frozenset({"repos", "lazygit", "scan", "table", "find", "duplicates", "report"})
+
+
 def load_dotenv() -> None:
     path = os.environ.get("GIT_LANTERN_ENV", os.path.join(os.getcwd(), ".env"))
-    if not os.path.isfile(path):
+    # Open directly instead of probing with isfile(): a missing file or a directory
+    # both surface as OSError, saving a stat() on every invocation.
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+    except OSError:
         return
-    with open(path, "r", encoding="utf-8") as handle:
-        for raw in handle:
-            line = raw.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            os.environ.setdefault(key.strip(), value.strip())
+    # Work on bytes and decode only the key/value pairs that are kept.
+    for raw in data.splitlines():
+        line = raw.strip()
+        if not line or line.startswith(b"#") or b"=" not in line:
+            continue
+        key, _sep, value = line.partition(b"=")
+        os.environ.setdefault(key.strip().decode("utf-8"), value.strip().decode("utf-8"))
 
 
-def repo_depth(root: str, path: str) -> int:
-    rel = os.path.relpath(path, root)
-    if rel == ".":
-        return 0
-    return rel.count(os.sep) + 1
+@functools.lru_cache(maxsize=8192)
+def _repo_dir_name(path: str) -> str:
+    """Return the interned directory name of a repo path (computed once per path)."""
+    return sys.intern(os.path.basename(path))
+
+
+_GITFILE_READ_LIMIT = 4096
+
+
+def _gitfile_marks_repo_root(git_file: str) -> bool:
+    try:
+        with open(git_file, "rb") as handle:
+            # A gitfile is a single short "gitdir: <path>" line; cap the read so a
+            # stray large .git file cannot be slurped whole during the walk.
+            first = handle.readline(_GITFILE_READ_LIMIT).strip()
+    except OSError:
+        return False
+    # Match on raw bytes: only the prefix and a path fragment are inspected, so decoding is unnecessary.
+    if first[:7].lower() == b"gitdir:":
+        if b".git/modules/" in first[7:].replace(b"\\", b"/"):
+            return False
+        return True
+    return False
 
 
 def _is_git_repo_root(path: str) -> bool:
     git_dir = os.path.join(path, ".git")
-    if os.path.isdir(git_dir):
+    try:
+        mode = os.stat(git_dir).st_mode
+    except OSError:
+        return False
+    if stat.S_ISDIR(mode):
         return True
-    if os.path.isfile(git_dir):
-        try:
-            with open(git_dir, "r", encoding="utf-8") as handle:
-                first = handle.readline().strip()
-        except OSError:
-            return False
-        if first.lower().startswith("gitdir:"):
-            gitdir = first.split(":", 1)[1].strip()
-            if ".git/modules/" in gitdir.replace("\\", "/"):
-                return False
+    if stat.S_ISREG(mode):
+        return _gitfile_marks_repo_root(git_dir)
+    return False
+
+
+def _git_entry_marks_repo_root(entry: "os.DirEntry[str]") -> bool:
+    # DirEntry type checks use the d_type cached by scandir; only symlinks cost a stat().
+    try:
+        if entry.is_dir():
             return True
+        if entry.is_file():
+            return _gitfile_marks_repo_root(entry.path)
+    except OSError:
+        return False
     return False
 
 
-def find_repos(root: str, max_depth: int, include_hidden: bool) -> List[str]:
-    matches = []
-    for current, dirs, files in os.walk(root):
-        if not include_hidden:
-            dirs[:] = [d for d in dirs if not d.startswith(".")]
-        if _is_git_repo_root(current):
-            matches.append(current)
-            dirs[:] = []
+def iter_repos(root: str, max_depth: int, include_hidden: bool) -> Iterator[str]:
+    """Yield repo roots under ``root`` as they are discovered (in walk order)."""
+    # Depth travels with each directory so no path arithmetic is needed.
+    stack: List[Tuple[str, int]] = [(root, 0)]
+    while stack:
+        current, depth = stack.pop()
+        descend = max_depth is None or depth < max_depth
+        children: List[str] = []
+        is_repo = False
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name == ".git":
+                        if _git_entry_marks_repo_root(entry):
+                            is_repo = True
+                            break
+                        continue
+                    if not descend or (not include_hidden and name.startswith(".")):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            children.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
             continue
-        if max_depth is not None and repo_depth(root, current) >= max_depth:
-            dirs[:] = []
-    return sorted(matches, key=lambda path: (os.path.basename(path).lower(), path.lower()))
+        if is_repo:
+            yield current
+            continue
+        stack.extend((child, depth + 1) for child in children)
+
+
+def _repo_sort_key(path: str) -> Tuple[str, str]:
+    return _repo_dir_name(path).lower(), path.lower()
+
+
+def find_repos(root: str, max_depth: int, include_hidden: bool) -> List[str]:
+    # sorted() materializes the generator directly; no intermediate match list is kept.
+    return sorted(iter_repos(root, max_depth, include_hidden), key=_repo_sort_key)
+
+
+def _scan_cache_file(root: str, max_depth: int, include_hidden: bool) -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    key = f"{os.path.realpath(root)}\0{max_depth}\0{include_hidden}".encode("utf-8")
+    return os.path.join(cache_home, "git-lantern", f"scan-{hashlib.sha256(key).hexdigest()[:16]}.json")
+
+
+def _scan_signature(root: str, include_hidden: bool) -> List[List[Any]]:
+    """Return mtimes of root and its immediate subdirectories (adding/removing a repo there changes them)."""
+    signature: List[List[Any]] = [["", os.stat(root).st_mtime_ns]]
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if not include_hidden and entry.name.startswith("."):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    signature.append([entry.name, entry.stat(follow_symlinks=False).st_mtime_ns])
+            except OSError:
+                continue
+    signature.sort()
+    return signature
+
+
+def _git_config_mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(os.path.join(path, ".git", "config")).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _cached_scan_entries(cache_file: str, signature: List[List[Any]]) -> Optional[List[Tuple[str, Optional[str]]]]:
+    try:
+        cached = _read_json(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("signature") != signature or not isinstance(cached.get("repos"), list):
+        return None
+    entries: List[Tuple[str, Optional[str]]] = []
+    for item in cached["repos"]:
+        if not isinstance(item, list) or len(item) != 3:
+            return None
+        path, origin, config_mtime_ns = item
+        if not isinstance(path, str) or not _is_git_repo_root(path):
+            return None
+        if config_mtime_ns != _git_config_mtime_ns(path):
+            origin = _origin_url(path)
+        entries.append((path, origin))
+    return entries
+
+
+def _with_origins(paths: List[str], jobs: int = DEFAULT_JOBS) -> List[Tuple[str, Optional[str]]]:
+    """Pair each path with its origin URL, running up to ``jobs`` lookups concurrently."""
+    if jobs <= 1 or len(paths) <= 1:
+        return [(path, _origin_url(path)) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(jobs, len(paths))) as executor:
+        return list(zip(paths, executor.map(_origin_url, paths)))
+
+
+def _scan_repos_with_origins(
+    root: str,
+    max_depth: int,
+    include_hidden: bool,
+    use_cache: bool = False,
+    jobs: int = DEFAULT_JOBS,
+) -> List[Tuple[str, Optional[str]]]:
+    """Return ``(path, origin)`` pairs, optionally reusing a per-root sidecar cache.
+
+    The cache is keyed on root/depth/hidden and invalidated when the mtime of the
+    root or one of its immediate subdirectories changes. Origins are refreshed per
+    repo whenever its ``.git/config`` changed.
+    """
+    if not use_cache:
+        return _with_origins(find_repos(root, max_depth, include_hidden), jobs)
+    cache_file = _scan_cache_file(root, max_depth, include_hidden)
+    try:
+        signature = _scan_signature(root, include_hidden)
+    except OSError:
+        return _with_origins(find_repos(root, max_depth, include_hidden), jobs)
+    entries = _cached_scan_entries(cache_file, signature)
+    if entries is not None:
+        return entries
+    entries = _with_origins(find_repos(root, max_depth, include_hidden), jobs)
+    payload = {
+        "signature": signature,
+        "repos": [[path, origin, _git_config_mtime_ns(path)] for path, origin in entries],
+    }
+    _write_scan_cache(cache_file, payload)
+    return entries
+
+
+def _write_scan_cache(cache_file: str, payload: Dict[str, Any]) -> None:
+    # The cache is best-effort: failures only cost a rescan next time.
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
 
 def _repo_name_for_sort(record: Dict[str, Any]) -> str:
@@ -103,7 +281,7 @@ def _repo_name_for_sort(record: Dict[str, Any]) -> str:
             return value
     path = str(record.get("path") or "").strip()
     if path:
-        return os.path.basename(path)
+        return _repo_dir_name(path)
     return ""
 
 
@@ -117,29 +295,42 @@ def _sort_records_by_repo_name(records: List[Dict[str, Any]]) -> List[Dict[str,
     )
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_origin_url(path: str, config_mtime_ns: int) -> Optional[str]:
+    return git.get_origin_url(path)
+
+
+def _origin_url(path: str) -> Optional[str]:
+    """Return the origin URL, memoized per process until ``.git/config`` changes."""
+    try:
+        config_mtime_ns = os.stat(os.path.join(path, ".git", "config")).st_mtime_ns
+    except OSError:
+        return git.get_origin_url(path)
+    return _cached_origin_url(path, config_mtime_ns)
+
+
 def build_repo_record(path: str, fetch: bool) -> Dict[str, str]:
-    name = os.path.basename(path)
+    name = _repo_dir_name(path)
     if fetch:
         git.fetch(path)
     status = git.repo_status(path)
+    # repo_status always fills every RepoStatus key, so index directly.
     return {
         "name": name,
         "path": path,
-        "branch": status.get("branch"),
-        "upstream": status.get("upstream"),
-        "up_ahead": status.get("upstream_ahead"),
-        "up_behind": status.get("upstream_behind"),
-        "main_ref": status.get("main_ref"),
-        "main_ahead": status.get("main_ahead"),
-        "main_behind": status.get("main_behind"),
-        "default_refs": status.get("default_refs"),
-        "origin": git.get_origin_url(path),
+        "branch": status["branch"],
+        "upstream": status["upstream"],
+        "up_ahead": status["upstream_ahead"],
+        "up_behind": status["upstream_behind"],
+        "main_ref": status["main_ref"],
+        "main_ahead": status["main_ahead"],
+        "main_behind": status["main_behind"],
+        "default_refs": status["default_refs"],
+        "origin": _origin_url(path),
     }
 
 
 def _to_int_or_none(value) -> Optional[int]:
-    if isinstance(value, int):
-        return value
     if value is None:
         return None
     try:
@@ -148,16 +339,27 @@ def _to_int_or_none(value) -> Optional[int]:
         return None
 
 
+_NO_DIVERGENCE = (0, 0)
+_UNKNOWN_DIVERGENCE = (None, None)
+
+
 def _format_divergence(ahead: Optional[int], behind: Optional[int]) -> str:
-    if ahead is None and behind is None:
-        return "-"
-    if ahead == 0 and behind == 0:
+    pair = (ahead, behind)
+    if pair == _NO_DIVERGENCE:
         return "≡"
+    if pair == _UNKNOWN_DIVERGENCE:
+        return "-"
     ahead_str = "-" if ahead is None else str(ahead)
     behind_str = "-" if behind is None else str(behind)
     return f"{ahead_str}↑/{behind_str}↓"
 
 
+@functools.lru_cache(maxsize=1024)
+def _divergence_cell(ahead: object, behind: object) -> str:
+    """Format raw ahead/behind values; memoized because few distinct pairs occur per run."""
+    return _format_divergence(_to_int_or_none(ahead), _to_int_or_none(behind))
+
+
 def _progress_line(current: int, total: int, message: str) -> None:
     if total <= 0:
         return
@@ -172,33 +374,95 @@ def _progress_done() -> None:
         print(file=sys.stderr)
 
 
+def _read_json(path: str) -> Any:
+    # Parsing the raw bytes skips the text-decoding layer; json detects UTF-8 itself.
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN, >64-bit ints, etc.: let json accept them or raise its usual error
+    return json.loads(data)
+
+
+def _write_json(handle: IO[str], payload: Any) -> None:
+    # json.dump issues one write per encoder chunk; render once and write once.
+    handle.write(json.dumps(payload, indent=2))
+
+
+def _dump_json_with_items(handle: IO[str], header: Dict[str, Any], key: str, items: Iterable[Any]) -> None:
+    """Write ``header`` plus a trailing ``key`` array, emitting one item at a time.
+
+    The output is identical to ``json.dump({**header, key: list(items)}, handle, indent=2)``
+    without materializing the rendered document in memory.
+    """
+    if header:
+        handle.write(json.dumps(header, indent=2)[:-2] + ",\n")
+    else:
+        handle.write("{\n")
+    handle.write(f"  {json.dumps(key)}: ")
+    separator = "[\n    "
+    for item in items:
+        handle.write(separator)
+        handle.write(json.dumps(item, indent=2).replace("\n", "\n    "))
+        separator = ",\n    "
+    handle.write("[]\n}" if separator == "[\n    " else "\n  ]\n}")
+
+
+def _jobs_from_args(args: argparse.Namespace) -> int:
+    raw_jobs = getattr(args, "jobs", None)
+    if raw_jobs is None:
+        return DEFAULT_JOBS
+    return max(1, int(raw_jobs))
+
+
 def _collect_repo_records_with_progress(
-    repos: List[str],
+    repos: Iterable[str],
     fetch: bool,
     action_label: str,
+    jobs: int = DEFAULT_JOBS,
 ) -> List[Dict[str, str]]:
-    records: List[Dict[str, str]] = []
-    total = len(repos)
-    for idx, path in enumerate(repos, start=1):
-        repo_name = os.path.basename(path)
-        verb = "fetch+status" if fetch else "status"
-        _progress_line(idx, total, f"{action_label}: {verb} {repo_name}")
-        records.append(build_repo_record(path, fetch))
+    """Build one record per repo, in the order ``repos`` yields them.
+
+    ``repos`` may be a lazy iterator such as ``iter_repos``: with ``jobs > 1`` each path
+    is submitted as soon as it is produced, so git work overlaps the directory walk.
+    """
+    verb = "fetch+status" if fetch else "status"
+    if isinstance(repos, list) and len(repos) <= 1:
+        jobs = 1
+    if jobs <= 1:
+        repo_list = list(repos)
+        total = len(repo_list)
+        records: List[Dict[str, str]] = []
+        for idx, path in enumerate(repo_list, start=1):
+            repo_name = _repo_dir_name(path)
+            _progress_line(idx, total, f"{action_label}: {verb} {repo_name}")
+            records.append(build_repo_record(path, fetch))
+        _progress_done()
+        return records
+
+    workers = min(jobs, len(repos)) if isinstance(repos, list) else jobs
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Submission order is kept so results come back in input order.
+        futures = [(path, executor.submit(build_repo_record, path, fetch)) for path in repos]
+        total = len(futures)
+        pending = {future: path for path, future in futures}
+        for done, future in enumerate(as_completed(pending), start=1):
+            future.result()
+            _progress_line(done, total, f"{action_label}: {verb} {_repo_dir_name(pending[future])}")
     _progress_done()
-    return records
+    return [future.result() for _path, future in futures]
 
 
 def add_divergence_fields(record: MutableMapping[str, object]) -> MutableMapping[str, object]:
-    up_ahead = _to_int_or_none(record.get("up_ahead"))
-    up_behind = _to_int_or_none(record.get("up_behind"))
-    main_ahead = _to_int_or_none(record.get("main_ahead"))
-    main_behind = _to_int_or_none(record.get("main_behind"))
-
-    up_value = _format_divergence(up_ahead, up_behind)
-    main_value = _format_divergence(main_ahead, main_behind)
-
-    record["up"] = up_value
-    record["main"] = main_value
+    get = record.get
+    try:
+        record["up"] = _divergence_cell(get("up_ahead"), get("up_behind"))
+        record["main"] = _divergence_cell(get("main_ahead"), get("main_behind"))
+    except TypeError:  # unhashable values from hand-edited JSON skip the memo
+        record["up"] = _format_divergence(_to_int_or_none(get("up_ahead")), _to_int_or_none(get("up_behind")))
+        record["main"] = _format_divergence(_to_int_or_none(get("main_ahead")), _to_int_or_none(get("main_behind")))
     return record
 
 
@@ -927,7 +1191,7 @@ def _handle_tui_todo_issues_action(session: Dict[str, Any], height: int, width:
     tag_to_path: Dict[str, str] = {}
     for idx, repo_path in enumerate(repos_list, start=1):
         tag = str(idx)
-        repo_name = os.path.basename(repo_path)
+        repo_name = _repo_dir_name(repo_path)
         menu_items.append((tag, f"{repo_name}  ({repo_path})"))
         tag_to_path[tag] = repo_path
 
@@ -1285,8 +1549,7 @@ def _fleet_log_path(root: str) -> str:
 
 def _fleet_short_summary_from_log(log_path: str) -> str:
     try:
-        with open(log_path, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = _read_json(log_path)
     except (OSError, json.JSONDecodeError):
         return f"Fleet log saved:\n{log_path}"
 
@@ -1618,8 +1881,7 @@ def cmd_fleet_logs(args: argparse.Namespace) -> int:
             return 0
 
     try:
-        with open(log_path, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = _read_json(log_path)
     except (OSError, json.JSONDecodeError) as exc:
         print(f"Failed to read fleet log '{log_path}': {exc}", file=sys.stderr)
         return 1
@@ -1995,9 +2257,9 @@ def cmd_tui(args: argparse.Namespace) -> int:
             records = []
             for path in repos_list:
                 records.append({
-                    "name": os.path.basename(path),
+                    "name": _repo_dir_name(path),
                     "path": path,
-                    "origin": git.get_origin_url(path),
+                    "origin": _origin_url(path),
                 })
             records = _sort_records_by_repo_name(records)
             output_text = render_table(records, ["name", "path", "origin"])
@@ -2596,7 +2858,7 @@ def cmd_tui(args: argparse.Namespace) -> int:
             items = []
             for idx, path in enumerate(repos_list, start=1):
                 tag = str(idx)
-                desc = f"{os.path.basename(path)} -> {path}"
+                desc = f"{_repo_dir_name(path)} -> {path}"
                 items.append((tag, desc))
             selected = _dialog_menu("lazygit", "Select repository to open:", items, height, width)
             if not selected:
@@ -2629,7 +2891,7 @@ def cmd_tui(args: argparse.Namespace) -> int:
                 os.makedirs(output_dir, exist_ok=True)
             try:
                 with open(output, "w", encoding="utf-8") as handle:
-                    json.dump(payload, handle, indent=2)
+                    _write_json(handle, payload)
                 _dialog_msgbox("Scan", f"Scan complete. Found {len(records)} repositories.\n\nOutput saved to:\n{output}")
             except OSError as exc:
                 _dialog_msgbox("Error", f"Failed to write output: {exc}")
@@ -2659,7 +2921,7 @@ def cmd_tui(args: argparse.Namespace) -> int:
                         os.makedirs(output_dir, exist_ok=True)
                     try:
                         with open(input_file, "w", encoding="utf-8") as handle:
-                            json.dump(payload, handle, indent=2)
+                            _write_json(handle, payload)
                     except OSError as exc:
                         _dialog_msgbox("Error", f"Failed to write scan file: {exc}")
                         continue
@@ -2669,8 +2931,7 @@ def cmd_tui(args: argparse.Namespace) -> int:
             if not os.path.isfile(input_file):
                 continue
             try:
-                with open(input_file, "r", encoding="utf-8") as handle:
-                    payload = json.load(handle)
+                payload = _read_json(input_file)
                 records = payload.get("repos", [])
                 if not records:
                     _dialog_msgbox("Table", "No records found in the JSON file.")
@@ -2698,8 +2959,8 @@ def cmd_tui(args: argparse.Namespace) -> int:
             repos_list = find_repos(session["root"], session["max_depth"], session["include_hidden"])
             records = []
             for path in repos_list:
-                repo_name = os.path.basename(path)
-                origin = git.get_origin_url(path)
+                repo_name = _repo_dir_name(path)
+                origin = _origin_url(path)
                 if name and name not in repo_name:
                     continue
                 if remote and (not origin or remote not in origin):
@@ -2718,7 +2979,7 @@ def cmd_tui(args: argparse.Namespace) -> int:
             repos_list = find_repos(session["root"], session["max_depth"], session["include_hidden"])
             groups: Dict[str, List[str]] = {}
             for path in repos_list:
-                origin = git.get_origin_url(path)
+                origin = _origin_url(path)
                 if not origin:
                     continue
                 groups.setdefault(origin, []).append(path)
@@ -2941,7 +3202,7 @@ def cmd_tui(args: argparse.Namespace) -> int:
                         os.makedirs(output_dir, exist_ok=True)
                     try:
                         with open(input_file, "w", encoding="utf-8") as handle:
-                            json.dump(payload, handle, indent=2)
+                            _write_json(handle, payload)
                     except OSError as exc:
                         _dialog_msgbox("Error", f"Failed to write scan file: {exc}")
                         continue
@@ -2960,8 +3221,7 @@ def cmd_tui(args: argparse.Namespace) -> int:
                 continue
             # Ask for column selection
             try:
-                with open(input_file, "r", encoding="utf-8") as handle:
-                    peek = json.load(handle)
+                peek = _read_json(input_file)
                 all_records = peek.get("repos", [])
                 if all_records:
                     available_cols = list(all_records[0].keys())
@@ -3002,12 +3262,14 @@ def cmd_tui(args: argparse.Namespace) -> int:
 
 def cmd_repos(args: argparse.Namespace) -> int:
     records = []
-    for path in find_repos(args.root, args.max_depth, args.include_hidden):
+    for path, origin in _scan_repos_with_origins(
+        args.root, args.max_depth, args.include_hidden, bool(getattr(args, "cache", False)), _jobs_from_args(args)
+    ):
         records.append(
             {
-                "name": os.path.basename(path),
+                "name": _repo_dir_name(path),
                 "path": path,
-                "origin": git.get_origin_url(path) or "-",
+                "origin": origin or "-",
             }
         )
     records = _sort_records_by_repo_name(records)
@@ -3017,14 +3279,13 @@ def cmd_repos(args: argparse.Namespace) -> int:
 
 
 def _lazygit_candidates(root: str, max_depth: int, include_hidden: bool) -> List[Dict[str, str]]:
-    repos = find_repos(root, max_depth, include_hidden)
     out: List[Dict[str, str]] = []
-    for path in repos:
+    for path, origin in _with_origins(find_repos(root, max_depth, include_hidden)):
         out.append(
             {
-                "name": os.path.basename(path),
+                "name": _repo_dir_name(path),
                 "path": path,
-                "origin": git.get_origin_url(path) or "-",
+                "origin": origin or "-",
             }
         )
     return _sort_records_by_repo_name(out)
@@ -3087,18 +3348,20 @@ def cmd_lazygit(args: argparse.Namespace) -> int:
 
 
 def cmd_scan(args: argparse.Namespace) -> int:
-    repos = find_repos(args.root, args.max_depth, args.include_hidden)
-    records = _collect_repo_records_with_progress(repos, args.fetch, "scan")
-    output = {"root": args.root, "repos": records}
+    # Feed the walk straight into the workers, then restore find_repos ordering.
+    repos = iter_repos(args.root, args.max_depth, args.include_hidden)
+    records = _collect_repo_records_with_progress(repos, args.fetch, "scan", jobs=_jobs_from_args(args))
+    records.sort(key=lambda record: _repo_sort_key(record["path"]))
+    header = {"root": args.root}
 
     if args.output:
         output_dir = os.path.dirname(args.output)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         with open(args.output, "w", encoding="utf-8") as handle:
-            json.dump(output, handle, indent=2)
+            _dump_json_with_items(handle, header, "repos", records)
     else:
-        json.dump(output, sys.stdout, indent=2)
+        _dump_json_with_items(sys.stdout, header, "repos", records)
         sys.stdout.write("\n")
     return 0
 
@@ -3134,7 +3397,7 @@ def cmd_fleet_overview(args: argparse.Namespace) -> int:
             if output_dir:
                 os.makedirs(output_dir, exist_ok=True)
             with open(args.output, "w", encoding="utf-8") as handle:
-                json.dump(snapshot_payload, handle, indent=2)
+                _write_json(handle, snapshot_payload)
         except OSError as exc:
             print(f"Failed to write fleet snapshot '{args.output}': {exc}", file=sys.stderr)
             return 1
@@ -3301,8 +3564,7 @@ def _resolve_org_selection(
 
 def _fleet_load_remote(args: argparse.Namespace) -> Dict[str, Any]:
     if args.input:
-        with open(args.input, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = _read_json(args.input)
         return payload if isinstance(payload, dict) else {"repos": []}
 
     provider, base_url, user, token, auth, server = _fleet_server_context(args)
@@ -3488,8 +3750,7 @@ def _snapshot_record_to_status_row(snapshot: Dict[str, Any]) -> Dict[str, str]:
 
 
 def _load_snapshot_payload(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = _read_json(path)
     if not isinstance(payload, dict):
         raise ValueError(f"Invalid snapshot payload: {path}")
     repos = payload.get("repos")
@@ -3498,24 +3759,77 @@ def _load_snapshot_payload(path: str) -> Dict[str, Any]:
     return payload
 
 
+def _snapshot_local_state(record: Dict[str, Any]) -> Dict[str, Any]:
+    # Records come fresh from _collect_repo_records_with_progress, so extend them in place.
+    snapshot_record: Dict[str, Any] = add_divergence_fields(record)
+    path = str(snapshot_record.get("path") or "")
+    worktree_state = git.get_working_tree_state(path)
+    in_progress = not git.is_operation_free(path)
+    snapshot_record["clean"] = "yes" if not in_progress else "no"
+    snapshot_record["worktree_state"] = worktree_state
+    snapshot_record["git_operation_in_progress"] = "yes" if in_progress else "no"
+    return snapshot_record
+
+
+def _github_pr_key(origin: str, configured_host: str) -> str:
+    host, owner, repo_name = _origin_owner_repo(origin)
+    if _host_matches_github_origin(configured_host, host) and owner and repo_name:
+        return f"{owner}/{repo_name}"
+    return ""
+
+
+def _fetch_pull_requests_by_repo(
+    keys: List[str],
+    token: str,
+    stale_days: int,
+    base_url: str,
+    jobs: int,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch open pull requests for each ``owner/repo`` key, ``jobs`` repositories at a time."""
+
+    def fetch(key: str) -> Tuple[List[Dict[str, Any]], Optional[Exception]]:
+        owner, repo_name = key.split("/", 1)
+        try:
+            return (
+                github.fetch_open_pull_requests(
+                    owner=owner,
+                    repo=repo_name,
+                    token=token or None,
+                    stale_days=stale_days,
+                    base_url=base_url or None,
+                ),
+                None,
+            )
+        except Exception as exc:
+            return [], exc
+
+    if jobs > 1 and len(keys) > 1:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(keys))) as executor:
+            results = list(executor.map(fetch, keys))
+    else:
+        results = [fetch(key) for key in keys]
+    by_repo: Dict[str, List[Dict[str, Any]]] = {}
+    for key, (prs, error) in zip(keys, results):
+        if error is not None:
+            print(f"Warning: failed to fetch pull requests for {key}: {error}", file=sys.stderr)
+        by_repo[key] = prs
+    return by_repo
+
+
 def _build_fleet_snapshot(
     args: argparse.Namespace,
     payload: Optional[Dict[str, Any]] = None,
     include_remote: bool = True,
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     local_paths = find_repos(args.root, args.max_depth, args.include_hidden)
-    local_records: List[Dict[str, Any]] = []
     fetch_requested = bool(getattr(args, "fetch", False))
-    collected_records = _collect_repo_records_with_progress(local_paths, fetch_requested, "snapshot")
-    for record in collected_records:
-        record = add_divergence_fields(dict(record))
-        path = str(record.get("path") or "")
-        worktree_state = git.get_working_tree_state(path)
-        in_progress = not git.is_operation_free(path)
-        record["clean"] = "yes" if not in_progress else "no"
-        record["worktree_state"] = worktree_state
-        record["git_operation_in_progress"] = "yes" if in_progress else "no"
-        local_records.append(record)
+    jobs = _jobs_from_args(args)
+    collected_records = _collect_repo_records_with_progress(local_paths, fetch_requested, "snapshot", jobs=jobs)
+    if jobs > 1 and len(collected_records) > 1:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(collected_records))) as executor:
+            local_records: List[Dict[str, Any]] = list(executor.map(_snapshot_local_state, collected_records))
+    else:
+        local_records = [_snapshot_local_state(record) for record in collected_records]
 
     if payload is None:
         payload = _fleet_load_remote(args) if include_remote else {"repos": []}
@@ -3532,7 +3846,6 @@ def _build_fleet_snapshot(
             remote_by_key[key] = repo
 
     local_by_remote_key: Dict[str, Dict[str, str]] = {}
-    pr_cache: Dict[str, List[Dict[str, Any]]] = {}
     raw_stale_days = getattr(args, "pr_stale_days", 30)
     stale_days = int(30 if raw_stale_days is None else raw_stale_days)
     configured_host = ""
@@ -3541,6 +3854,12 @@ def _build_fleet_snapshot(
             configured_host = (urllib.parse.urlparse(base_url).hostname or "").lower()
         except Exception:
             configured_host = ""
+    pr_cache: Dict[str, List[Dict[str, Any]]] = {}
+    if include_prs and provider == "github":
+        pr_keys = [_github_pr_key(str(rec.get("origin") or ""), configured_host) for rec in local_records]
+        pr_cache = _fetch_pull_requests_by_repo(
+            list(dict.fromkeys(key for key in pr_keys if key)), token, stale_days, base_url, jobs
+        )
 
     snapshot_rows: List[Dict[str, Any]] = []
     reserved_destinations: Set[str] = {
@@ -3561,21 +3880,8 @@ def _build_fleet_snapshot(
         latest_branch = _detect_latest_branch(path) if path else "-"
         prs = "-"
         if include_prs and provider == "github":
-            host, owner, repo_name = _origin_owner_repo(origin)
-            if _host_matches_github_origin(configured_host, host) and owner and repo_name:
-                cache_key = f"{owner}/{repo_name}"
-                if cache_key not in pr_cache:
-                    try:
-                        pr_cache[cache_key] = github.fetch_open_pull_requests(
-                            owner=owner,
-                            repo=repo_name,
-                            token=token or None,
-                            stale_days=stale_days,
-                            base_url=base_url or None,
-                        )
-                    except Exception as exc:
-                        print(f"Warning: failed to fetch pull requests for {cache_key}: {exc}", file=sys.stderr)
-                        pr_cache[cache_key] = []
+            cache_key = _github_pr_key(origin, configured_host)
+            if cache_key:
                 repo_prs = pr_cache.get(cache_key, [])
                 if repo_prs:
                     if latest_branch == "-":
@@ -3587,7 +3893,7 @@ def _build_fleet_snapshot(
             bool(worktree_state.get("has_untracked")) and not bool(worktree_state.get("has_tracked_changes"))
         ) else "no"
         snapshot = {
-            "repo": str(rec.get("name", os.path.basename(path))),
+            "repo": str(rec.get("name", _repo_dir_name(path))),
             "path": path,
             "origin_url": origin or "-",
             "local_exists": True,
@@ -3997,7 +4303,7 @@ def cmd_fleet_apply(args: argparse.Namespace) -> int:
 
         effective_branch = checkout_branch
         if pr_number:
-            _host, owner, repo_name = _origin_owner_repo(str(git.get_origin_url(path) or ""))
+            _host, owner, repo_name = _origin_owner_repo(str(_origin_url(path) or ""))
             if provider == "github" and owner and repo_name:
                 try:
                     resolved = github.get_pr_branch(
@@ -4196,25 +4502,28 @@ def cmd_fleet_apply(args: argparse.Namespace) -> int:
             if log_dir:
                 os.makedirs(log_dir, exist_ok=True)
             with open(args.log_json, "w", encoding="utf-8") as handle:
-                json.dump(log_payload, handle, indent=2)
+                _write_json(handle, log_payload)
         except OSError as exc:
             print(f"Failed to write fleet log '{args.log_json}': {exc}", file=sys.stderr)
     return 0
 
 
 def cmd_table(args: argparse.Namespace) -> int:
-    with open(args.input, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = _read_json(args.input)
     records = payload.get("repos", [])
     if not records:
         print("No records.")
         return 0
     for record in records:
-        if not all(
-            key in record for key in ("up_ahead", "up_behind", "main_ahead", "main_behind")
+        if "up" in record and "main" in record:
+            continue  # already derived (for example a saved status/snapshot export)
+        if (
+            "up_ahead" in record
+            and "up_behind" in record
+            and "main_ahead" in record
+            and "main_behind" in record
         ):
-            continue
-        add_divergence_fields(record)
+            add_divergence_fields(record)
     records = _sort_records_by_repo_name(records)
     if args.columns:
         columns = args.columns.split(",")
@@ -4231,11 +4540,16 @@ def cmd_table(args: argparse.Namespace) -> int:
 
 
 def cmd_find(args: argparse.Namespace) -> int:
-    repos = find_repos(args.root, args.max_depth, args.include_hidden)
+    use_cache = bool(getattr(args, "cache", False))
+    if args.name and not use_cache:
+        # Drop name mismatches before spawning git to read their origin URLs.
+        paths = [path for path in find_repos(args.root, args.max_depth, args.include_hidden) if args.name in _repo_dir_name(path)]
+        repos = _with_origins(paths, _jobs_from_args(args))
+    else:
+        repos = _scan_repos_with_origins(args.root, args.max_depth, args.include_hidden, use_cache, _jobs_from_args(args))
     records = []
-    for path in repos:
-        name = os.path.basename(path)
-        origin = git.get_origin_url(path)
+    for path, origin in repos:
+        name = _repo_dir_name(path)
         if args.name and args.name not in name:
             continue
         if args.remote and (not origin or args.remote not in origin):
@@ -4248,22 +4562,27 @@ def cmd_find(args: argparse.Namespace) -> int:
 
 
 def cmd_duplicates(args: argparse.Namespace) -> int:
-    repos = find_repos(args.root, args.max_depth, args.include_hidden)
+    repos = _scan_repos_with_origins(
+        args.root, args.max_depth, args.include_hidden, bool(getattr(args, "cache", False)), _jobs_from_args(args)
+    )
     groups: Dict[str, List[str]] = {}
-    for path in repos:
-        origin = git.get_origin_url(path)
+    for path, origin in repos:
         if not origin:
             continue
         groups.setdefault(origin, []).append(path)
 
+    # Only groups that will be emitted are sorted and joined.
+    duplicate_origins = sorted(origin for origin, paths in groups.items() if len(paths) > 1)
+    sort_paths = not bool(getattr(args, "no_sort", False))
     records = []
-    for origin, paths in sorted(groups.items()):
-        if len(paths) < 2:
-            continue
+    for origin in duplicate_origins:
+        paths = groups[origin]
+        if sort_paths:
+            paths.sort()
         records.append(
             {
                 "origin": origin,
-                "paths": " | ".join(sorted(paths)),
+                "paths": " | ".join(paths),
                 "count": str(len(paths)),
             }
         )
@@ -4273,6 +4592,40 @@ def cmd_duplicates(args: argparse.Namespace) -> int:
     return 0
 
 
+def _sync_repo_actions(
+    path: str,
+    actions: List[Tuple[str, List[str]]],
+    dry_run: bool,
+) -> Tuple[List[str], Optional[Dict[str, str]]]:
+    """Run sync actions for one repo; return statuses and failure details, if any."""
+    original_head = _repo_head(path)
+    original_branch = _repo_branch_name(path)
+    statuses: List[str] = []
+    for label, cmd in actions:
+        if dry_run:
+            statuses.append(f"{label}:dry-run")
+            continue
+        result = subprocess.run(
+            ["git", "-C", path, *cmd],
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        ok = result.returncode == 0
+        statuses.append(f"{label}:{'ok' if ok else 'fail'}")
+        if not ok:
+            rollback = _attempt_repo_rollback(path, original_head, original_branch)
+            # Stop applying subsequent actions in this repo after failure.
+            return statuses, {
+                "action": label,
+                "error": "command-failed",
+                "rollback_restored": rollback.get("restored", "no"),
+                "rollback_steps": rollback.get("steps", "none"),
+            }
+    return statuses, None
+
+
 def cmd_sync(args: argparse.Namespace) -> int:
     snapshot_payload, _meta = _build_fleet_snapshot(args, include_remote=False)
     snapshot_rows = [row for row in snapshot_payload.get("repos", []) if isinstance(row, dict)]
@@ -4280,7 +4633,8 @@ def cmd_sync(args: argparse.Namespace) -> int:
     if not (args.fetch or args.pull or args.push):
         args.fetch = True
     if args.fetch:
-        actions.append(("fetch", ["fetch", "--prune"]))
+        fetch_jobs = getattr(args, "fetch_jobs", None)
+        actions.append(("fetch", git.fetch_all_args(fetch_jobs) if fetch_jobs else ["fetch", "--prune"]))
     if args.pull:
         actions.append(("pull", ["pull", "--ff-only"]))
     if args.push:
@@ -4288,63 +4642,50 @@ def cmd_sync(args: argparse.Namespace) -> int:
 
     records = []
     issues: List[Dict[str, str]] = []
-    total_steps = max(1, len(snapshot_rows) * max(1, len(actions)))
+    steps_per_repo = max(1, len(actions))
+    total_steps = max(1, len(snapshot_rows) * steps_per_repo)
     current_step = 0
+    pending: List[Tuple[str, str]] = []
     for snapshot in snapshot_rows:
         path = str(snapshot.get("path") or "")
-        name = str(snapshot.get("repo") or os.path.basename(path))
+        name = str(snapshot.get("repo") or _repo_dir_name(path))
         if args.only_clean and str(snapshot.get("git_operation_in_progress") or "no") == "yes":
-            current_step += max(1, len(actions))
+            current_step += steps_per_repo
             _progress_line(current_step, total_steps, f"sync: skip in-progress {name}")
             records.append({"name": name, "path": path, "result": "skip:in-progress"})
             continue
         if args.only_upstream and str(snapshot.get("upstream_branch") or "-") in {"", "-"}:
-            current_step += max(1, len(actions))
+            current_step += steps_per_repo
             _progress_line(current_step, total_steps, f"sync: skip no-upstream {name}")
             records.append({"name": name, "path": path, "result": "skip:no-upstream"})
             continue
-        original_head = _repo_head(path)
-        original_branch = _repo_branch_name(path)
-        statuses = []
-        for label, cmd in actions:
-            current_step += 1
-            _progress_line(current_step, total_steps, f"sync: {label} {name}")
-            if args.dry_run:
-                statuses.append(f"{label}:dry-run")
-                continue
-            result = subprocess.run(
-                ["git", "-C", path, *cmd],
-                check=False,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                text=True,
-            )
-            ok = result.returncode == 0
-            statuses.append(f"{label}:{'ok' if ok else 'fail'}")
-            if not ok:
-                rollback = _attempt_repo_rollback(path, original_head, original_branch)
-                issues.append(
-                    {
-                        "repo": name,
-                        "path": path,
-                        "action": label,
-                        "error": "command-failed",
-                        "rollback_restored": rollback.get("restored", "no"),
-                        "rollback_steps": rollback.get("steps", "none"),
-                    }
-                )
-                # Stop applying subsequent actions in this repo after failure.
-                break
-        records.append({"name": name, "path": path, "result": " ".join(statuses)})
+        pending.append((name, path))
+
+    if pending:
+        jobs = min(_jobs_from_args(args), len(pending))
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(_sync_repo_actions, path, actions, bool(args.dry_run)): (name, path)
+                for name, path in pending
+            }
+            for future in as_completed(futures):
+                name, path = futures[future]
+                statuses, failure = future.result()
+                current_step += steps_per_repo
+                _progress_line(current_step, total_steps, f"sync: {' '.join(statuses) or 'done'} {name}")
+                if failure is not None:
+                    issues.append({"repo": name, "path": path, **failure})
+                records.append({"name": name, "path": path, "result": " ".join(statuses)})
     _progress_done()
 
+    # Workers finish in any order; sort once so the table and the issue log agree.
     records = _sort_records_by_repo_name(records)
+    issues = _sort_records_by_repo_name(issues)
     columns = ["name", "result", "path"]
     print(render_table(records, columns))
     if issues:
-        issue_rows = _sort_records_by_repo_name(issues)
         print("\nUnsuccessful sync operations:")
-        print(render_table(issue_rows, ["repo", "action", "error", "rollback_restored", "rollback_steps", "path"]))
+        print(render_table(issues, ["repo", "action", "error", "rollback_restored", "rollback_steps", "path"]))
         ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         log_path = os.path.join(args.root, "data", "sync-logs", f"sync-issues-{ts}.json")
         try:
@@ -4367,16 +4708,29 @@ def cmd_sync(args: argparse.Namespace) -> int:
                 "results": records,
             }
             with open(log_path, "w", encoding="utf-8") as handle:
-                json.dump(payload, handle, indent=2)
+                _write_json(handle, payload)
             print(f"\nIssue log: {log_path}")
         except OSError as exc:
             print(f"\nFailed to write sync issue log: {exc}", file=sys.stderr)
     return 0
 
 
+def _write_markdown_table(handle: IO[str], records: List[Dict[str, Any]], columns: List[str]) -> None:
+    handle.write("| " + " | ".join(columns) + " |\n")
+    handle.write("| " + " | ".join(["---"] * len(columns)) + " |\n")
+    # The row template is parsed once per column set; each row is a single format() call.
+    row_template = "| " + " | ".join(["{}"] * len(columns)) + " |\n"
+    handle.writelines(
+        row_template.format(*[record.get(col, "") for col in columns]) for record in records
+    )
+
+
+# Reports are written row by row; a larger buffer turns that into few large writes.
+_REPORT_BUFFER_SIZE = 1 << 16
+
+
 def cmd_report(args: argparse.Namespace) -> int:
-    with open(args.input, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = _read_json(args.input)
     records = payload.get("repos", [])
     if not records:
         print("No records.")
@@ -4385,31 +4739,24 @@ def cmd_report(args: argparse.Namespace) -> int:
     if args.format == "json":
         if args.columns:
             fields = args.columns.split(",")
-            filtered = [{field: record.get(field) for field in fields} for record in records]
+            filtered: Iterable[Dict[str, Any]] = ({field: record.get(field) for field in fields} for record in records)
         else:
             filtered = records
-        output = {"root": payload.get("root"), "repos": filtered}
+        header = {"root": payload.get("root")}
         if args.output:
-            with open(args.output, "w", encoding="utf-8") as handle:
-                json.dump(output, handle, indent=2)
+            with open(args.output, "w", encoding="utf-8", buffering=_REPORT_BUFFER_SIZE) as handle:
+                _dump_json_with_items(handle, header, "repos", filtered)
         else:
-            json.dump(output, sys.stdout, indent=2)
+            _dump_json_with_items(sys.stdout, header, "repos", filtered)
             sys.stdout.write("\n")
         return 0
     if args.format == "md":
         columns = args.columns.split(",") if args.columns else list(records[0].keys())
-        lines = []
-        lines.append("| " + " | ".join(columns) + " |")
-        lines.append("| " + " | ".join(["---"] * len(columns)) + " |")
-        for record in records:
-            row = [str(record.get(col, "")) for col in columns]
-            lines.append("| " + " | ".join(row) + " |")
-        output = "\n".join(lines)
         if args.output:
-            with open(args.output, "w", encoding="utf-8") as handle:
-                handle.write(output + "\n")
+            with open(args.output, "w", encoding="utf-8", buffering=_REPORT_BUFFER_SIZE) as handle:
+                _write_markdown_table(handle, records, columns)
         else:
-            print(output)
+            _write_markdown_table(sys.stdout, records, columns)
         return 0
 
     import csv
@@ -4419,15 +4766,14 @@ def cmd_report(args: argparse.Namespace) -> int:
         output_dir = os.path.dirname(args.output)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
-        handle = open(args.output, "w", encoding="utf-8", newline="")
+        handle = open(args.output, "w", encoding="utf-8", newline="", buffering=_REPORT_BUFFER_SIZE)
         close_handle = True
     else:
         handle = sys.stdout
         close_handle = False
-    writer = csv.DictWriter(handle, fieldnames=fields)
-    writer.writeheader()
-    for record in records:
-        writer.writerow({field: record.get(field, "") for field in fields})
+    writer = csv.writer(handle)
+    writer.writerow(fields)
+    writer.writerows([record.get(field, "") for field in fields] for record in records)
     if close_handle:
         handle.close()
     return 0
@@ -4486,7 +4832,7 @@ def _write_json_secure(path: str, payload: Dict) -> None:
             except OSError:
                 pass
         with os.fdopen(fd, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
+            _write_json(handle, payload)
         os.replace(tmp_path, path)
         try:
             os.chmod(path, 0o600)
@@ -4523,7 +4869,7 @@ def cmd_config_export(args: argparse.Namespace) -> int:
                 file=sys.stderr,
             )
             return 1
-        json.dump(payload, sys.stdout, indent=2)
+        _write_json(sys.stdout, payload)
         print()
         return 0
     output_dir = os.path.dirname(output_path)
@@ -4537,14 +4883,13 @@ def cmd_config_export(args: argparse.Namespace) -> int:
             return 1
     else:
         with open(output_path, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
+            _write_json(handle, payload)
     print(f"Wrote {output_path}")
     return 0
 
 
 def cmd_config_import(args: argparse.Namespace) -> int:
-    with open(args.input, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = _read_json(args.input)
     incoming_servers = _normalize_servers(payload.get("servers", {}))
     incoming_default = payload.get("default_server", "")
     if args.replace:
@@ -4648,25 +4993,24 @@ def cmd_github_list(args: argparse.Namespace) -> int:
         print(str(exc), file=sys.stderr)
         return 1
     repos = _sort_records_by_repo_name(repos)
-    payload = {
+    header = {
         "server": server.get("name", provider),
         "provider": provider,
         "base_url": base_url or forge.DEFAULT_BASE_URLS.get(provider, ""),
         "user": user,
         "selected_orgs": selected_orgs,
         "include_user": include_user,
-        "repos": repos,
     }
     if args.output:
         if args.output == "-":
-            json.dump(payload, sys.stdout, indent=2)
+            _dump_json_with_items(sys.stdout, header, "repos", repos)
             sys.stdout.write("\n")
             return 0
         output_dir = os.path.dirname(args.output)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         with open(args.output, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
+            _dump_json_with_items(handle, header, "repos", repos)
         return 0
     if args.output is None:
         columns = ["name", "private", "default_branch", "ssh_url", "html_url"]
@@ -4690,6 +5034,8 @@ def cmd_todo_issues(args: argparse.Namespace) -> int:
             argv.extend(["--label", label])
         if args.dry_run:
             argv.append("--dry-run")
+        from . import todo_issues
+
         return todo_issues.main(argv)
     finally:
         os.chdir(original_cwd)
@@ -4839,8 +5185,7 @@ def cmd_pr_sweep(args: argparse.Namespace) -> int:
 
 
 def cmd_github_clone(args: argparse.Namespace) -> int:
-    with open(args.input, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = _read_json(args.input)
     if args.server:
         config = lantern_config.load_config()
         server = lantern_config.get_server(config, args.server)
@@ -4886,7 +5231,7 @@ def cmd_github_clone(args: argparse.Namespace) -> int:
             prefer_existing_basename = False
             dest: Optional[str] = None
             if basename and os.path.exists(basename_path) and git.is_git_repo(basename_path):
-                existing_origin = _normalize_repo_url(str(git.get_origin_url(basename_path) or ""))
+                existing_origin = _normalize_repo_url(str(_origin_url(basename_path) or ""))
                 if existing_origin and existing_origin in remote_keys:
                     prefer_existing_basename = True
             if not bool(getattr(args, "flat", False)):
@@ -4898,7 +5243,7 @@ def cmd_github_clone(args: argparse.Namespace) -> int:
                     and os.path.exists(encoded_path)
                     and git.is_git_repo(encoded_path)
                 ):
-                    existing_origin = _normalize_repo_url(str(git.get_origin_url(encoded_path) or ""))
+                    existing_origin = _normalize_repo_url(str(_origin_url(encoded_path) or ""))
                     if (
                         existing_origin
                         and existing_origin in remote_keys
@@ -4963,6 +5308,7 @@ def cmd_github_clone(args: argparse.Namespace) -> int:
         repos = [repo for repo in repos if repo.get("name") in selected_set]
         repos = _sort_records_by_repo_name(repos)
         planned_destinations = _planned_destinations(repos)
+    pending: List[Tuple[str, str]] = []
     for repo in repos:
         name = str(repo.get("name") or "").strip()
         ssh_url = repo.get("ssh_url")
@@ -4983,7 +5329,24 @@ def cmd_github_clone(args: argparse.Namespace) -> int:
         if args.dry_run:
             print(f"[DRY RUN] git clone {ssh_url} {dest}")
             continue
-        subprocess.run(["git", "clone", ssh_url, dest], check=False)
+        pending.append((str(ssh_url), dest))
+    clone_cmd = ["git", "clone", "--quiet"] if getattr(args, "quiet", False) else ["git", "clone"]
+    jobs = min(_jobs_from_args(args), len(pending))
+    if jobs <= 1:
+        for ssh_url, dest in pending:
+            subprocess.run([*clone_cmd, ssh_url, dest], check=False)
+        return 0
+    # Capture each clone's output and replay it per repo so parallel clones do not interleave.
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(
+            lambda pair: subprocess.run([*clone_cmd, *pair], check=False, capture_output=True, text=True),
+            pending,
+        )
+        for result in results:
+            if result.stdout:
+                sys.stdout.write(result.stdout)
+            if result.stderr:
+                sys.stderr.write(result.stderr)
     return 0
 
 
@@ -5009,17 +5372,17 @@ def cmd_github_gists_list(args: argparse.Namespace) -> int:
     except ValueError as exc:
         print(str(exc), file=sys.stderr)
         return 1
-    payload = {"user": user, "gists": gists}
+    header = {"user": user}
     if args.output:
         if args.output == "-":
-            json.dump(payload, sys.stdout, indent=2)
+            _dump_json_with_items(sys.stdout, header, "gists", gists)
             sys.stdout.write("\n")
             return 0
         output_dir = os.path.dirname(args.output)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         with open(args.output, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
+            _dump_json_with_items(handle, header, "gists", gists)
         return 0
     if args.output is None:
         columns = ["id", "description", "public", "files", "updated_at"]
@@ -5027,11 +5390,47 @@ def cmd_github_gists_list(args: argparse.Namespace) -> int:
     return 0
 
 
+_MAX_DOWNLOAD_WORKERS = 16
+
+
+def _write_downloaded_files(
+    downloads: List[Tuple[str, Callable[[], bytes]]],
+    output_dir: str,
+    force: bool,
+) -> int:
+    """Fetch gist/snippet files concurrently, then validate and write them in order.
+
+    Only the HTTP downloads run in worker threads; path checks, the --force check and
+    writes happen here in list order, so the first failing file stops the run just as
+    the serial loop did.
+    """
+    if not downloads:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(_MAX_DOWNLOAD_WORKERS, len(downloads))) as executor:
+        futures = [executor.submit(fetch) for _name, fetch in downloads]
+    for (name, _fetch), future in zip(downloads, futures):
+        try:
+            content = future.result()
+        except ValueError as exc:
+            print(str(exc), file=sys.stderr)
+            return 1
+        dest = _safe_output_path(output_dir, name)
+        if not dest:
+            print(f"Refusing to write file with unsafe path: {name}", file=sys.stderr)
+            return 1
+        if os.path.exists(dest) and not force:
+            print(f"File exists: {dest} (use --force to overwrite)", file=sys.stderr)
+            return 1
+        with open(dest, "wb") as handle:
+            handle.write(content)
+        print(f"Wrote {dest}")
+    return 0
+
+
 def cmd_github_gists_clone(args: argparse.Namespace) -> int:
     gist_id = args.gist_id
     if args.input and os.path.isfile(args.input):
-        with open(args.input, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = _read_json(args.input)
         gists = payload.get("gists", [])
         if gists and not any(gist.get("id") == gist_id for gist in gists):
             print(
@@ -5068,6 +5467,7 @@ def cmd_github_gists_clone(args: argparse.Namespace) -> int:
             print("Gist has multiple files; use --file to select.", file=sys.stderr)
             return 1
 
+    downloads: List[Tuple[str, Callable[[], bytes]]] = []
     for name in names:
         info = files.get(name)
         if not info:
@@ -5077,22 +5477,8 @@ def cmd_github_gists_clone(args: argparse.Namespace) -> int:
         if not raw_url:
             print(f"Missing raw_url for file: {name}", file=sys.stderr)
             return 1
-        try:
-            content = github.download_gist_file(raw_url, token, base_url)
-        except ValueError as exc:
-            print(str(exc), file=sys.stderr)
-            return 1
-        dest = _safe_output_path(output_dir, name)
-        if not dest:
-            print(f"Refusing to write file with unsafe path: {name}", file=sys.stderr)
-            return 1
-        if os.path.exists(dest) and not args.force:
-            print(f"File exists: {dest} (use --force to overwrite)", file=sys.stderr)
-            return 1
-        with open(dest, "wb") as handle:
-            handle.write(content)
-        print(f"Wrote {dest}")
-    return 0
+        downloads.append((name, functools.partial(github.download_gist_file, raw_url, token, base_url)))
+    return _write_downloaded_files(downloads, output_dir, args.force)
 
 
 def cmd_forge_snippets_list(args: argparse.Namespace) -> int:
@@ -5118,23 +5504,22 @@ def cmd_forge_snippets_list(args: argparse.Namespace) -> int:
         print(str(exc), file=sys.stderr)
         return 1
 
-    payload = {
+    header = {
         "server": server.get("name", provider),
         "provider": provider,
         "base_url": base_url or forge.DEFAULT_BASE_URLS.get(provider, ""),
         "user": user,
-        "snippets": snippets,
     }
     if args.output:
         if args.output == "-":
-            json.dump(payload, sys.stdout, indent=2)
+            _dump_json_with_items(sys.stdout, header, "snippets", snippets)
             sys.stdout.write("\n")
             return 0
         output_dir = os.path.dirname(args.output)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         with open(args.output, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
+            _dump_json_with_items(handle, header, "snippets", snippets)
         return 0
     if args.output is None:
         display_rows: List[Dict[str, object]] = []
@@ -5167,8 +5552,7 @@ def cmd_forge_snippets_clone(args: argparse.Namespace) -> int:
     os.makedirs(output_dir, exist_ok=True)
 
     if args.input and os.path.isfile(args.input):
-        with open(args.input, "r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = _read_json(args.input)
         listed = payload.get("snippets", [])
         if listed and not any(item.get("id") == snippet_id for item in listed):
             print(f"Snippet id not found in input list: {snippet_id}", file=sys.stderr)
@@ -5188,6 +5572,7 @@ def cmd_forge_snippets_clone(args: argparse.Namespace) -> int:
             if len(names) > 1:
                 print("Snippet has multiple files; use --file to select.", file=sys.stderr)
                 return 1
+        downloads: List[Tuple[str, Callable[[], bytes]]] = []
         for name in names:
             info = files.get(name)
             if not info:
@@ -5197,22 +5582,8 @@ def cmd_forge_snippets_clone(args: argparse.Namespace) -> int:
             if not raw_url:
                 print(f"Missing raw_url for file: {name}", file=sys.stderr)
                 return 1
-            try:
-                content = github.download_gist_file(raw_url, token, base_url)
-            except ValueError as exc:
-                print(str(exc), file=sys.stderr)
-                return 1
-            dest = _safe_output_path(output_dir, name)
-            if not dest:
-                print(f"Refusing to write file with unsafe path: {name}", file=sys.stderr)
-                return 1
-            if os.path.exists(dest) and not args.force:
-                print(f"File exists: {dest} (use --force to overwrite)", file=sys.stderr)
-                return 1
-            with open(dest, "wb") as handle:
-                handle.write(content)
-            print(f"Wrote {dest}")
-        return 0
+            downloads.append((name, functools.partial(github.download_gist_file, raw_url, token, base_url)))
+        return _write_downloaded_files(downloads, output_dir, args.force)
 
     if provider == "gitlab":
         if not token:
@@ -5239,6 +5610,8 @@ def cmd_forge_snippets_clone(args: argparse.Namespace) -> int:
             if len(names) > 1:
                 print("Snippet has multiple files; use --file to select.", file=sys.stderr)
                 return 1
+        headers = forge.auth_headers("gitlab", user, token, auth)
+        downloads = []
         for name in names:
             match = next(
                 (
@@ -5255,23 +5628,8 @@ def cmd_forge_snippets_clone(args: argparse.Namespace) -> int:
             if not raw_url:
                 print(f"Missing raw_url for file: {name}", file=sys.stderr)
                 return 1
-            headers = forge.auth_headers("gitlab", user, token, auth)
-            try:
-                content = forge.download_with_headers(raw_url, headers, base_url)
-            except ValueError as exc:
-                print(str(exc), file=sys.stderr)
-                return 1
-            dest = _safe_output_path(output_dir, name)
-            if not dest:
-                print(f"Refusing to write file with unsafe path: {name}", file=sys.stderr)
-                return 1
-            if os.path.exists(dest) and not args.force:
-                print(f"File exists: {dest} (use --force to overwrite)", file=sys.stderr)
-                return 1
-            with open(dest, "wb") as handle:
-                handle.write(content)
-            print(f"Wrote {dest}")
-        return 0
+            downloads.append((name, functools.partial(forge.download_with_headers, raw_url, headers, base_url)))
+        return _write_downloaded_files(downloads, output_dir, args.force)
 
     if provider == "bitbucket":
         if not user:
@@ -5288,31 +5646,35 @@ def cmd_forge_snippets_clone(args: argparse.Namespace) -> int:
         names = args.file or file_names
         base_api = (base_url or forge.DEFAULT_BASE_URLS.get(provider, "")).rstrip("/")
         headers = forge.auth_headers("bitbucket", user, token, auth)
+        downloads = []
         for name in names:
             raw_url = (
                 f"{base_api}/snippets/{urllib.parse.quote(user)}"
                 f"/{urllib.parse.quote(str(snippet_id))}/files/{urllib.parse.quote(name)}"
             )
-            try:
-                content = forge.download_with_headers(raw_url, headers, base_url)
-            except ValueError as exc:
-                print(str(exc), file=sys.stderr)
-                return 1
-            dest = _safe_output_path(output_dir, name)
-            if not dest:
-                print(f"Refusing to write file with unsafe path: {name}", file=sys.stderr)
-                return 1
-            if os.path.exists(dest) and not args.force:
-                print(f"File exists: {dest} (use --force to overwrite)", file=sys.stderr)
-                return 1
-            with open(dest, "wb") as handle:
-                handle.write(content)
-            print(f"Wrote {dest}")
-        return 0
+            downloads.append((name, functools.partial(forge.download_with_headers, raw_url, headers, base_url)))
+        return _write_downloaded_files(downloads, output_dir, args.force)
 
     print(f"Unsupported provider: {provider}", file=sys.stderr)
     return 1
 
+
+def _load_file_args(file_args: List[str]) -> Dict[str, str]:
+    """Read ``--file [NAME=]PATH`` arguments into a name -> content mapping."""
+    files: Dict[str, str] = {}
+    for file_arg in file_args:
+        if "=" in file_arg:
+            name, path = file_arg.split("=", 1)
+        else:
+            path = file_arg
+            name = os.path.basename(path)
+        # Binary read + one decode: uploads the file content as-is, without
+        # text-mode newline translation.
+        with open(path, "rb") as handle:
+            files[name] = handle.read().decode("utf-8")
+    return files
+
+
 def cmd_github_gists_update(args: argparse.Namespace) -> int:
     env = github.load_env()
     config = lantern_config.load_config()
@@ -5327,15 +5689,7 @@ def cmd_github_gists_update(args: argparse.Namespace) -> int:
         print("GitHub token is required to update gists.", file=sys.stderr)
         return 1
 
-    files: Dict[str, str] = {}
-    for file_arg in args.file:
-        if "=" in file_arg:
-            name, path = file_arg.split("=", 1)
-        else:
-            path = file_arg
-            name = os.path.basename(path)
-        with open(path, "r", encoding="utf-8") as handle:
-            files[name] = handle.read()
+    files = _load_file_args(args.file)
 
     delete_names = args.delete
 
@@ -5380,15 +5734,7 @@ def cmd_github_gists_create(args: argparse.Namespace) -> int:
         print("GitHub token is required to create gists.", file=sys.stderr)
         return 1
 
-    files: Dict[str, str] = {}
-    for file_arg in args.file:
-        if "=" in file_arg:
-            name, path = file_arg.split("=", 1)
-        else:
-            path = file_arg
-            name = os.path.basename(path)
-        with open(path, "r", encoding="utf-8") as handle:
-            files[name] = handle.read()
+    files = _load_file_args(args.file)
 
     if not files:
         print("At least one --file is required.", file=sys.stderr)
@@ -5405,32 +5751,34 @@ def cmd_github_gists_create(args: argparse.Namespace) -> int:
     return 0
 
 
-def build_parser() -> argparse.ArgumentParser:
-    def add_tui_root_argument(target_parser: argparse.ArgumentParser) -> None:
-        target_parser.add_argument(
-            "--tui-root",
-            dest="tui_root",
-            default="",
-            help="workspace root override for TUI session (stored root is used when omitted)",
-        )
+def _add_tui_root_argument(target_parser: argparse.ArgumentParser) -> None:
+    target_parser.add_argument(
+        "--tui-root",
+        dest="tui_root",
+        default="",
+        help="workspace root override for TUI session (stored root is used when omitted)",
+    )
 
-    parser = argparse.ArgumentParser(prog="lantern")
-    add_tui_root_argument(parser)
-    parser.add_argument(
-        "--tui", "-t",
-        action="store_true",
-        help="Launch interactive TUI mode using dialog",
+
+def _add_jobs_argument(target_parser: argparse.ArgumentParser) -> None:
+    target_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"number of repositories to process concurrently (default: {DEFAULT_JOBS})",
     )
-    sub = parser.add_subparsers(dest="command", required=False)
 
-    tui = sub.add_parser("tui", help="launch interactive TUI mode using dialog")
-    add_tui_root_argument(tui)
+
+def _build_tui_parser(tui: argparse.ArgumentParser) -> None:
+    _add_tui_root_argument(tui)
     tui.set_defaults(func=cmd_tui)
 
-    servers = sub.add_parser("servers", help="list configured git servers")
+
+def _build_servers_parser(servers: argparse.ArgumentParser) -> None:
     servers.set_defaults(func=cmd_servers)
 
-    config = sub.add_parser("config", help="import/export server configuration")
+
+def _build_config_parser(config: argparse.ArgumentParser) -> None:
     config_sub = config.add_subparsers(dest="config_command", required=True)
 
     config_export = config_sub.add_parser("export", help="export server config to JSON")
@@ -5454,13 +5802,21 @@ def build_parser() -> argparse.ArgumentParser:
     config_setup = config_sub.add_parser("setup", help="interactive server configuration (TUI)")
     config_setup.set_defaults(func=cmd_config_setup)
 
-    repos = sub.add_parser("repos", help="list local repos")
+
+def _build_repos_parser(repos: argparse.ArgumentParser) -> None:
     repos.add_argument("--root", default=os.getcwd())
     repos.add_argument("--max-depth", type=int, default=6)
     repos.add_argument("--include-hidden", action="store_true")
+    repos.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse a cached repo list and origin URLs from a previous run (invalidated when root or its subdirectories change)",
+    )
+    _add_jobs_argument(repos)
     repos.set_defaults(func=cmd_repos)
 
-    lazygit = sub.add_parser("lazygit", help="open lazygit for a selected repository")
+
+def _build_lazygit_parser(lazygit: argparse.ArgumentParser) -> None:
     lazygit.add_argument("--root", default=os.getcwd())
     lazygit.add_argument("--max-depth", type=int, default=6)
     lazygit.add_argument("--include-hidden", action="store_true")
@@ -5469,15 +5825,18 @@ def build_parser() -> argparse.ArgumentParser:
     lazygit.add_argument("--select", action="store_true", help="interactive repo selection with dialog")
     lazygit.set_defaults(func=cmd_lazygit)
 
-    scan = sub.add_parser("scan", help="scan for git repos and write JSON")
+
+def _build_scan_parser(scan: argparse.ArgumentParser) -> None:
     scan.add_argument("--root", default=os.getcwd())
     scan.add_argument("--output", default="data/repos.json")
     scan.add_argument("--max-depth", type=int, default=6)
     scan.add_argument("--include-hidden", action="store_true")
     scan.add_argument("--fetch", action="store_true")
+    _add_jobs_argument(scan)
     scan.set_defaults(func=cmd_scan)
 
-    status = sub.add_parser("status", help="scan for git repos and render a table")
+
+def _build_status_parser(status: argparse.ArgumentParser) -> None:
     status.add_argument("--root", default=os.getcwd())
     status.add_argument("--max-depth", type=int, default=6)
     status.add_argument("--include-hidden", action="store_true")
@@ -5487,28 +5846,46 @@ def build_parser() -> argparse.ArgumentParser:
     status.add_argument("--token", default="")
     status.add_argument("--with-prs", action="store_true", help="include latest open PR number per repo (GitHub)")
     status.add_argument("--pr-stale-days", type=int, default=30, help="exclude PRs older than this number of days")
+    _add_jobs_argument(status)
     status.set_defaults(func=cmd_status)
 
-    table = sub.add_parser("table", help="render a table from a JSON scan")
+
+def _build_table_parser(table: argparse.ArgumentParser) -> None:
     table.add_argument("--input", default="data/repos.json")
     table.add_argument("--columns", default="")
     table.set_defaults(func=cmd_table)
 
-    find = sub.add_parser("find", help="find repos by name or remote")
+
+def _build_find_parser(find: argparse.ArgumentParser) -> None:
     find.add_argument("--root", default=os.getcwd())
     find.add_argument("--max-depth", type=int, default=6)
     find.add_argument("--include-hidden", action="store_true")
     find.add_argument("--name", default="")
     find.add_argument("--remote", default="")
+    find.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse a cached repo list and origin URLs from a previous run (invalidated when root or its subdirectories change)",
+    )
+    _add_jobs_argument(find)
     find.set_defaults(func=cmd_find)
 
-    dupes = sub.add_parser("duplicates", help="find repos with the same origin URL")
+
+def _build_duplicates_parser(dupes: argparse.ArgumentParser) -> None:
     dupes.add_argument("--root", default=os.getcwd())
     dupes.add_argument("--max-depth", type=int, default=6)
     dupes.add_argument("--include-hidden", action="store_true")
+    dupes.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse a cached repo list and origin URLs from a previous run (invalidated when root or its subdirectories change)",
+    )
+    _add_jobs_argument(dupes)
+    dupes.add_argument("--no-sort", action="store_true", help="list paths within each group in discovery order")
     dupes.set_defaults(func=cmd_duplicates)
 
-    sync = sub.add_parser("sync", help="fetch/pull/push across repos")
+
+def _build_sync_parser(sync: argparse.ArgumentParser) -> None:
     sync.add_argument("--root", default=os.getcwd())
     sync.add_argument("--max-depth", type=int, default=6)
     sync.add_argument("--include-hidden", action="store_true")
@@ -5518,9 +5895,17 @@ def build_parser() -> argparse.ArgumentParser:
     sync.add_argument("--dry-run", action="store_true")
     sync.add_argument("--only-clean", action="store_true")
     sync.add_argument("--only-upstream", action="store_true")
+    _add_jobs_argument(sync)
+    sync.add_argument(
+        "--fetch-jobs",
+        type=int,
+        default=None,
+        help="fetch all remotes of each repo, N at a time (git fetch --all --jobs=N)",
+    )
     sync.set_defaults(func=cmd_sync)
 
-    fleet = sub.add_parser("fleet", help="unified multi-repo management (plan/apply)")
+
+def _build_fleet_parser(fleet: argparse.ArgumentParser) -> None:
     fleet_sub = fleet.add_subparsers(dest="fleet_command", required=True)
 
     fleet_overview = fleet_sub.add_parser("overview", help="build the primary fleet dashboard view")
@@ -5543,6 +5928,7 @@ def build_parser() -> argparse.ArgumentParser:
         help="use a flat destination layout for missing-local repos under the root directory (see --root); when cloning is performed by other commands, repos are placed directly under root with no namespace",
     )
     fleet_overview.add_argument("--pr-stale-days", type=int, default=30, help="exclude PRs older than this number of days")
+    _add_jobs_argument(fleet_overview)
     fleet_overview.add_argument("--output", default="", help="write the full fleet snapshot to JSON")
     fleet_overview.set_defaults(func=cmd_fleet_overview)
 
@@ -5566,6 +5952,7 @@ def build_parser() -> argparse.ArgumentParser:
         help="use a flat layout (no namespace) for missing-local repos under the root directory (see --root); affects paths in the plan and clone destinations used by 'fleet apply'",
     )
     fleet_plan.add_argument("--pr-stale-days", type=int, default=30, help="exclude PRs older than this number of days")
+    _add_jobs_argument(fleet_plan)
     fleet_plan.set_defaults(func=cmd_fleet_plan)
 
     fleet_apply = fleet_sub.add_parser("apply", help="apply clone/pull/push actions from fleet plan")
@@ -5598,6 +5985,7 @@ def build_parser() -> argparse.ArgumentParser:
     fleet_apply.add_argument("--snapshot", default="", help="reuse a previously generated fleet snapshot JSON")
     fleet_apply.add_argument("--refresh", action="store_true", help="ignore --snapshot and rebuild fleet context before apply")
     fleet_apply.add_argument("--log-json", default="", help="write full fleet apply execution log to JSON")
+    _add_jobs_argument(fleet_apply)
     fleet_apply.set_defaults(func=cmd_fleet_apply)
 
     fleet_dirty = fleet_sub.add_parser("dirty", help="list repositories with tracked local changes")
@@ -5605,6 +5993,7 @@ def build_parser() -> argparse.ArgumentParser:
     fleet_dirty.add_argument("--max-depth", type=int, default=6)
     fleet_dirty.add_argument("--include-hidden", action="store_true")
     fleet_dirty.add_argument("--fetch", action="store_true")
+    _add_jobs_argument(fleet_dirty)
     fleet_dirty.set_defaults(func=cmd_fleet_dirty)
 
     fleet_logs = fleet_sub.add_parser("logs", help="inspect fleet apply JSON logs")
@@ -5616,7 +6005,8 @@ def build_parser() -> argparse.ArgumentParser:
     fleet_logs.add_argument("--no-pretty", action="store_true", help="disable jq pretty JSON output and use tabular summary output")
     fleet_logs.set_defaults(func=cmd_fleet_logs)
 
-    pr = sub.add_parser("pr", help="pull request utilities")
+
+def _build_pr_parser(pr: argparse.ArgumentParser) -> None:
     pr_sub = pr.add_subparsers(dest="pr_command", required=True)
 
     pr_sweep_parser = pr_sub.add_parser(
@@ -5672,14 +6062,16 @@ def build_parser() -> argparse.ArgumentParser:
     )
     pr_sweep_parser.set_defaults(func=cmd_pr_sweep)
 
-    report = sub.add_parser("report", help="export scan results")
+
+def _build_report_parser(report: argparse.ArgumentParser) -> None:
     report.add_argument("--input", default="data/repos.json")
     report.add_argument("--output", default="")
     report.add_argument("--format", choices=["csv", "json", "md"], default="csv")
     report.add_argument("--columns", default="")
     report.set_defaults(func=cmd_report)
 
-    todo = sub.add_parser("todo", help="TODO file workflows")
+
+def _build_todo_parser(todo: argparse.ArgumentParser) -> None:
     todo_sub = todo.add_subparsers(dest="todo_command", required=True)
 
     todo_issues = todo_sub.add_parser("issues", help="create GitHub issues from TODO.txt")
@@ -5691,10 +6083,8 @@ def build_parser() -> argparse.ArgumentParser:
     todo_issues.add_argument("--cwd", default=os.getcwd(), help="Working directory for gh context (default: current dir).")
     todo_issues.set_defaults(func=cmd_todo_issues)
 
-    forge = sub.add_parser("forge", help="git server utilities")
-    forge_sub = forge.add_subparsers(dest="forge_command", required=True)
 
-    gh_list = forge_sub.add_parser("list", help="list repos (table or JSON)")
+def _build_forge_list_parser(gh_list: argparse.ArgumentParser) -> None:
     gh_list.add_argument("--server", default="")
     gh_list.add_argument("--user", default="")
     gh_list.add_argument("--token", default="")
@@ -5709,127 +6099,230 @@ def build_parser() -> argparse.ArgumentParser:
     )
     gh_list.set_defaults(func=cmd_github_list)
 
-    gh_clone = forge_sub.add_parser("clone", help="clone missing repos from JSON list")
+
+def _build_forge_clone_parser(gh_clone: argparse.ArgumentParser) -> None:
     gh_clone.add_argument("--server", default="")
     gh_clone.add_argument("--input", default="data/github.json")
     gh_clone.add_argument("--root", default=os.getcwd())
     gh_clone.add_argument("--dry-run", action="store_true")
     gh_clone.add_argument("--flat", action="store_true", help="clone missing repos into the root directory (see --root) (no namespace)")
     gh_clone.add_argument("--tui", action="store_true")
+    gh_clone.add_argument("--quiet", action="store_true", help="pass --quiet to git clone (errors are still shown)")
+    gh_clone.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"number of repositories to clone concurrently (default: {DEFAULT_JOBS}; 1 keeps git output live)",
+    )
     gh_clone.set_defaults(func=cmd_github_clone)
 
-    gh_gists = forge_sub.add_parser("gists", help="GitHub gists utilities")
-    gh_gists_sub = gh_gists.add_subparsers(dest="gists_command", required=True)
-    gh_gist = forge_sub.add_parser("gist", help="GitHub gists utilities")
-    gh_gist_sub = gh_gist.add_subparsers(dest="gists_command", required=True)
-    gh_snippets = forge_sub.add_parser("snippets", help="GitHub snippets utilities")
-    gh_snippets_sub = gh_snippets.add_subparsers(dest="gists_command", required=True)
-    gh_snippet = forge_sub.add_parser("snippet", help="GitHub snippets utilities")
-    gh_snippet_sub = gh_snippet.add_subparsers(dest="gists_command", required=True)
-
-    gh_gists_list = gh_gists_sub.add_parser("list", help="list gists to JSON")
-    gh_gist_list = gh_gist_sub.add_parser("list", help="list gists to JSON")
-    gh_snippets_list = gh_snippets_sub.add_parser("list", help="list snippets to JSON")
-    gh_snippet_list = gh_snippet_sub.add_parser("list", help="list snippets to JSON")
-    for parser_item in (
-        gh_gists_list,
-        gh_gist_list,
-    ):
-        parser_item.add_argument("--server", default="")
-        parser_item.add_argument("--user", default="")
-        parser_item.add_argument("--token", default="")
-        parser_item.add_argument("--output", default=None)
-        parser_item.set_defaults(func=cmd_github_gists_list)
-    for parser_item in (
-        gh_snippets_list,
-        gh_snippet_list,
-    ):
-        parser_item.add_argument("--server", default="")
-        parser_item.add_argument("--user", default="")
-        parser_item.add_argument("--token", default="")
-        parser_item.add_argument("--output", default=None)
-        parser_item.set_defaults(func=cmd_forge_snippets_list)
-
-    gh_gists_clone = gh_gists_sub.add_parser("clone", help="download gist files")
-    gh_gist_clone = gh_gist_sub.add_parser("clone", help="download gist files")
-    gh_snippets_clone = gh_snippets_sub.add_parser("clone", help="download snippet files")
-    gh_snippet_clone = gh_snippet_sub.add_parser("clone", help="download snippet files")
-    for parser_item in (
-        gh_gists_clone,
-        gh_gist_clone,
-    ):
-        parser_item.add_argument("gist_id", help="gist id from list output")
-        parser_item.add_argument("--server", default="")
-        parser_item.add_argument("--token", default="")
-        parser_item.add_argument("--input", default="data/gists.json")
-        parser_item.add_argument("--output-dir", default=".")
-        parser_item.add_argument("--file", action="append", default=[])
-        parser_item.add_argument("--force", action="store_true")
-        parser_item.set_defaults(func=cmd_github_gists_clone)
-    for parser_item in (
-        gh_snippets_clone,
-        gh_snippet_clone,
-    ):
-        parser_item.add_argument("snippet_id", help="snippet id from list output")
-        parser_item.add_argument("--server", default="")
-        parser_item.add_argument("--user", default="")
-        parser_item.add_argument("--token", default="")
-        parser_item.add_argument("--input", default="data/snippets.json")
-        parser_item.add_argument("--output-dir", default=".")
-        parser_item.add_argument("--file", action="append", default=[])
-        parser_item.add_argument("--force", action="store_true")
-        parser_item.set_defaults(func=cmd_forge_snippets_clone)
-    gh_gists_update = gh_gists_sub.add_parser("update", help="update a gist")
-    gh_gist_update = gh_gist_sub.add_parser("update", help="update a gist")
-    gh_snippets_update = gh_snippets_sub.add_parser("update", help="update a snippet")
-    gh_snippet_update = gh_snippet_sub.add_parser("update", help="update a snippet")
-    for parser_item in (
-        gh_gists_update,
-        gh_gist_update,
-        gh_snippets_update,
-        gh_snippet_update,
-    ):
-        parser_item.add_argument("gist_id")
-        parser_item.add_argument("--server", default="")
-        parser_item.add_argument("--file", action="append", default=[])
-        parser_item.add_argument("--delete", action="append", default=[])
-        parser_item.add_argument("--description", default=None)
-        parser_item.add_argument("--token", default="")
-        parser_item.add_argument("--force", "-f", action="store_true")
-        parser_item.set_defaults(func=cmd_github_gists_update)
-
-    gh_gists_create = gh_gists_sub.add_parser("create", help="create a gist")
-    gh_gist_create = gh_gist_sub.add_parser("create", help="create a gist")
-    gh_snippets_create = gh_snippets_sub.add_parser("create", help="create a snippet")
-    gh_snippet_create = gh_snippet_sub.add_parser("create", help="create a snippet")
-    for parser_item in (
-        gh_gists_create,
-        gh_gist_create,
-        gh_snippets_create,
-        gh_snippet_create,
-    ):
-        parser_item.add_argument("--server", default="")
-        parser_item.add_argument("--file", action="append", default=[])
-        parser_item.add_argument("--description", default=None)
-        vis = parser_item.add_mutually_exclusive_group()
-        vis.add_argument("--public", action="store_true")
-        vis.add_argument("--private", action="store_true")
-        parser_item.add_argument("--token", default="")
-        parser_item.set_defaults(func=cmd_github_gists_create)
+
+def _build_gist_tree(tree: argparse.ArgumentParser, kind: str) -> None:
+    """Populate the ``gists`` (kind="gist") or ``snippets`` (kind="snippet") tree."""
+    tree_sub = tree.add_subparsers(dest="gists_command", required=True)
+
+    list_parser = tree_sub.add_parser("list", help=f"list {kind}s to JSON")
+    list_parser.add_argument("--server", default="")
+    list_parser.add_argument("--user", default="")
+    list_parser.add_argument("--token", default="")
+    list_parser.add_argument("--output", default=None)
+    list_parser.set_defaults(func=cmd_github_gists_list if kind == "gist" else cmd_forge_snippets_list)
+
+    clone_parser = tree_sub.add_parser("clone", help=f"download {kind} files")
+    if kind == "gist":
+        clone_parser.add_argument("gist_id", help="gist id from list output")
+        clone_parser.add_argument("--server", default="")
+        clone_parser.add_argument("--token", default="")
+        clone_parser.add_argument("--input", default="data/gists.json")
+    else:
+        clone_parser.add_argument("snippet_id", help="snippet id from list output")
+        clone_parser.add_argument("--server", default="")
+        clone_parser.add_argument("--user", default="")
+        clone_parser.add_argument("--token", default="")
+        clone_parser.add_argument("--input", default="data/snippets.json")
+    clone_parser.add_argument("--output-dir", default=".")
+    clone_parser.add_argument("--file", action="append", default=[])
+    clone_parser.add_argument("--force", action="store_true")
+    clone_parser.set_defaults(func=cmd_github_gists_clone if kind == "gist" else cmd_forge_snippets_clone)
+
+    update_parser = tree_sub.add_parser("update", help=f"update a {kind}")
+    update_parser.add_argument("gist_id")
+    update_parser.add_argument("--server", default="")
+    update_parser.add_argument("--file", action="append", default=[])
+    update_parser.add_argument("--delete", action="append", default=[])
+    update_parser.add_argument("--description", default=None)
+    update_parser.add_argument("--token", default="")
+    update_parser.add_argument("--force", "-f", action="store_true")
+    update_parser.set_defaults(func=cmd_github_gists_update)
+
+    create_parser = tree_sub.add_parser("create", help=f"create a {kind}")
+    create_parser.add_argument("--server", default="")
+    create_parser.add_argument("--file", action="append", default=[])
+    create_parser.add_argument("--description", default=None)
+    vis = create_parser.add_mutually_exclusive_group()
+    vis.add_argument("--public", action="store_true")
+    vis.add_argument("--private", action="store_true")
+    create_parser.add_argument("--token", default="")
+    create_parser.set_defaults(func=cmd_github_gists_create)
+
+
+# `forge` subcommands: (name, help, builder), built lazily like the top-level ones.
+_FORGE_PARSERS: Tuple[Tuple[str, str, Callable[[argparse.ArgumentParser], None]], ...] = (
+    ("list", "list repos (table or JSON)", _build_forge_list_parser),
+    ("clone", "clone missing repos from JSON list", _build_forge_clone_parser),
+    ("gists", "GitHub gists utilities", functools.partial(_build_gist_tree, kind="gist")),
+    ("snippets", "GitHub snippets utilities", functools.partial(_build_gist_tree, kind="snippet")),
+)
+
+# Singular spellings share one parser with their plural command.
+_FORGE_ALIASES: Dict[str, Tuple[str, ...]] = {"gists": ("gist",), "snippets": ("snippet",)}
+
+
+def _add_lazy_subparsers(
+    subparsers: "argparse._SubParsersAction[argparse.ArgumentParser]",
+    entries: Tuple[Tuple[str, str, Callable[[argparse.ArgumentParser], None]], ...],
+    only: Optional[str] = None,
+    aliases: Optional[Dict[str, Tuple[str, ...]]] = None,
+) -> None:
+    """Register every entry name for help/choices, but populate only ``only`` (or all)."""
+    aliases = aliases or {}
+    for name, help_text, builder in entries:
+        names = aliases.get(name, ())
+        entry_parser = subparsers.add_parser(name, aliases=names, help=help_text)
+        if only is None or only == name or only in names:
+            builder(entry_parser)
 
 
+def _build_forge_parser(forge: argparse.ArgumentParser, only: Optional[str] = None) -> None:
+    forge_sub = forge.add_subparsers(dest="forge_command", required=True)
+    _add_lazy_subparsers(forge_sub, _FORGE_PARSERS, only, _FORGE_ALIASES)
+
+
+# Top-level subcommands in help order: (name, help, builder). Every name is always
+# registered so `lantern --help` lists all of them, but only the invoked command's
+# builder has to run.
+_COMMAND_PARSERS: Tuple[Tuple[str, str, Callable[[argparse.ArgumentParser], None]], ...] = (
+    ("tui", "launch interactive TUI mode using dialog", _build_tui_parser),
+    ("servers", "list configured git servers", _build_servers_parser),
+    ("config", "import/export server configuration", _build_config_parser),
+    ("repos", "list local repos", _build_repos_parser),
+    ("lazygit", "open lazygit for a selected repository", _build_lazygit_parser),
+    ("scan", "scan for git repos and write JSON", _build_scan_parser),
+    ("status", "scan for git repos and render a table", _build_status_parser),
+    ("table", "render a table from a JSON scan", _build_table_parser),
+    ("find", "find repos by name or remote", _build_find_parser),
+    ("duplicates", "find repos with the same origin URL", _build_duplicates_parser),
+    ("sync", "fetch/pull/push across repos", _build_sync_parser),
+    ("fleet", "unified multi-repo management (plan/apply)", _build_fleet_parser),
+    ("pr", "pull request utilities", _build_pr_parser),
+    ("report", "export scan results", _build_report_parser),
+    ("todo", "TODO file workflows", _build_todo_parser),
+    ("forge", "git server utilities", _build_forge_parser),
+)
+
+
+def build_parser(command: Optional[str] = None, subcommand: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser; with ``command`` only that subcommand's arguments are built.
+
+    ``subcommand`` narrows it further for ``forge``, whose gist/snippet trees are large.
+    ``command=""`` registers the command names without building any of them, which
+    is all top-level ``--help`` needs.
+    """
+    parser = argparse.ArgumentParser(prog="lantern")
+    _add_tui_root_argument(parser)
+    parser.add_argument(
+        "--tui", "-t",
+        action="store_true",
+        help="Launch interactive TUI mode using dialog",
+    )
+    sub = parser.add_subparsers(dest="command", required=False)
+    if command == "forge" and subcommand is not None:
+        entries = tuple(
+            (name, help_text, functools.partial(_build_forge_parser, only=subcommand) if name == "forge" else builder)
+            for name, help_text, builder in _COMMAND_PARSERS
+        )
+    else:
+        entries = _COMMAND_PARSERS
+    _add_lazy_subparsers(sub, entries, command)
     return parser
 
 
+def _command_index(argv: List[str]) -> Optional[int]:
+    """Return the index of the top-level command in ``argv``, skipping global options."""
+    idx = 0
+    while idx < len(argv):
+        token = argv[idx]
+        if token == "--tui-root":
+            idx += 2
+            continue
+        if token.startswith("--tui-root=") or token in {"--tui", "-t"}:
+            idx += 1
+            continue
+        if token.startswith("-"):
+            return None
+        return idx
+    return None
+
+
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in ``argv`` when it can be identified without argparse."""
+    idx = _command_index(argv)
+    if idx is None:
+        return None
+    token = argv[idx]
+    return token if any(token == name for name, _help, _builder in _COMMAND_PARSERS) else None
+
+
+def _requested_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the token right after the command when it names a nested subcommand."""
+    idx = _command_index(argv)
+    if idx is None or idx + 1 >= len(argv) or argv[idx + 1].startswith("-"):
+        return None
+    return argv[idx + 1]
+
+
+# Exact argv tuples whose handlers ignore their arguments; main() runs these
+# without building a parser (e.g. `lantern config path` in shell prompts).
+_ARGLESS_COMMANDS: Dict[Tuple[str, ...], Callable[[argparse.Namespace], int]] = {
+    ("config", "path"): cmd_config_path,
+    ("servers",): cmd_servers,
+}
+
+
+def _import_argcomplete() -> Any:
+    try:
+        import argcomplete
+    except ImportError:  # pragma: no cover - optional dependency in some environments
+        return None
+    return argcomplete
+
+
 def main() -> None:
-    load_dotenv()
-    parser = build_parser()
-    if argcomplete:
+    argv = sys.argv[1:]
+    completing = bool(os.environ.get("_ARGCOMPLETE"))
+    command = _requested_command(argv)
+    if command not in _DOTENV_FREE_COMMANDS:
+        load_dotenv()
+    argless_command = _ARGLESS_COMMANDS.get(tuple(argv))
+    if argless_command is not None and not completing:
+        raise SystemExit(argless_command(argparse.Namespace()))
+    # argcomplete is only imported when the shell is asking for completions.
+    argcomplete = _import_argcomplete() if completing else None
+    if argcomplete is not None:
+        # Completion needs to see every subcommand and option.
+        parser = build_parser()
         argcomplete.autocomplete(parser)
+    elif argv in (["-h"], ["--help"]):
+        parser = build_parser("")
+    else:
+        parser = build_parser(command, _requested_subcommand(argv))
     args = parser.parse_args()
 
-    # No subcommand defaults to TUI (same behavior as explicit `lantern tui`).
-    if not args.command:
-        raise SystemExit(cmd_tui(args))
+    try:
+        # No subcommand defaults to TUI (same behavior as explicit `lantern tui`).
+        if not args.command:
+            raise SystemExit(cmd_tui(args))
 
-    raise SystemExit(args.func(args))
+        raise SystemExit(args.func(args))
+    finally:
+        http_pool.close()
@@ -1,32 +1,58 @@
+import functools
 import json
 import os
-from typing import Dict, List
+import stat
+from typing import Dict, List, Tuple
 
 
-DEFAULT_CONFIG_PATH = os.path.expanduser("~/.config/git-lantern/config.json")
-ALT_USER_CONFIG_PATH = os.path.expanduser("~/.git-lantern/config.json")
+# Resolve the home directory once (expanduser may consult the passwd database).
+_HOME = os.path.expanduser("~")
+DEFAULT_CONFIG_PATH = os.path.join(_HOME, ".config", "git-lantern", "config.json")
+ALT_USER_CONFIG_PATH = os.path.join(_HOME, ".git-lantern", "config.json")
 SYSTEM_CONFIG_PATHS = (
     "/etc/git-lantern/config.json",
     "/usr/local/etc/git-lantern/config.json",
 )
+# Search order used when GIT_LANTERN_CONFIG is not set.
+_CANDIDATE_CONFIG_PATHS = (ALT_USER_CONFIG_PATH, DEFAULT_CONFIG_PATH, *SYSTEM_CONFIG_PATHS)
 
 
 def config_path() -> str:
     override = os.environ.get("GIT_LANTERN_CONFIG", "")
     if override:
         return os.path.expanduser(override)
-    for path in (ALT_USER_CONFIG_PATH, DEFAULT_CONFIG_PATH, *SYSTEM_CONFIG_PATHS):
-        if os.path.isfile(path):
-            return path
-    return DEFAULT_CONFIG_PATH
+    return _discover_config_path()
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_config_path() -> str:
+    # Probed once per process. The GIT_LANTERN_CONFIG override is checked on
+    # every call instead because .env may set it after import. Writers use the
+    # returned path, so a config created later in the run is still found here.
+    return next((path for path in _CANDIDATE_CONFIG_PATHS if os.path.isfile(path)), DEFAULT_CONFIG_PATH)
+
+
+# path -> ((inode, mtime_ns, size), text) of the last config file read.
+_config_text_cache: Dict[str, Tuple[Tuple[int, int, int], str]] = {}
 
 
 def load_config() -> Dict:
     path = config_path()
-    if not os.path.isfile(path):
+    try:
+        info = os.stat(path)
+    except OSError:
         return {}
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    if not stat.S_ISREG(info.st_mode):
+        return {}
+    signature = (info.st_ino, info.st_mtime_ns, info.st_size)
+    cached = _config_text_cache.get(path)
+    if cached is None or cached[0] != signature:
+        with open(path, "r", encoding="utf-8") as handle:
+            cached = (signature, handle.read())
+        _config_text_cache[path] = cached
+    # Parse on every call so callers can mutate the returned dict without
+    # affecting later loads; a rewritten file changes the signature.
+    return json.loads(cached[1])
 
 
 def get_server_name(config: Dict, name: str = "") -> str:
@@ -38,30 +64,39 @@ def get_server_name(config: Dict, name: str = "") -> str:
     return config.get("default_server", "") or "github.com"
 
 
+def _configured_servers(config: Dict) -> Dict:
+    servers = config.get("servers")
+    return servers if isinstance(servers, dict) else {}
+
+
+def _normalize_server(name: str, server: Dict) -> Dict[str, str]:
+    """Resolve the provider/user/token fields shared by get_server and list_servers."""
+    return {
+        "provider": server.get("provider") or _infer_provider(name),
+        "user": server.get("user") or server.get("USER") or "",
+        "token": server.get("token") or server.get("TOKEN") or "",
+    }
+
+
 def get_server(config: Dict, name: str = "") -> Dict:
     server_name = get_server_name(config, name)
-    servers = config.get("servers", {}) if isinstance(config.get("servers"), dict) else {}
-    server = servers.get(server_name, {}) if server_name else {}
-    provider = server.get("provider") or _infer_provider(server_name)
-    user = server.get("user") or server.get("USER") or ""
-    token = server.get("token") or server.get("TOKEN") or ""
-    merged = {"name": server_name or provider, "provider": provider, "user": user, "token": token}
+    server = _configured_servers(config).get(server_name, {}) if server_name else {}
+    normalized = _normalize_server(server_name, server)
+    merged = {"name": server_name or normalized["provider"], **normalized}
     merged.update(server)
     return merged
 
 
 def list_servers(config: Dict) -> List[Dict]:
-    servers = config.get("servers", {}) if isinstance(config.get("servers"), dict) else {}
     output = []
-    for name, server in servers.items():
-        provider = server.get("provider") or _infer_provider(name)
-        user = server.get("user") or server.get("USER") or ""
+    for name, server in _configured_servers(config).items():
+        normalized = _normalize_server(name, server)
         output.append(
             {
                 "name": name,
-                "provider": provider,
+                "provider": normalized["provider"],
                 "base_url": server.get("base_url", ""),
-                "user": user,
+                "user": normalized["user"],
             }
         )
     return output
@@ -80,39 +115,35 @@ def get_server_organizations(server: Dict) -> List[Dict[str, str]]:
     if raw is None:
         raw = server.get("orgs")
 
-    normalized: List[Dict[str, str]] = []
-    seen = set()
+    if isinstance(raw, list):
+        pairs = (
+            (entry, "")
+            if isinstance(entry, str)
+            else (entry.get("name") or entry.get("org") or entry.get("organization"), entry.get("token"))
+            for entry in raw
+            if isinstance(entry, (str, dict))
+        )
+    elif isinstance(raw, dict):
+        pairs = (
+            (value.get("name") or key, value.get("token"))
+            if isinstance(value, dict)
+            else (key, value if isinstance(value, str) else "")
+            for key, value in raw.items()
+        )
+    else:
+        return []
 
-    def _append(name: str, token: str = "") -> None:
+    # Keyed by lower-cased name: the first spelling wins and order is preserved.
+    normalized: Dict[str, Dict[str, str]] = {}
+    for name, token in pairs:
         org = str(name or "").strip()
         key = org.lower()
-        if not org or key in seen:
-            return
-        seen.add(key)
-        normalized.append({"name": org, "token": str(token or "").strip()})
-
-    if isinstance(raw, list):
-        for entry in raw:
-            if isinstance(entry, str):
-                _append(entry)
-                continue
-            if isinstance(entry, dict):
-                _append(entry.get("name") or entry.get("org") or entry.get("organization") or "", entry.get("token") or "")
-        return normalized
-
-    if isinstance(raw, dict):
-        for key, value in raw.items():
-            if isinstance(value, dict):
-                _append(value.get("name") or key, value.get("token") or "")
-            elif isinstance(value, str):
-                _append(key, value)
-            else:
-                _append(key, "")
-        return normalized
-
-    return normalized
+        if org and key not in normalized:
+            normalized[key] = {"name": org, "token": str(token or "").strip()}
+    return list(normalized.values())
 
 
+@functools.lru_cache(maxsize=32)
 def _infer_provider(name: str) -> str:
     if not name:
         return "github"
@@ -1,23 +1,22 @@
 import base64
-import json
+import functools
 import urllib.parse
-import urllib.request
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 
-from . import github
+from . import github, http_pool
 
 DEFAULT_BASE_URLS = {
     "github": "https://api.github.com",
     "gitlab": "https://gitlab.com/api/v4",
     "bitbucket": "https://api.bitbucket.org/2.0",
 }
+_DEFAULT_TRUSTED_HOSTS = frozenset(urllib.parse.urlparse(base).netloc for base in DEFAULT_BASE_URLS.values())
 
 
-def _request(url: str, headers: Dict[str, str]) -> Tuple[object, Dict[str, str]]:
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req, timeout=20) as resp:
-        data = resp.read().decode("utf-8")
-        return json.loads(data), dict(resp.headers)
+def _request(url: str, headers: Dict[str, str]) -> Tuple[object, Mapping[str, str]]:
+    # The header message is case-insensitive; returned as-is rather than copied.
+    data, response_headers = http_pool.request("GET", url, headers, cache=True)
+    return http_pool.decode_json(data), response_headers
 
 
 def auth_headers(
@@ -73,11 +72,10 @@ def fetch_repos(
             organizations=organizations,
             include_user=include_user,
         )
-    if provider == "gitlab":
-        return _fetch_gitlab_repos(user, token, include_forks, base_url, auth)
-    if provider == "bitbucket":
-        return _fetch_bitbucket_repos(user, token, include_forks, base_url, auth)
-    raise ValueError(f"Unsupported provider: {provider}")
+    fetcher = _REPO_FETCHERS.get(provider)
+    if fetcher is None:
+        raise ValueError(f"Unsupported provider: {provider}")
+    return fetcher(user, token, include_forks, base_url, auth)
 
 
 def fetch_snippets(
@@ -90,11 +88,10 @@ def fetch_snippets(
     provider = (provider or "github").lower()
     if provider == "github":
         return github.fetch_gists(user, token, base_url)
-    if provider == "gitlab":
-        return _fetch_gitlab_snippets(user, token, base_url, auth)
-    if provider == "bitbucket":
-        return _fetch_bitbucket_snippets(user, token, base_url, auth)
-    raise ValueError(f"Unsupported provider: {provider}")
+    fetcher = _SNIPPET_FETCHERS.get(provider)
+    if fetcher is None:
+        raise ValueError(f"Unsupported provider: {provider}")
+    return fetcher(user, token, base_url, auth)
 
 
 def _fetch_gitlab_repos(
@@ -107,7 +104,6 @@ def _fetch_gitlab_repos(
     if not user and not token:
         raise ValueError("User is required without a token.")
     per_page = 100
-    page = 1
     repos: List[Dict] = []
     base_url = _base_url("gitlab", base_url).rstrip("/")
     headers = auth_headers("gitlab", user, token, auth)
@@ -119,13 +115,13 @@ def _fetch_gitlab_repos(
         url_base = f"{base_url}/users/{urllib.parse.quote(user or '')}/projects"
         base_params = {"per_page": str(per_page)}
 
-    while True:
-        params = dict(base_params)
-        params["page"] = str(page)
-        url = f"{url_base}?{urllib.parse.urlencode(params)}"
-        data, _headers = _request(url, headers)
-        if not data:
-            break
+    query = urllib.parse.urlencode(base_params)
+
+    def _fetch_page(page: int) -> Tuple[List[Dict], Mapping[str, str]]:
+        data, response_headers = _request(f"{url_base}?{query}&page={page}", headers)
+        return data or [], response_headers
+
+    for data in github.iter_pages(_fetch_page, _gitlab_total_pages, per_page):
         for repo in data:
             if not include_forks and repo.get("forked_from_project"):
                 continue
@@ -139,10 +135,15 @@ def _fetch_gitlab_repos(
                     "html_url": repo.get("web_url"),
                 }
             )
-        page += 1
     return repos
 
 
+def _gitlab_total_pages(headers: Mapping[str, str]) -> int:
+    # GitLab omits X-Total-Pages for very large collections; 0 keeps paging serially.
+    value = (headers.get("X-Total-Pages") or "").strip()
+    return int(value) if value.isdigit() else 0
+
+
 def _fetch_bitbucket_repos(
     user: Optional[str],
     token: Optional[str],
@@ -185,6 +186,10 @@ def _fetch_bitbucket_repos(
     return repos
 
 
+# Non-GitHub providers; GitHub goes through github.fetch_repos with its own checks.
+_REPO_FETCHERS = {"gitlab": _fetch_gitlab_repos, "bitbucket": _fetch_bitbucket_repos}
+
+
 def _fetch_gitlab_snippets(
     user: Optional[str],
     token: Optional[str],
@@ -194,17 +199,17 @@ def _fetch_gitlab_snippets(
     if not token:
         raise ValueError("Token is required for GitLab snippets.")
     per_page = 100
-    page = 1
     snippets: List[Dict] = []
     base_url = _base_url("gitlab", base_url).rstrip("/")
     headers = auth_headers("gitlab", user, token, auth)
 
-    while True:
-        params = {"per_page": str(per_page), "page": str(page)}
-        url = f"{base_url}/snippets?{urllib.parse.urlencode(params)}"
-        data, _headers = _request(url, headers)
-        if not data:
-            break
+    query = urllib.parse.urlencode({"per_page": str(per_page)})
+
+    def _fetch_page(page: int) -> Tuple[List[Dict], Mapping[str, str]]:
+        data, response_headers = _request(f"{base_url}/snippets?{query}&page={page}", headers)
+        return data or [], response_headers
+
+    for data in github.iter_pages(_fetch_page, _gitlab_total_pages, per_page):
         for snippet in data:
             file_name = snippet.get("file_name") or ""
             files = [file_name] if file_name else []
@@ -221,7 +226,6 @@ def _fetch_gitlab_snippets(
                     "created_at": snippet.get("created_at") or "",
                 }
             )
-        page += 1
     return snippets
 
 
@@ -261,6 +265,9 @@ def _fetch_bitbucket_snippets(
     return snippets
 
 
+_SNIPPET_FETCHERS = {"gitlab": _fetch_gitlab_snippets, "bitbucket": _fetch_bitbucket_snippets}
+
+
 def get_gitlab_snippet(
     snippet_id: str,
     token: str,
@@ -288,13 +295,13 @@ def get_bitbucket_snippet(
     return data if isinstance(data, dict) else {}
 
 
-def _trusted_hosts_for(base_url: str) -> set:
-    trusted = {urllib.parse.urlparse(base).netloc for base in DEFAULT_BASE_URLS.values()}
+@functools.lru_cache(maxsize=16)
+def _trusted_hosts_for(base_url: str) -> FrozenSet[str]:
     if base_url:
         parsed = urllib.parse.urlparse(base_url)
         if parsed.netloc:
-            trusted.add(parsed.netloc)
-    return trusted
+            return _DEFAULT_TRUSTED_HOSTS | {parsed.netloc}
+    return _DEFAULT_TRUSTED_HOSTS
 
 
 def download_with_headers(url: str, headers: Dict[str, str], base_url: str = "") -> bytes:
@@ -304,6 +311,5 @@ def download_with_headers(url: str, headers: Dict[str, str], base_url: str = "")
         raise ValueError(f"Refusing to download non-HTTPS URL: {url!r}")
     if not parsed.netloc or parsed.netloc not in trusted_hosts:
         raise ValueError(f"Refusing to download from untrusted host: {parsed.netloc}")
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req, timeout=20) as resp:
-        return resp.read()
+    data, _headers = http_pool.request("GET", url, headers)
+    return data
@@ -1,9 +1,10 @@
 """Minimal HTTP client for the forge-mind portfolio API."""
 
-import json
 import urllib.request
 from typing import Set
 
+from .http_pool import decode_json
+
 
 def fetch_frozen_repos(forge_url: str, timeout: int = 10) -> Set[str]:
     """Return the set of frozen repo full_names from forge-mind's fleet status endpoint.
@@ -15,7 +16,7 @@ def fetch_frozen_repos(forge_url: str, timeout: int = 10) -> Set[str]:
     url = f"{forge_url.rstrip('/')}/api/v1/fleet/status"
     req = urllib.request.Request(url)
     with urllib.request.urlopen(req, timeout=timeout) as resp:
-        data = json.loads(resp.read().decode("utf-8"))
+        data = decode_json(resp.read())
 
     frozen: Set[str] = set()
     if isinstance(data, list):
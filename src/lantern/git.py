@@ -1,3 +1,4 @@
+import functools
 import os
 import subprocess
 from typing import Dict, Optional, Tuple, TypedDict
@@ -15,6 +16,20 @@ class RepoStatus(TypedDict):
     default_refs: Optional[str]
 
 
+# Files and directories git leaves in the git dir while an operation is in progress.
+_IN_PROGRESS_MARKERS = frozenset(
+    (
+        "MERGE_HEAD",
+        "REBASE_HEAD",
+        "CHERRY_PICK_HEAD",
+        "REVERT_HEAD",
+        "BISECT_LOG",
+        "rebase-merge",
+        "rebase-apply",
+    )
+)
+
+
 def run_git(repo_path: str, args: list) -> str:
     result = subprocess.run(
         ["git", "-C", repo_path, *args],
@@ -30,6 +45,37 @@ def is_git_repo(path: str) -> bool:
     return os.path.isdir(os.path.join(path, ".git"))
 
 
+@functools.lru_cache(maxsize=1)
+def version() -> Tuple[int, ...]:
+    """Return the installed git version as an int tuple (``()`` when unknown)."""
+    result = subprocess.run(
+        ["git", "--version"],
+        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    # "git version 2.43.0" / "git version 2.39.3 (Apple Git-146)"
+    words = result.stdout.split()
+    if len(words) < 3:
+        return ()
+    parts = []
+    for piece in words[2].split("."):
+        if not piece.isdigit():
+            break
+        parts.append(int(piece))
+    return tuple(parts)
+
+
+def fetch_all_args(jobs: int) -> list:
+    """Return ``git fetch`` arguments that prune and fetch every remote, in parallel when supported."""
+    args = ["fetch", "--prune", "--all"]
+    # Parallel fetching of multiple remotes arrived in git 2.24.
+    if jobs > 1 and version() >= (2, 24):
+        args.append(f"--jobs={jobs}")
+    return args
+
+
 def fetch(repo_path: str) -> None:
     subprocess.run(
         ["git", "-C", repo_path, "fetch", "--prune"],
@@ -54,34 +100,84 @@ def get_upstream(repo_path: str) -> Optional[str]:
     return upstream or None
 
 
+def _parse_track(track: str) -> Tuple[int, int]:
+    ahead = behind = 0
+    for part in track.split(","):
+        words = part.split()
+        if len(words) == 2 and words[1].isdigit():
+            if words[0] == "ahead":
+                ahead = int(words[1])
+            elif words[0] == "behind":
+                behind = int(words[1])
+    return ahead, behind
+
+
+def get_branch_tracking(repo_path: str) -> Tuple[Optional[str], Optional[str], Optional[Tuple[int, int]]]:
+    """Return ``(branch, upstream, (ahead, behind))`` for HEAD from one ``for-each-ref`` call.
+
+    Detached or unborn HEADs yield ``(None, None, None)``; a branch whose upstream is
+    missing or gone yields ``(branch, None, None)``.
+    """
+    output = run_git(
+        repo_path,
+        [
+            "for-each-ref",
+            "--points-at=HEAD",
+            "--format=%(HEAD)%00%(refname:short)%00%(upstream:short)%00%(upstream:track,nobracket)",
+            "refs/heads",
+        ],
+    )
+    for line in output.splitlines():
+        fields = line.split("\0")
+        if len(fields) != 4 or fields[0].strip() != "*":
+            continue
+        branch, upstream, track = fields[1], fields[2], fields[3]
+        if not upstream or track == "gone":
+            return branch or None, None, None
+        return branch or None, upstream, _parse_track(track)
+    return None, None, None
+
+
+def resolve_git_dir(repo_path: str) -> Optional[str]:
+    """Return the repository's git directory, reading ``.git`` directly when possible.
+
+    A ``.git`` directory or a ``gitdir:`` file (worktrees, submodules) is resolved
+    without starting ``git``; anything else falls back to ``git rev-parse --git-dir``.
+    """
+    dot_git = os.path.join(repo_path, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    try:
+        with open(dot_git, encoding="utf-8") as handle:
+            first_line = handle.readline().strip()
+    except (OSError, UnicodeDecodeError):
+        first_line = ""
+    if first_line.startswith("gitdir:"):
+        resolved = first_line[len("gitdir:"):].strip()
+    else:
+        resolved = subprocess.run(
+            ["git", "-C", repo_path, "rev-parse", "--git-dir"],
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).stdout.strip()
+    if not resolved:
+        return None
+    return resolved if os.path.isabs(resolved) else os.path.join(repo_path, resolved)
+
+
 def has_in_progress_operation(repo_path: str) -> bool:
-    resolved_git_dir = subprocess.run(
-        ["git", "-C", repo_path, "rev-parse", "--git-dir"],
-        check=False,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.DEVNULL,
-        text=True,
-    ).stdout.strip()
-    if not resolved_git_dir:
+    git_dir = resolve_git_dir(repo_path)
+    if not git_dir:
         return False
-    git_dir = resolved_git_dir if os.path.isabs(resolved_git_dir) else os.path.join(repo_path, resolved_git_dir)
-    if not os.path.isdir(git_dir):
+    # One directory listing instead of a stat per marker.
+    try:
+        with os.scandir(git_dir) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
         return False
-    markers = (
-        "MERGE_HEAD",
-        "REBASE_HEAD",
-        "CHERRY_PICK_HEAD",
-        "REVERT_HEAD",
-        "BISECT_LOG",
-    )
-    for marker in markers:
-        if os.path.exists(os.path.join(git_dir, marker)):
-            return True
-    if os.path.isdir(os.path.join(git_dir, "rebase-merge")):
-        return True
-    if os.path.isdir(os.path.join(git_dir, "rebase-apply")):
-        return True
-    return False
+    return not _IN_PROGRESS_MARKERS.isdisjoint(names)
 
 
 def is_operation_free(repo_path: str) -> bool:
@@ -166,7 +262,10 @@ def get_origin_url(repo_path: str) -> Optional[str]:
 
 
 def get_default_branch_ref(repo_path: str) -> Optional[str]:
-    refs = get_default_branch_refs(repo_path)
+    return _preferred_default_ref(get_default_branch_refs(repo_path))
+
+
+def _preferred_default_ref(refs: Dict[str, str]) -> Optional[str]:
     if "origin" in refs:
         return refs["origin"]
     for ref in refs.values():
@@ -174,49 +273,61 @@ def get_default_branch_ref(repo_path: str) -> Optional[str]:
     return None
 
 
-def get_default_branch_refs(repo_path: str) -> Dict[str, str]:
+def get_remote_refs(repo_path: str) -> Dict[str, str]:
+    """Map each ``refs/remotes/...`` ref to its symbolic target (``""`` for plain refs) in one call."""
+    output = run_git(repo_path, ["for-each-ref", "--format=%(refname)%00%(symref:short)", "refs/remotes"])
+    refs: Dict[str, str] = {}
+    for line in output.splitlines():
+        name, sep, target = line.partition("\0")
+        if sep:
+            refs[name] = target
+    return refs
+
+
+def get_default_branch_refs(repo_path: str, remote_refs: Optional[Dict[str, str]] = None) -> Dict[str, str]:
     remotes_raw = run_git(repo_path, ["remote"])
     remotes = [r.strip() for r in remotes_raw.splitlines() if r.strip()]
     refs: Dict[str, str] = {}
+    if not remotes:
+        return refs
+    if remote_refs is None:
+        remote_refs = get_remote_refs(repo_path)
 
     for remote in remotes:
-        head_ref = run_git(
-            repo_path,
-            ["symbolic-ref", "-q", "--short", f"refs/remotes/{remote}/HEAD"],
-        )
+        head_ref = remote_refs.get(f"refs/remotes/{remote}/HEAD")
         if head_ref:
             refs[remote] = head_ref
             continue
-        for candidate in (f"{remote}/main", f"{remote}/master"):
-            ref = run_git(repo_path, ["rev-parse", "--verify", candidate])
-            if ref:
-                refs[remote] = candidate
+        for branch in ("main", "master"):
+            if f"refs/remotes/{remote}/{branch}" in remote_refs:
+                refs[remote] = f"{remote}/{branch}"
                 break
     return refs
 
 
 def repo_status(repo_path: str) -> RepoStatus:
-    branch = get_branch(repo_path)
-    upstream = get_upstream(repo_path)
+    branch, upstream, tracking = get_branch_tracking(repo_path)
+    # One for-each-ref answers both the origin/<branch> probe and the default-branch lookup.
+    remote_refs = get_remote_refs(repo_path)
     upstream_ahead = None
     upstream_behind = None
     upstream_inferred = False
-    if upstream:
-        ahead, behind = count_ahead_behind(repo_path, "HEAD", upstream)
+    if upstream and tracking is not None:
+        ahead, behind = tracking
         upstream_ahead = str(ahead)
         upstream_behind = str(behind)
     elif branch:
         # No tracking branch — fall back to origin/<branch> if it exists so
         # repos without @{u} still show as behind-remote after a fetch.
-        candidate = f"origin/{branch}"
-        if run_git(repo_path, ["rev-parse", "--verify", candidate]):
-            ahead, behind = count_ahead_behind(repo_path, "HEAD", candidate)
+        if f"refs/remotes/origin/{branch}" in remote_refs:
+            ahead, behind = count_ahead_behind(repo_path, "HEAD", f"origin/{branch}")
             upstream_ahead = str(ahead)
             upstream_behind = str(behind)
             upstream_inferred = True
 
-    default_refs = get_default_branch_refs(repo_path)
-    main_ref = get_default_branch_ref(repo_path)
+    # Resolve remote default branches once; main_ref is picked from the same map.
+    default_refs = get_default_branch_refs(repo_path, remote_refs)
+    main_ref = _preferred_default_ref(default_refs)
     main_ahead = None
     main_behind = None
     if main_ref:
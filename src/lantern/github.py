@@ -1,40 +1,107 @@
-import json
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import os
 from datetime import datetime, timezone, timedelta
 import re
 import subprocess
 import shutil
+import string
 import urllib.error
 import urllib.parse
-import urllib.request
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
 
+from . import http_pool
 
-def _request(url: str, token: Optional[str]) -> Any:
-    req = urllib.request.Request(url)
-    if token:
-        req.add_header("Authorization", f"token {token}")
-    with urllib.request.urlopen(req, timeout=20) as resp:
-        data = resp.read().decode("utf-8")
-    return json.loads(data)
-
-
-def _is_trusted_github_host(host: str, base_url: Optional[str]) -> bool:
-    host = host.lower()
-    if ":" in host:
-        host = host.split(":", 1)[0]
-    trusted_hosts = {
+# Pages after the first are fetched concurrently once the Link header says how many there are.
+_MAX_PAGE_WORKERS = 8
+# User and organization listings fetched at once; each also fans out its pages.
+_MAX_ENDPOINT_WORKERS = 4
+_LINK_LAST_RE = re.compile(r'<([^>]*)>\s*;\s*rel="last"')
+_GITHUB_HOSTS = frozenset(
+    (
         "github.com",
         "api.github.com",
         "gist.github.com",
         "raw.githubusercontent.com",
         "gist.githubusercontent.com",
-    }
+    )
+)
+# Deletes every allowed repo-name character; whatever survives is disallowed.
+_STRIP_SAFE_CHARS = str.maketrans("", "", string.ascii_letters + string.digits + "._/-")
+
+
+def _request(url: str, token: Optional[str]) -> Any:
+    data, _headers = _request_with_headers(url, token)
+    return data
+
+
+def _request_with_headers(url: str, token: Optional[str]) -> Tuple[Any, Mapping[str, str]]:
+    headers = {"Authorization": f"token {token}"} if token else {}
+    data, response_headers = http_pool.request("GET", url, headers, cache=True)
+    return http_pool.decode_json(data), response_headers
+
+
+def _last_page(link_header: Optional[str]) -> int:
+    """Return the ``rel="last"`` page number from a GitHub ``Link`` header, or 0."""
+    match = _LINK_LAST_RE.search(link_header or "")
+    if not match:
+        return 0
+    page = urllib.parse.parse_qs(urllib.parse.urlsplit(match.group(1)).query).get("page") or [""]
+    return int(page[0]) if page[0].isdigit() else 0
+
+
+def _last_page_of(headers: Mapping[str, str]) -> int:
+    return _last_page(headers.get("Link"))
+
+
+def iter_pages(
+    fetch_page: Callable[[int], Tuple[List[Any], Mapping[str, str]]],
+    last_page_of: Callable[[Mapping[str, str]], int],
+    per_page: int,
+) -> Iterator[List[Any]]:
+    """Yield the items of each page in order until an empty or short page.
+
+    ``fetch_page(n)`` returns ``(items, headers)``. When the first response tells
+    ``last_page_of`` how many pages exist, the rest are fetched concurrently;
+    otherwise (and after a full last page, in case items were added meanwhile)
+    pages are fetched one at a time. A page with fewer than ``per_page`` items
+    is the last one, so no request is spent on an empty page after it.
+    """
+    items, headers = fetch_page(1)
+    if not items:
+        return
+    yield items
+    page = 2
+    last_page = last_page_of(headers)
+    if last_page >= page:
+        pages = range(page, last_page + 1)
+        with ThreadPoolExecutor(max_workers=min(_MAX_PAGE_WORKERS, len(pages))) as executor:
+            # map() yields in page order, so callers see the serial ordering.
+            for items, _headers in executor.map(fetch_page, pages):
+                yield items
+        page = last_page + 1
+    while len(items) >= per_page:
+        items, _headers = fetch_page(page)
+        if not items:
+            return
+        yield items
+        page += 1
+
+
+@functools.lru_cache(maxsize=16)
+def _trusted_github_hosts(base_url: Optional[str]) -> FrozenSet[str]:
     if base_url:
         parsed = urllib.parse.urlparse(base_url)
         if parsed.hostname:
-            trusted_hosts.add(parsed.hostname.lower())
-    return host in trusted_hosts
+            return _GITHUB_HOSTS | {parsed.hostname.lower()}
+    return _GITHUB_HOSTS
+
+
+def _is_trusted_github_host(host: str, base_url: Optional[str]) -> bool:
+    host = host.lower()
+    if ":" in host:
+        host = host.split(":", 1)[0]
+    return host in _trusted_github_hosts(base_url)
 
 
 def download_gist_file(raw_url: str, token: Optional[str], base_url: Optional[str] = None) -> bytes:
@@ -43,11 +110,9 @@ def download_gist_file(raw_url: str, token: Optional[str], base_url: Optional[st
         raise ValueError(f"Refusing to download non-HTTPS URL: {raw_url}")
     if not parsed.netloc or not _is_trusted_github_host(parsed.netloc, base_url):
         raise ValueError(f"Refusing to download from untrusted host: {parsed.netloc}")
-    req = urllib.request.Request(raw_url)
-    if token:
-        req.add_header("Authorization", f"token {token}")
-    with urllib.request.urlopen(req, timeout=20) as resp:
-        return resp.read()
+    headers = {"Authorization": f"token {token}"} if token else {}
+    data, _headers = http_pool.request("GET", raw_url, headers)
+    return data
 
 
 def _base_url(base_url: Optional[str]) -> str:
@@ -60,7 +125,7 @@ def _is_safe_repo_component(value: str) -> bool:
         return False
     # Allow namespaced identifiers like "group/subgroup/project" while
     # rejecting traversal/special components.
-    if re.search(r"[^A-Za-z0-9._/-]", candidate):
+    if candidate.translate(_STRIP_SAFE_CHARS):
         return False
     if candidate.startswith("/") or candidate.endswith("/"):
         return False
@@ -79,82 +144,76 @@ def fetch_repos(
     include_user: bool = True,
 ) -> List[Dict]:
     per_page = 100
-    repos: List[Dict] = []
+    # Keyed by full name: the first listing that returns a repo wins, in fetch order.
+    repos_by_name: Dict[str, Dict] = {}
     api_base = _base_url(base_url)
-    seen_full_names = set()
 
     def _append_repo(repo: Dict, owner_filter: str, org_label: str = "") -> None:
-        owner_login = str((repo.get("owner") or {}).get("login") or "")
-        if owner_filter and owner_login.lower() != owner_filter.lower():
-            return
         if not include_forks and repo.get("fork"):
             return
+        owner_login = str((repo.get("owner") or {}).get("login") or "")
         full_name = str(repo.get("full_name") or "").strip()
         if not full_name:
             name = str(repo.get("name") or "").strip()
             if not name or not owner_login:
                 return
             full_name = f"{owner_login}/{name}"
-        if full_name in seen_full_names:
+        # Repos listed by several endpoints are dropped before any further work.
+        if full_name in repos_by_name:
             return
-        seen_full_names.add(full_name)
-        repos.append(
-            {
-                "name": full_name,
-                "private": bool(repo.get("private")),
-                "default_branch": repo.get("default_branch"),
-                "ssh_url": repo.get("ssh_url"),
-                "clone_url": repo.get("clone_url"),
-                "html_url": repo.get("html_url"),
-                "owner": owner_login,
-                "org": org_label,
-                "fork": bool(repo.get("fork")),
-                "archived": bool(repo.get("archived")),
-            }
-        )
+        if owner_filter and owner_login.lower() != owner_filter.lower():
+            return
+        repos_by_name[full_name] = {
+            "name": full_name,
+            "private": bool(repo.get("private")),
+            "default_branch": repo.get("default_branch"),
+            "ssh_url": repo.get("ssh_url"),
+            "clone_url": repo.get("clone_url"),
+            "html_url": repo.get("html_url"),
+            "owner": owner_login,
+            "org": org_label,
+            "fork": bool(repo.get("fork")),
+            "archived": bool(repo.get("archived")),
+        }
 
     def _fetch_endpoint(
         url_base: str,
         params: Dict[str, str],
         request_token: Optional[str],
-        owner_filter: str,
-        org_label: str = "",
-    ) -> None:
-        page = 1
-        while True:
-            page_params = dict(params)
-            page_params["page"] = str(page)
-            url = f"{url_base}?{urllib.parse.urlencode(page_params)}"
+    ) -> List[List[Dict]]:
+        # Only the page number changes between requests; encode the rest once.
+        query = urllib.parse.urlencode(params)
+
+        def _fetch_page(page: int) -> Tuple[List[Dict], Mapping[str, str]]:
+            url = f"{url_base}?{query}&page={page}"
             try:
-                data = _request(url, request_token)
+                data, headers = _request_with_headers(url, request_token)
             except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError) as exc:
                 raise ValueError(f"Failed to fetch GitHub data from {url}") from exc
-            if not data:
-                break
-            if not isinstance(data, list):
+            if data and not isinstance(data, list):
                 raise ValueError(
                     f"Expected list of repositories from GitHub API, got {type(data).__name__} for {url}"
                 )
-            for repo in data:
-                _append_repo(repo, owner_filter, org_label)
-            page += 1
+            return data or [], headers
+
+        return list(iter_pages(_fetch_page, _last_page_of, per_page))
 
+    # (url_base, params, token, owner_filter, org_label) per listing, in merge order.
+    endpoints: List[Tuple[str, Dict[str, str], Optional[str], str, str]] = []
     if include_user:
         if token:
-            _fetch_endpoint(
-                f"{api_base}/user/repos",
-                {"affiliation": "owner", "per_page": str(per_page)},
-                token,
-                user,
-                "",
+            endpoints.append(
+                (f"{api_base}/user/repos", {"affiliation": "owner", "per_page": str(per_page)}, token, user, "")
             )
         else:
-            _fetch_endpoint(
-                f"{api_base}/users/{urllib.parse.quote(user, safe='')}/repos",
-                {"type": "owner", "per_page": str(per_page)},
-                None,
-                user,
-                "",
+            endpoints.append(
+                (
+                    f"{api_base}/users/{urllib.parse.quote(user, safe='')}/repos",
+                    {"type": "owner", "per_page": str(per_page)},
+                    None,
+                    user,
+                    "",
+                )
             )
 
     for org_entry in organizations or []:
@@ -162,15 +221,31 @@ def fetch_repos(
         if not org_name:
             continue
         org_token = str((org_entry or {}).get("token") or "").strip() or token
-        _fetch_endpoint(
-            f"{api_base}/orgs/{urllib.parse.quote(org_name, safe='')}/repos",
-            {"type": "all", "per_page": str(per_page)},
-            org_token,
-            org_name,
-            org_name,
+        endpoints.append(
+            (
+                f"{api_base}/orgs/{urllib.parse.quote(org_name, safe='')}/repos",
+                {"type": "all", "per_page": str(per_page)},
+                org_token,
+                org_name,
+                org_name,
+            )
         )
 
-    return repos
+    def _fetch(endpoint: Tuple[str, Dict[str, str], Optional[str], str, str]) -> List[List[Dict]]:
+        return _fetch_endpoint(endpoint[0], endpoint[1], endpoint[2])
+
+    if len(endpoints) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_ENDPOINT_WORKERS, len(endpoints))) as executor:
+            endpoint_pages = list(executor.map(_fetch, endpoints))
+    else:
+        endpoint_pages = [_fetch(endpoint) for endpoint in endpoints]
+    # Merged in endpoint order so the first listing to return a repo still wins.
+    for (_url, _params, _token, owner_filter, org_label), pages in zip(endpoints, endpoint_pages):
+        for data in pages:
+            for repo in data:
+                _append_repo(repo, owner_filter, org_label)
+
+    return list(repos_by_name.values())
 
 
 def load_env() -> Dict[str, str]:
@@ -196,7 +271,6 @@ def fetch_gists(
     base_url: Optional[str] = None,
 ) -> List[Dict]:
     per_page = 100
-    page = 1
     gists: List[Dict] = []
     api_base = _base_url(base_url)
 
@@ -209,12 +283,13 @@ def fetch_gists(
         url_base = f"{api_base}/users/{user}/gists"
         params = {"per_page": str(per_page)}
 
-    while True:
-        params["page"] = str(page)
-        url = f"{url_base}?{urllib.parse.urlencode(params)}"
-        data = _request(url, token)
-        if not data:
-            break
+    query = urllib.parse.urlencode(params)
+
+    def _fetch_page(page: int) -> Tuple[List[Dict], Mapping[str, str]]:
+        data, headers = _request_with_headers(f"{url_base}?{query}&page={page}", token)
+        return data or [], headers
+
+    for data in iter_pages(_fetch_page, _last_page_of, per_page):
         for gist in data:
             gists.append(
                 {
@@ -226,7 +301,6 @@ def fetch_gists(
                     "updated_at": gist.get("updated_at"),
                 }
             )
-        page += 1
 
     return gists
 
@@ -237,6 +311,12 @@ def get_gist(gist_id: str, token: Optional[str], base_url: Optional[str] = None)
     return data
 
 
+def _send_json(method: str, url: str, token: str, payload: Dict) -> Dict:
+    headers = {"Content-Type": "application/json", "Authorization": f"token {token}"}
+    data, _headers = http_pool.request(method, url, headers, body=http_pool.encode_json(payload))
+    return http_pool.decode_json(data)
+
+
 def update_gist(
     gist_id: str,
     token: str,
@@ -244,26 +324,12 @@ def update_gist(
     description: Optional[str],
     base_url: Optional[str] = None,
 ) -> Dict:
-    file_payload: Dict[str, Dict] = {}
-    for name, content in files.items():
-        if content is None:
-            file_payload[name] = None
-        else:
-            file_payload[name] = {"content": content}
-    payload = {"files": file_payload}
+    payload = {
+        "files": {name: None if content is None else {"content": content} for name, content in files.items()},
+    }
     if description is not None:
         payload["description"] = description
-    body = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        f"{_base_url(base_url)}/gists/{gist_id}",
-        data=body,
-        method="PATCH",
-        headers={"Content-Type": "application/json"},
-    )
-    req.add_header("Authorization", f"token {token}")
-    with urllib.request.urlopen(req, timeout=20) as resp:
-        data = resp.read().decode("utf-8")
-    return json.loads(data)
+    return _send_json("PATCH", f"{_base_url(base_url)}/gists/{gist_id}", token, payload)
 
 
 def create_gist(
@@ -279,17 +345,31 @@ def create_gist(
     }
     if description is not None:
         payload["description"] = description
-    body = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        f"{_base_url(base_url)}/gists",
-        data=body,
-        method="POST",
-        headers={"Content-Type": "application/json"},
-    )
-    req.add_header("Authorization", f"token {token}")
-    with urllib.request.urlopen(req, timeout=20) as resp:
-        data = resp.read().decode("utf-8")
-    return json.loads(data)
+    return _send_json("POST", f"{_base_url(base_url)}/gists", token, payload)
+
+
+def _updated_before(updated_raw: str, cutoff: datetime, cutoff_iso: str) -> bool:
+    """Return True when an ISO-8601 ``updated_at`` timestamp is older than ``cutoff``.
+
+    GitHub sends canonical ``YYYY-MM-DDTHH:MM:SSZ`` strings, which sort like the
+    instants they name, so those are compared as text; anything else is parsed.
+    """
+    if not updated_raw:
+        return False
+    if len(updated_raw) == 20 and updated_raw[10] == "T" and updated_raw[19] == "Z":
+        return updated_raw < cutoff_iso
+    try:
+        updated_dt = datetime.fromisoformat(updated_raw.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if updated_dt.tzinfo is None:
+        updated_dt = updated_dt.replace(tzinfo=timezone.utc)
+    return updated_dt < cutoff
+
+
+def _stale_cutoff(stale_days: int) -> Tuple[datetime, str]:
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max(stale_days, 0))
+    return cutoff, cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def fetch_open_pull_requests(
@@ -323,19 +403,13 @@ def fetch_open_pull_requests(
         return []
     if not isinstance(data, list):
         return []
-    cutoff = datetime.now(timezone.utc) - timedelta(days=max(stale_days, 0))
+    cutoff, cutoff_iso = _stale_cutoff(stale_days)
     out: List[Dict] = []
     for pr in data:
         if not isinstance(pr, dict):
             continue
         updated_raw = str(pr.get("updated_at") or "")
-        updated_dt = None
-        if updated_raw:
-            try:
-                updated_dt = datetime.strptime(updated_raw, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-            except ValueError:
-                updated_dt = None
-        if updated_dt and updated_dt < cutoff:
+        if _updated_before(updated_raw, cutoff, cutoff_iso):
             continue
         head = pr.get("head") if isinstance(pr.get("head"), dict) else {}
         out.append(
@@ -350,8 +424,14 @@ def fetch_open_pull_requests(
     return out
 
 
+@functools.lru_cache(maxsize=1)
+def _gh_bin() -> Optional[str]:
+    # One PATH walk per process instead of one per repository or PR.
+    return shutil.which("gh")
+
+
 def fetch_open_pull_requests_via_gh(owner: str, repo: str, stale_days: int = 30) -> Optional[List[Dict]]:
-    gh_bin = shutil.which("gh")
+    gh_bin = _gh_bin()
     if not gh_bin:
         return None
     if not _is_safe_repo_component(owner) or not _is_safe_repo_component(repo):
@@ -376,25 +456,18 @@ def fetch_open_pull_requests_via_gh(owner: str, repo: str, stale_days: int = 30)
     if proc.returncode != 0:
         return None
     try:
-        data = json.loads(proc.stdout or "[]")
-    except json.JSONDecodeError:
+        data = http_pool.decode_json(proc.stdout or "[]")
+    except ValueError:
         return None
     if not isinstance(data, list):
         return None
-    cutoff = datetime.now(timezone.utc) - timedelta(days=max(stale_days, 0))
+    cutoff, cutoff_iso = _stale_cutoff(stale_days)
     out: List[Dict] = []
     for pr in data:
         if not isinstance(pr, dict):
             continue
         updated_raw = str(pr.get("updatedAt") or "")
-        updated_dt = None
-        if updated_raw:
-            candidate = updated_raw.replace("Z", "+00:00")
-            try:
-                updated_dt = datetime.fromisoformat(candidate)
-            except ValueError:
-                updated_dt = None
-        if updated_dt and updated_dt < cutoff:
+        if _updated_before(updated_raw, cutoff, cutoff_iso):
             continue
         out.append(
             {
@@ -409,7 +482,7 @@ def fetch_open_pull_requests_via_gh(owner: str, repo: str, stale_days: int = 30)
 
 
 def get_pr_branch_via_gh(owner: str, repo: str, pr_number: int) -> Optional[str]:
-    gh_bin = shutil.which("gh")
+    gh_bin = _gh_bin()
     if not gh_bin:
         return None
     if not _is_safe_repo_component(owner) or not _is_safe_repo_component(repo):
@@ -431,8 +504,8 @@ def get_pr_branch_via_gh(owner: str, repo: str, pr_number: int) -> Optional[str]
     if proc.returncode != 0:
         return None
     try:
-        data = json.loads(proc.stdout or "{}")
-    except json.JSONDecodeError:
+        data = http_pool.decode_json(proc.stdout or "{}")
+    except ValueError:
         return None
     if not isinstance(data, dict):
         return None
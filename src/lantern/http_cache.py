@@ -0,0 +1,142 @@
+"""On-disk ETag store for conditional GETs of forge API responses.
+
+Each cached response lives in its own file under
+``$XDG_CACHE_HOME/git-lantern/http`` (``~/.cache`` when unset), named after a
+hash of the URL and the credential headers so different tokens never share an
+entry. The file holds one JSON metadata line (validators and response headers)
+followed by the raw body. ``http_pool.request(..., cache=True)`` sends the
+stored validators and replays the body when the server answers 304, which also
+spares the caller's rate limit. Everything here is best-effort: an unreadable
+or unwritable cache only costs a full download.
+
+Entries used during the current process are also kept in a small in-memory LRU,
+so repeated lookups skip the disk, and a response is reused without any round
+trip while its ``Cache-Control: max-age`` is still fresh.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# Request headers that identify the caller; they are part of the cache key.
+_CREDENTIAL_HEADERS = ("authorization", "private-token")
+_MEMORY_ENTRIES = 256
+
+Entry = Tuple[Dict[str, str], List[Tuple[str, str]], bytes]
+
+# entry path -> (entry, monotonic deadline until which it is fresh)
+_memory: "OrderedDict[str, Tuple[Entry, float]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def cache_dir() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "git-lantern", "http")
+
+
+def _entry_path(url: str, headers: Mapping[str, str]) -> str:
+    digest = hashlib.sha256(url.encode("utf-8"))
+    for key, value in sorted(headers.items()):
+        if key.lower() in _CREDENTIAL_HEADERS:
+            digest.update(f"\0{key.lower()}\0{value}".encode("utf-8"))
+    return os.path.join(cache_dir(), f"{digest.hexdigest()}.bin")
+
+
+def _max_age(response_headers: List[Tuple[str, str]]) -> float:
+    for key, value in response_headers:
+        if key.lower() != "cache-control":
+            continue
+        directives = [directive.strip().lower() for directive in value.split(",")]
+        if "no-cache" in directives or "no-store" in directives:
+            return 0.0
+        for directive in directives:
+            if directive.startswith("max-age="):
+                seconds = directive[len("max-age="):]
+                return float(seconds) if seconds.isdigit() else 0.0
+    return 0.0
+
+
+def _remember(path: str, entry: Entry, deadline: float) -> None:
+    with _memory_lock:
+        _memory[path] = (entry, deadline)
+        _memory.move_to_end(path)
+        while len(_memory) > _MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def fresh(url: str, headers: Mapping[str, str]) -> Optional[Entry]:
+    """Return the entry for the request if it was seen this run and is within ``max-age``."""
+    with _memory_lock:
+        remembered = _memory.get(_entry_path(url, headers))
+    if remembered is None or remembered[1] <= time.monotonic():
+        return None
+    return remembered[0]
+
+
+def revalidated(url: str, headers: Mapping[str, str], response_headers: List[Tuple[str, str]]) -> None:
+    """Restart the freshness window of an entry the server just confirmed with a 304."""
+    path = _entry_path(url, headers)
+    with _memory_lock:
+        remembered = _memory.get(path)
+    if remembered is not None:
+        _remember(path, remembered[0], time.monotonic() + _max_age(response_headers))
+
+
+def load(url: str, headers: Mapping[str, str]) -> Optional[Entry]:
+    """Return ``(validators, response_headers, body)`` cached for the request, if any."""
+    path = _entry_path(url, headers)
+    with _memory_lock:
+        remembered = _memory.get(path)
+        if remembered is not None:
+            _memory.move_to_end(path)
+            return remembered[0]
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+        meta_line, _sep, body = data.partition(b"\n")
+        meta = json.loads(meta_line)
+        validators = {key: str(value) for key, value in meta["validators"].items()}
+        response_headers = [(str(key), str(value)) for key, value in meta["headers"]]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if not validators:
+        return None
+    entry = (validators, response_headers, body)
+    _remember(path, entry, 0.0)
+    return entry
+
+
+def store(url: str, headers: Mapping[str, str], response_headers: List[Tuple[str, str]], body: bytes) -> None:
+    """Remember a 200 response that carries an ``ETag`` or ``Last-Modified`` validator."""
+    validators: Dict[str, str] = {}
+    for key, value in response_headers:
+        lowered = key.lower()
+        if lowered == "etag":
+            validators["If-None-Match"] = value
+        elif lowered == "last-modified":
+            validators["If-Modified-Since"] = value
+    if not validators:
+        return
+    path = _entry_path(url, headers)
+    _remember(path, (validators, response_headers, body), time.monotonic() + _max_age(response_headers))
+    meta = json.dumps({"validators": validators, "headers": response_headers}).encode("utf-8")
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # mkstemp creates the file 0600: cached bodies may list private repositories.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(meta + b"\n" + body)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
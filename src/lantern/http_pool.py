@@ -0,0 +1,274 @@
+"""Keep-alive HTTP(S) connections shared by the GitHub and forge API helpers.
+
+``urllib.request.urlopen`` opens a new TCP+TLS connection for every call, so a
+paginated listing pays a full handshake per page. ``request`` checks an idle
+``http.client`` connection for the (scheme, host, port) out of a process-wide
+pool, or opens one, and returns it to the pool once the response has been read,
+so concurrent page fetches share a handful of warm connections. Failures are
+raised as ``urllib.error.HTTPError`` / ``urllib.error.URLError`` so callers keep
+their existing error handling. When a proxy is configured for the target host
+the call falls back to ``urlopen``.
+
+Idempotent requests answered with 429/502/503/504 are retried a few times with
+exponential backoff, honouring ``Retry-After`` when the server sends one. Other
+methods (POST, PATCH, ...) always open a fresh connection and are sent exactly
+once, so a dropped connection can never create something twice.
+``decode_json`` parses response bodies, with ``orjson`` when it is installed.
+With ``cache=True`` a GET is made conditional on the validators stored by
+``http_cache`` and a 304 answer replays the cached body and headers; a response
+fetched earlier in the same run is reused outright while its ``max-age`` lasts.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+import urllib.error
+import urllib.parse
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from . import http_cache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup (pip install git-lantern[fast])
+    orjson = None
+
+# http.client, ssl and urllib.request are imported where they are used: together
+# they dominate import time, and commands that never touch the network (config
+# path, status, table, ...) should not pay for them at startup.
+if TYPE_CHECKING:  # pragma: no cover
+    import http.client
+    import ssl
+
+USER_AGENT = "git-lantern"
+_MAX_REDIRECTS = 5
+_REDIRECT_CODES = {301, 302, 303, 307, 308}
+_RETRY_CODES = {429, 502, 503, 504}
+_RETRY_METHODS = {"GET", "HEAD"}
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.5
+_MAX_RETRY_DELAY = 30.0
+# Idle connections kept per (scheme, netloc); matches the page-fetch worker count.
+_MAX_IDLE_PER_HOST = 8
+
+_idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+_idle_lock = threading.Lock()
+_ssl_context: Optional[ssl.SSLContext] = None
+
+
+def _context() -> ssl.SSLContext:
+    import ssl
+
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+def _checkout(
+    scheme: str, netloc: str, timeout: float, reuse: bool = True
+) -> Tuple[http.client.HTTPConnection, bool]:
+    """Return ``(connection, reused)`` for the target, taking an idle one if ``reuse`` allows."""
+    import http.client
+
+    conn = None
+    if reuse:
+        with _idle_lock:
+            idle = _idle.get((scheme, netloc))
+            conn = idle.pop() if idle else None
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    if scheme == "https":
+        return http.client.HTTPSConnection(netloc, timeout=timeout, context=_context()), False
+    return http.client.HTTPConnection(netloc, timeout=timeout), False
+
+
+def _checkin(scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+    with _idle_lock:
+        idle = _idle.setdefault((scheme, netloc), [])
+        if len(idle) < _MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _uses_proxy(parsed: urllib.parse.SplitResult) -> bool:
+    import urllib.request
+
+    proxies = urllib.request.getproxies()
+    if parsed.scheme not in proxies:
+        return False
+    return not urllib.request.proxy_bypass(parsed.hostname or "")
+
+
+def _urlopen(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    body: Optional[bytes],
+    timeout: float,
+) -> Tuple[bytes, http.client.HTTPMessage]:
+    import urllib.request
+
+    req = urllib.request.Request(url, data=body, headers=headers, method=method)
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.read(), resp.headers
+
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based)."""
+    delay = _BACKOFF_FACTOR * (2 ** attempt)
+    value = (retry_after or "").strip()
+    if value.isdigit():
+        delay = float(value)
+    elif value:
+        import email.utils
+
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            when = None
+        if when is not None and when.tzinfo is not None:
+            delay = when.timestamp() - time.time()
+    return min(max(delay, 0.0), _MAX_RETRY_DELAY)
+
+
+def _message(pairs: List[Tuple[str, str]]) -> http.client.HTTPMessage:
+    import http.client
+
+    message = http.client.HTTPMessage()
+    for key, value in pairs:
+        message[key] = value
+    return message
+
+
+def request(
+    method: str,
+    url: str,
+    headers: Optional[Mapping[str, str]] = None,
+    body: Optional[bytes] = None,
+    timeout: float = 20,
+    cache: bool = False,
+) -> Tuple[bytes, http.client.HTTPMessage]:
+    """Perform a request over a pooled connection and return ``(body, headers)``.
+
+    Redirects are followed (the ``Authorization`` header is dropped when the host
+    changes); HTTP status codes >= 400 raise ``urllib.error.HTTPError`` once any
+    retries for rate limiting or gateway errors are exhausted. ``cache=True``
+    revalidates GETs against ``http_cache`` instead of downloading unchanged bodies,
+    and skips the request entirely while a response from this run is still fresh.
+    """
+    import http.client
+
+    request_headers = {"User-Agent": USER_AGENT}
+    request_headers.update(headers or {})
+    # Keyed on the original URL and credentials; redirects may rewrite both below.
+    cache_key = (url, dict(request_headers))
+    cache = cache and method == "GET"
+    if cache:
+        fresh = http_cache.fresh(*cache_key)
+        if fresh is not None:
+            return fresh[2], _message(fresh[1])
+    cached = http_cache.load(*cache_key) if cache else None
+    conditional = cached[0] if cached is not None else {}
+    redirects = 0
+    retries = 0
+    while redirects <= _MAX_REDIRECTS:
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in {"http", "https"} or not parsed.netloc:
+            raise urllib.error.URLError(f"unsupported URL: {url!r}")
+        if _uses_proxy(parsed):
+            return _urlopen(method, url, request_headers, body, timeout)
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+
+        # A dropped connection gives no way to tell whether the server already
+        # acted on the request, so non-idempotent methods never go out on an
+        # idle connection that may have gone stale and are never re-sent.
+        reuse = method in _RETRY_METHODS
+        while True:
+            conn, reused = _checkout(parsed.scheme, parsed.netloc, timeout, reuse)
+            try:
+                conn.request(method, target, body=body, headers={**request_headers, **conditional})
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.HTTPException, OSError) as exc:
+                conn.close()
+                # A kept-alive connection may have been closed by the server
+                # while idle; retry once, on a fresh connection.
+                if reused and isinstance(exc, (http.client.RemoteDisconnected, ConnectionError)):
+                    reuse = False
+                    continue
+                if isinstance(exc, TimeoutError):
+                    raise
+                raise urllib.error.URLError(exc) from exc
+            break
+        if resp.will_close:
+            conn.close()
+        else:
+            _checkin(parsed.scheme, parsed.netloc, conn)
+
+        if resp.status in _RETRY_CODES and method in _RETRY_METHODS and retries < _MAX_RETRIES:
+            time.sleep(_retry_delay(resp.headers.get("Retry-After"), retries))
+            retries += 1
+            continue
+
+        if resp.status == 304 and cached is not None:
+            http_cache.revalidated(*cache_key, resp.headers.items())
+            return cached[2], _message(cached[1])
+
+        location = resp.headers.get("Location")
+        if resp.status in _REDIRECT_CODES and location:
+            next_url = urllib.parse.urljoin(url, location)
+            if urllib.parse.urlsplit(next_url).netloc != parsed.netloc:
+                request_headers = {
+                    key: value for key, value in request_headers.items() if key.lower() != "authorization"
+                }
+            if resp.status == 303 or (resp.status in {301, 302} and method == "POST"):
+                method = "GET"
+                body = None
+                request_headers = {
+                    key: value for key, value in request_headers.items() if key.lower() != "content-type"
+                }
+            url = next_url
+            redirects += 1
+            continue
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(data))
+        if cache:
+            http_cache.store(*cache_key, resp.headers.items(), data)
+        return data, resp.headers
+    raise urllib.error.URLError(f"too many redirects: {url!r}")
+
+
+def decode_json(data: Union[bytes, str]) -> Any:
+    """Parse a JSON response body straight from bytes (no intermediate ``str``)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # let json accept what orjson rejects, or raise its usual error
+    return json.loads(data)
+
+
+def encode_json(payload: Any) -> bytes:
+    """Serialize a request body to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def close() -> None:
+    """Close every idle pooled connection."""
+    with _idle_lock:
+        idle = [conn for conns in _idle.values() for conn in conns]
+        _idle.clear()
+    for conn in idle:
+        conn.close()
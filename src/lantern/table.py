@@ -65,29 +65,23 @@ def render_table(records: List[Dict[str, str]], columns: List[str]) -> str:
     if not records:
         return "No records."
 
-    widths = {col: len(col) for col in columns}
-    for record in records:
-        for col in columns:
-            widths[col] = max(widths[col], len(_string(record.get(col))))
+    # Stringify each cell once; the same matrix drives widths and rendering.
+    rows = [[_string(record.get(col)) for col in columns] for record in records]
+    widths = {
+        col: max(len(col), max(map(len, column_cells)))
+        for col, column_cells in zip(columns, zip(*rows))
+    }
 
     term_width = shutil.get_terminal_size((120, 20)).columns
     widths = _fit_widths(columns, widths, term_width)
+    shown = [(index, widths[col]) for index, col in enumerate(columns) if widths[col] > 0]
+
+    # Widths are final here, so one positional template pads every row ("{0:<12}  {1:<7}  ...").
+    template = "  ".join(f"{{{position}:<{width}}}" for position, (_index, width) in enumerate(shown))
 
-    lines = []
-    header = "  ".join(
-        _truncate(col, widths[col]).ljust(widths[col])
-        for col in columns
-        if widths[col] > 0
-    )
-    lines.append(header)
-    lines.append("  ".join("-" * widths[col] for col in columns if widths[col] > 0))
-
-    for record in records:
-        row = "  ".join(
-            _truncate(_string(record.get(col)), widths[col]).ljust(widths[col])
-            for col in columns
-            if widths[col] > 0
-        )
-        lines.append(row)
+    def render(cells: List[str]) -> str:
+        return template.format(*[_truncate(cells[index], width) for index, width in shown])
 
+    lines = [render(columns), "  ".join("-" * width for _index, width in shown)]
+    lines.extend(map(render, rows))
     return "\n".join(lines)
@@ -5,13 +5,16 @@ from __future__ import annotations
 
 import argparse
 import json
-import re
 import subprocess
 import sys
+import urllib.error
+import urllib.parse
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Set, Tuple
 
+from . import http_pool
+
 
 TODO_START = "[TODO]"
 TODO_END = "[/TODO]"
@@ -27,8 +30,9 @@ class TodoItem:
 
 def normalize_text(value: str) -> str:
     """Normalize text for duplicate checks."""
-    collapsed = re.sub(r"\s+", " ", value.strip())
-    return collapsed.casefold()
+    # str.split() drops leading/trailing whitespace and splits on the same
+    # characters as r"\s+", without going through the regex engine.
+    return " ".join(value.split()).casefold()
 
 
 def extract_todo_block(text: str) -> str:
@@ -117,7 +121,43 @@ def run_gh_json(command: Sequence[str]) -> object:
         raise RuntimeError(GH_NOT_FOUND_ERROR) from exc
     if not result.stdout.strip():
         return []
-    return json.loads(result.stdout)
+    return http_pool.decode_json(result.stdout)
+
+
+def run_gh_text(command: Sequence[str]) -> str:
+    try:
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
+    except FileNotFoundError as exc:
+        raise RuntimeError(GH_NOT_FOUND_ERROR) from exc
+    return result.stdout.strip()
+
+
+@dataclass
+class IssueEndpoint:
+    url: str
+    token: str
+
+
+def resolve_issue_endpoint(repo: Optional[str]) -> IssueEndpoint:
+    """Resolve the issues API URL and token for the repo ``gh`` would target.
+
+    Costs two ``gh`` runs in total, so each issue can then be created with one
+    pooled HTTPS request instead of one ``gh issue create`` process.
+    """
+    cmd = ["gh", "repo", "view", "--json", "nameWithOwner,url"]
+    if repo:
+        cmd.append(repo)
+    info = run_gh_json(cmd)
+    if not isinstance(info, dict) or not info.get("nameWithOwner") or not info.get("url"):
+        raise ValueError("Unexpected gh repo view payload.")
+    host = (urllib.parse.urlsplit(str(info["url"])).hostname or "").lower()
+    if not host:
+        raise ValueError(f"Could not determine the GitHub host from {info['url']!r}.")
+    api_base = "https://api.github.com" if host == "github.com" else f"https://{host}/api/v3"
+    token = run_gh_text(["gh", "auth", "token", "--hostname", host])
+    if not token:
+        raise ValueError(f"gh has no token for {host}.")
+    return IssueEndpoint(url=f"{api_base}/repos/{info['nameWithOwner']}/issues", token=token)
 
 
 def fetch_existing_issues(repo: Optional[str], limit: int) -> Set[Tuple[str, str]]:
@@ -159,13 +199,16 @@ def build_issue_body(item: TodoItem) -> str:
     return item.description
 
 
+def issue_fingerprint(item: TodoItem) -> Tuple[str, str]:
+    """Return the normalized ``(title, body)`` pair used for duplicate checks."""
+    return normalize_text(item.title), normalize_text(build_issue_body(item))
+
+
 def is_duplicate(
     item: TodoItem,
     seen_fingerprints: Set[Tuple[str, str]],
 ) -> bool:
-    normalized_title = normalize_text(item.title)
-    normalized_body = normalize_text(build_issue_body(item))
-    return (normalized_title, normalized_body) in seen_fingerprints
+    return issue_fingerprint(item) in seen_fingerprints
 
 
 def create_issue(
@@ -173,12 +216,28 @@ def create_issue(
     repo: Optional[str],
     labels: Iterable[str],
     dry_run: bool,
+    endpoint: Optional[IssueEndpoint] = None,
 ) -> None:
     body = build_issue_body(item)
     if dry_run:
         print(f"[DRY-RUN] Would create issue: {item.title}")
         return
 
+    if endpoint is not None:
+        payload = {"title": item.title, "body": body, "labels": list(labels)}
+        headers = {
+            "Authorization": f"token {endpoint.token}",
+            "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
+        }
+        # http_pool sends a POST exactly once: a connection dropped mid-request raises
+        # URLError (reported as a failed create) instead of filing the issue twice.
+        data, _headers = http_pool.request("POST", endpoint.url, headers, body=http_pool.encode_json(payload))
+        created_issue = http_pool.decode_json(data)
+        created = created_issue.get("html_url") if isinstance(created_issue, dict) else None
+        print(f"[CREATED] {created or item.title}")
+        return
+
     cmd = ["gh", "issue", "create", "--title", item.title, "--body", body]
     for label in labels:
         cmd.extend(["--label", label])
@@ -264,14 +323,24 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     created = 0
     skipped = 0
+    endpoint: Optional[IssueEndpoint] = None
+    endpoint_resolved = args.dry_run
     for item in items:
-        if is_duplicate(item, seen_fingerprints):
+        fingerprint = issue_fingerprint(item)
+        if fingerprint in seen_fingerprints:
             print(f"[SKIPPED] Duplicate title/body fingerprint: {item.title}")
             skipped += 1
             continue
 
+        if not endpoint_resolved:
+            endpoint_resolved = True
+            try:
+                endpoint = resolve_issue_endpoint(args.repo)
+            except (RuntimeError, subprocess.CalledProcessError, ValueError):
+                endpoint = None  # fall back to one `gh issue create` per item
+
         try:
-            create_issue(item, args.repo, args.label, args.dry_run)
+            create_issue(item, args.repo, args.label, args.dry_run, endpoint)
         except RuntimeError as exc:
             print(str(exc), file=sys.stderr)
             return 1
@@ -281,9 +350,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             if stderr:
                 print(stderr, file=sys.stderr)
             continue
+        except (urllib.error.URLError, TimeoutError, ValueError) as exc:
+            print(f"[ERROR] Failed to create issue: {item.title}", file=sys.stderr)
+            print(str(exc), file=sys.stderr)
+            continue
 
-        normalized_body = normalize_text(build_issue_body(item))
-        seen_fingerprints.add((normalize_text(item.title), normalized_body))
+        seen_fingerprints.add(fingerprint)
         created += 1
 
     print(f"Done. Created: {created}, Skipped duplicates: {skipped}, Parsed: {len(items)}")
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Make the src-layout package importable once per session, whichever test file runs first.
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
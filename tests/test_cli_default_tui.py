@@ -1,14 +1,7 @@
 import argparse
-import os
-import sys
 from types import SimpleNamespace
 
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-SRC = os.path.join(ROOT, "src")
-if SRC not in sys.path:
-    sys.path.insert(0, SRC)
-
-from lantern import cli  # noqa: E402
+from lantern import cli
 
 
 def test_main_defaults_to_tui_when_no_subcommand(monkeypatch):
@@ -18,8 +11,8 @@ def test_main_defaults_to_tui_when_no_subcommand(monkeypatch):
         def parse_args(self):
             return SimpleNamespace(command=None, tui=False)
 
-    monkeypatch.setattr(cli, "build_parser", lambda: _Parser())
-    monkeypatch.setattr(cli, "argcomplete", None)
+    monkeypatch.setattr(cli, "build_parser", lambda *_args, **_kwargs: _Parser())
+    monkeypatch.delenv("_ARGCOMPLETE", raising=False)
 
     called = {}
 
@@ -64,8 +57,8 @@ def test_main_dispatches_explicit_tui_subcommand(monkeypatch):
         def parse_args(self):
             return args
 
-    monkeypatch.setattr(cli, "build_parser", lambda: _Parser())
-    monkeypatch.setattr(cli, "argcomplete", None)
+    monkeypatch.setattr(cli, "build_parser", lambda *_args, **_kwargs: _Parser())
+    monkeypatch.delenv("_ARGCOMPLETE", raising=False)
 
     called = {}
 
@@ -0,0 +1,49 @@
+import json
+
+from lantern import config as lantern_config
+
+
+def test_load_config_reuses_file_text_until_it_changes(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"default_server": "github.com"}), encoding="utf-8")
+    monkeypatch.setenv("GIT_LANTERN_CONFIG", str(path))
+
+    first = lantern_config.load_config()
+    first["default_server"] = "mutated"
+    assert lantern_config.load_config() == {"default_server": "github.com"}
+
+    path.write_text(json.dumps({"default_server": "gitlab.com", "servers": {}}), encoding="utf-8")
+    assert lantern_config.load_config() == {"default_server": "gitlab.com", "servers": {}}
+
+
+def test_load_config_returns_empty_for_missing_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("GIT_LANTERN_CONFIG", str(tmp_path / "missing.json"))
+
+    assert lantern_config.load_config() == {}
+
+
+def test_config_path_probes_search_locations_once(monkeypatch):
+    probes = []
+    monkeypatch.delenv("GIT_LANTERN_CONFIG", raising=False)
+    monkeypatch.setattr(lantern_config.os.path, "isfile", lambda path: probes.append(path) or False)
+    lantern_config._discover_config_path.cache_clear()
+    try:
+        assert lantern_config.config_path() == lantern_config.DEFAULT_CONFIG_PATH
+        assert lantern_config.config_path() == lantern_config.DEFAULT_CONFIG_PATH
+    finally:
+        lantern_config._discover_config_path.cache_clear()
+
+    assert len(probes) == 4
+
+
+def test_config_path_returns_first_existing_candidate(tmp_path, monkeypatch):
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    second.write_text("{}", encoding="utf-8")
+    monkeypatch.delenv("GIT_LANTERN_CONFIG", raising=False)
+    monkeypatch.setattr(lantern_config, "_CANDIDATE_CONFIG_PATHS", (str(first), str(second)))
+    lantern_config._discover_config_path.cache_clear()
+    try:
+        assert lantern_config.config_path() == str(second)
+    finally:
+        lantern_config._discover_config_path.cache_clear()
@@ -0,0 +1,110 @@
+import argparse
+import json
+
+from lantern import cli
+
+
+def _make_repo(path):
+    (path / ".git").mkdir(parents=True)
+
+
+def test_find_repos_respects_depth_hidden_and_nested_repos(tmp_path):
+    _make_repo(tmp_path / "alpha")
+    _make_repo(tmp_path / "alpha" / "nested")
+    _make_repo(tmp_path / "group" / "beta")
+    _make_repo(tmp_path / "group" / "deep" / "gamma")
+    _make_repo(tmp_path / ".hidden" / "delta")
+
+    assert cli.find_repos(str(tmp_path), 2, False) == [
+        str(tmp_path / "alpha"),
+        str(tmp_path / "group" / "beta"),
+    ]
+    assert cli.find_repos(str(tmp_path), 3, True) == [
+        str(tmp_path / "alpha"),
+        str(tmp_path / "group" / "beta"),
+        str(tmp_path / ".hidden" / "delta"),
+        str(tmp_path / "group" / "deep" / "gamma"),
+    ]
+
+
+def test_find_repos_skips_submodule_gitfiles(tmp_path):
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text("gitdir: /elsewhere/.git/worktrees/worktree\n", encoding="utf-8")
+    submodule = tmp_path / "submodule"
+    submodule.mkdir()
+    (submodule / ".git").write_text("gitdir: ../.git/modules/submodule\n", encoding="utf-8")
+
+    assert cli.find_repos(str(tmp_path), 6, False) == [str(worktree)]
+
+
+def test_iter_repos_does_not_follow_directory_symlinks(tmp_path):
+    _make_repo(tmp_path / "real" / "alpha")
+    (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+
+    assert list(cli.iter_repos(str(tmp_path), 6, False)) == [str(tmp_path / "real" / "alpha")]
+
+
+def test_scan_cache_reuses_walk_until_root_changes(tmp_path, monkeypatch):
+    workspace = tmp_path / "workspace"
+    _make_repo(workspace / "alpha")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(cli.git, "get_origin_url", lambda path: f"git@example.com:team/{path.rsplit('/', 1)[-1]}.git")
+
+    first = cli._scan_repos_with_origins(str(workspace), 6, False, use_cache=True)
+    assert first == [(str(workspace / "alpha"), "git@example.com:team/alpha.git")]
+
+    walks = []
+    original_find_repos = cli.find_repos
+    monkeypatch.setattr(cli, "find_repos", lambda *args: walks.append(args) or original_find_repos(*args))
+    assert cli._scan_repos_with_origins(str(workspace), 6, False, use_cache=True) == first
+    assert walks == []
+
+    _make_repo(workspace / "beta")
+    refreshed = cli._scan_repos_with_origins(str(workspace), 6, False, use_cache=True)
+    assert [path for path, _origin in refreshed] == [str(workspace / "alpha"), str(workspace / "beta")]
+    assert len(walks) == 1
+
+
+def test_scan_pipelines_walk_into_workers_and_keeps_sorted_output(tmp_path, monkeypatch):
+    for name in ("zeta", "Alpha", "group/mid"):
+        _make_repo(tmp_path / "ws" / name)
+    monkeypatch.setattr(cli, "build_repo_record", lambda path, _fetch: {"name": path.rsplit("/", 1)[-1], "path": path})
+    args = argparse.Namespace(
+        root=str(tmp_path / "ws"),
+        max_depth=6,
+        include_hidden=False,
+        fetch=False,
+        jobs=4,
+        output=str(tmp_path / "repos.json"),
+    )
+
+    assert cli.cmd_scan(args) == 0
+
+    payload = json.loads((tmp_path / "repos.json").read_text(encoding="utf-8"))
+    assert [record["name"] for record in payload["repos"]] == ["Alpha", "mid", "zeta"]
+
+
+def test_with_origins_keeps_input_order_when_parallel(monkeypatch):
+    monkeypatch.setattr(cli, "_origin_url", lambda path: None if path.endswith("c") else f"git@example.com:{path[-1]}.git")
+
+    assert cli._with_origins(["/ws/a", "/ws/b", "/ws/c"], jobs=3) == [
+        ("/ws/a", "git@example.com:a.git"),
+        ("/ws/b", "git@example.com:b.git"),
+        ("/ws/c", None),
+    ]
+
+
+def test_find_skips_origin_lookup_for_name_mismatches(tmp_path, monkeypatch, capsys):
+    for name in ("lantern", "other"):
+        _make_repo(tmp_path / name)
+    looked_up = []
+    monkeypatch.setattr(cli, "_origin_url", lambda path: looked_up.append(path) or "git@example.com:team/lantern.git")
+    args = argparse.Namespace(
+        root=str(tmp_path), max_depth=6, include_hidden=False, name="lant", remote="team", cache=False, jobs=1
+    )
+
+    assert cli.cmd_find(args) == 0
+
+    assert looked_up == [str(tmp_path / "lantern")]
+    assert "other" not in capsys.readouterr().out
@@ -1,5 +1,8 @@
 import argparse
 import json
+import subprocess
+
+import pytest
 
 from lantern import cli
 
@@ -32,6 +35,13 @@ def test_forge_clone_parser_supports_flat():
     assert args.flat is True
 
 
+def test_fleet_parsers_accept_jobs():
+    parser = cli.build_parser()
+    for command in ("overview", "plan", "apply", "dirty"):
+        assert parser.parse_args(["fleet", command]).jobs == cli.DEFAULT_JOBS
+        assert parser.parse_args(["fleet", command, "--jobs", "3"]).jobs == 3
+
+
 def test_fleet_plan_records_uses_flat_destination_for_missing_local_repo(monkeypatch, tmp_path):
     monkeypatch.setattr(cli, "find_repos", lambda *_args, **_kwargs: [])
     monkeypatch.setattr(cli, "_fleet_server_context", lambda _args: ("github", "", "", "", {}, {}))
@@ -360,3 +370,141 @@ def test_cmd_github_clone_dry_run_skips_repo_when_encoded_destination_already_ex
     out = capsys.readouterr().out
     assert rc == 0
     assert out == ""
+
+
+def test_cmd_github_clone_runs_clones_concurrently_and_replays_output(tmp_path, capsys, monkeypatch):
+    input_path = tmp_path / "repos.json"
+    input_path.write_text(
+        json.dumps(
+            {
+                "repos": [
+                    {"name": "beta", "ssh_url": "git@example.com:team/beta.git"},
+                    {"name": "alpha", "ssh_url": "git@example.com:team/alpha.git"},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        assert kwargs.get("capture_output") is True
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr=f"Cloning into '{cmd[-1]}'...\n")
+
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+    args = argparse.Namespace(
+        input=str(input_path),
+        server="",
+        root=str(tmp_path / "workspace"),
+        tui=False,
+        flat=True,
+        dry_run=False,
+        jobs=4,
+    )
+
+    rc = cli.cmd_github_clone(args)
+
+    err = capsys.readouterr().err
+    assert rc == 0
+    assert sorted(cmd[2] for cmd in calls) == ["git@example.com:team/alpha.git", "git@example.com:team/beta.git"]
+    assert err.index("alpha") < err.index("beta")
+
+
+def test_cmd_github_clone_quiet_passes_flag_to_git(tmp_path, monkeypatch):
+    input_path = tmp_path / "repos.json"
+    input_path.write_text(
+        json.dumps({"repos": [{"name": "alpha", "ssh_url": "git@example.com:team/alpha.git"}]}),
+        encoding="utf-8",
+    )
+    calls = []
+    monkeypatch.setattr(cli.subprocess, "run", lambda cmd, **_kwargs: calls.append(cmd))
+    args = argparse.Namespace(
+        input=str(input_path),
+        server="",
+        root=str(tmp_path / "workspace"),
+        tui=False,
+        flat=True,
+        dry_run=False,
+        jobs=1,
+        quiet=True,
+    )
+
+    assert cli.cmd_github_clone(args) == 0
+    assert calls == [["git", "clone", "--quiet", "git@example.com:team/alpha.git", str(tmp_path / "workspace" / "alpha")]]
+
+
+def test_build_parser_for_single_command_matches_full_parser():
+    argv = ["forge", "clone", "--flat", "--jobs", "2"]
+    assert vars(cli.build_parser("forge").parse_args(argv)) == vars(cli.build_parser().parse_args(argv))
+
+
+def test_build_parser_for_forge_subcommand_matches_full_parser():
+    for argv in (
+        ["forge", "gists", "clone", "abc123", "--file", "a.txt"],
+        ["forge", "snippet", "clone", "42", "--user", "me"],
+        ["forge", "list", "--org", "acme"],
+    ):
+        lazy = cli.build_parser(cli._requested_command(argv), cli._requested_subcommand(argv))
+        assert vars(lazy.parse_args(argv)) == vars(cli.build_parser().parse_args(argv))
+
+
+def test_forge_singular_gist_and_snippet_names_are_aliases():
+    parser = cli.build_parser("forge")
+    forge = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction)).choices["forge"]
+    choices = next(a for a in forge._actions if isinstance(a, argparse._SubParsersAction)).choices
+
+    assert choices["gist"] is choices["gists"]
+    assert choices["snippet"] is choices["snippets"]
+    assert parser.parse_args(["forge", "gist", "list"]).forge_command == "gist"
+
+
+def test_requested_command_skips_global_options():
+    assert cli._requested_command(["--tui-root", "/tmp/ws", "status", "--fetch"]) == "status"
+    assert cli._requested_command(["-t"]) is None
+    assert cli._requested_command(["--help"]) is None
+    assert cli._requested_command(["unknown"]) is None
+    assert cli._requested_subcommand(["-t", "forge", "gists", "list"]) == "gists"
+    assert cli._requested_subcommand(["forge", "--help"]) is None
+
+
+def test_main_runs_config_path_without_building_parser(monkeypatch, capsys, tmp_path):
+    monkeypatch.setenv("GIT_LANTERN_CONFIG", str(tmp_path / "config.json"))
+    monkeypatch.setenv("GIT_LANTERN_ENV", str(tmp_path / "missing.env"))
+    monkeypatch.setattr(cli.sys, "argv", ["lantern", "config", "path"])
+    monkeypatch.setattr(cli, "build_parser", lambda *_args, **_kwargs: pytest.fail("parser should not be built"))
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main()
+
+    assert excinfo.value.code == 0
+    assert capsys.readouterr().out.strip() == str(tmp_path / "config.json")
+
+
+def test_main_runs_servers_without_building_parser(monkeypatch, capsys, tmp_path):
+    monkeypatch.setenv("GIT_LANTERN_ENV", str(tmp_path / "missing.env"))
+    monkeypatch.setattr(cli.sys, "argv", ["lantern", "servers"])
+    monkeypatch.setattr(cli.lantern_config, "load_config", lambda: {"servers": {"github.com": {"user": "octo"}}})
+    monkeypatch.setattr(cli, "build_parser", lambda *_args, **_kwargs: pytest.fail("parser should not be built"))
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main()
+
+    assert excinfo.value.code == 0
+    assert "octo" in capsys.readouterr().out
+
+
+def test_main_skips_dotenv_for_local_only_commands(monkeypatch):
+    loaded = []
+    monkeypatch.setattr(cli, "load_dotenv", lambda: loaded.append(True))
+    monkeypatch.setattr(cli, "cmd_table", lambda _args: 0)
+    monkeypatch.setattr(cli.sys, "argv", ["lantern", "table"])
+
+    with pytest.raises(SystemExit):
+        cli.main()
+
+    assert loaded == []
+
+
+def test_top_level_help_does_not_need_command_arguments():
+    assert cli.build_parser("").format_help() == cli.build_parser().format_help()
@@ -7,16 +7,9 @@ menu with no dialog:
   the command succeeds but returns empty output.
 """
 
-import os
-import sys
 from types import SimpleNamespace
 
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-SRC = os.path.join(ROOT, "src")
-if SRC not in sys.path:
-    sys.path.insert(0, SRC)
-
-from lantern import cli  # noqa: E402
+from lantern import cli
 
 
 def _capture_msgboxes(monkeypatch):
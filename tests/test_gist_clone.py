@@ -0,0 +1,97 @@
+import argparse
+
+from lantern import cli, github
+
+
+def _gist_args(tmp_path, files, force=False):
+    return argparse.Namespace(
+        gist_id="abc123",
+        input="",
+        server="github.com",
+        token="tok",
+        output_dir=str(tmp_path / "out"),
+        file=files,
+        force=force,
+    )
+
+
+def _patch_gist(monkeypatch, names):
+    monkeypatch.setattr(github, "load_env", lambda: {})
+    monkeypatch.setattr(cli.lantern_config, "load_config", lambda: {})
+    monkeypatch.setattr(cli.lantern_config, "get_server", lambda _config, _name: {"provider": "github"})
+    monkeypatch.setattr(
+        github,
+        "get_gist",
+        lambda *_args: {"files": {name: {"raw_url": f"https://gist.githubusercontent.com/{name}"} for name in names}},
+    )
+    monkeypatch.setattr(
+        github,
+        "download_gist_file",
+        lambda raw_url, _token, _base_url: raw_url.rsplit("/", 1)[-1].encode("utf-8"),
+    )
+
+
+def test_gists_clone_downloads_all_requested_files(tmp_path, monkeypatch, capsys):
+    _patch_gist(monkeypatch, ["a.txt", "b.txt"])
+
+    assert cli.cmd_github_gists_clone(_gist_args(tmp_path, ["b.txt", "a.txt"])) == 0
+
+    out = capsys.readouterr().out
+    assert (tmp_path / "out" / "a.txt").read_bytes() == b"a.txt"
+    assert (tmp_path / "out" / "b.txt").read_bytes() == b"b.txt"
+    assert out.index("b.txt") < out.index("a.txt")
+
+
+def test_gists_clone_stops_at_existing_file_without_force(tmp_path, monkeypatch, capsys):
+    _patch_gist(monkeypatch, ["a.txt", "b.txt"])
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "b.txt").write_bytes(b"keep")
+
+    assert cli.cmd_github_gists_clone(_gist_args(tmp_path, ["a.txt", "b.txt"])) == 1
+
+    assert "File exists" in capsys.readouterr().err
+    assert (tmp_path / "out" / "a.txt").read_bytes() == b"a.txt"
+    assert (tmp_path / "out" / "b.txt").read_bytes() == b"keep"
+
+
+def test_load_file_args_reads_named_and_plain_paths(tmp_path):
+    plain = tmp_path / "notes.md"
+    plain.write_bytes(b"line one\r\nline two\n")
+    named = tmp_path / "other.txt"
+    named.write_bytes("café".encode("utf-8"))
+
+    files = cli._load_file_args([str(plain), f"renamed.txt={named}"])
+
+    assert files == {"notes.md": "line one\r\nline two\n", "renamed.txt": "café"}
+
+
+def test_fetch_gists_follows_link_header_pages(monkeypatch):
+    def fake_request(url, _token):
+        page = int(url.rsplit("page=", 1)[1])
+        headers = {"Link": '<https://api.github.com/gists?per_page=100&page=2>; rel="last"'} if page == 1 else {}
+        return ([{"id": f"g{page}", "files": {f"{page}.txt": {}}}] if page <= 2 else []), headers
+
+    monkeypatch.setattr(github, "_request_with_headers", fake_request)
+
+    gists = github.fetch_gists(None, "tok")
+
+    assert [gist["id"] for gist in gists] == ["g1", "g2"]
+    assert gists[1]["files"] == ["2.txt"]
+
+
+def test_update_gist_patches_through_the_connection_pool(monkeypatch):
+    calls = []
+
+    def fake_request(method, url, headers=None, body=None, **_kwargs):
+        calls.append((method, url, headers, body))
+        return b'{"id": "abc123"}', {}
+
+    monkeypatch.setattr(github.http_pool, "request", fake_request)
+
+    result = github.update_gist("abc123", "tok", {"a.txt": "new", "old.txt": None}, None)
+
+    assert result == {"id": "abc123"}
+    method, url, headers, body = calls[0]
+    assert (method, url) == ("PATCH", "https://api.github.com/gists/abc123")
+    assert headers["Authorization"] == "token tok"
+    assert github.http_pool.decode_json(body) == {"files": {"a.txt": {"content": "new"}, "old.txt": None}}
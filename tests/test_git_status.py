@@ -110,18 +110,14 @@ def test_get_branch_maps_literal_head_to_none(monkeypatch):
 
 def test_repo_status_infers_upstream_from_origin_branch_when_no_tracking_branch(monkeypatch):
     def fake_run_git(_path, args):
-        if args == ["rev-parse", "--abbrev-ref", "HEAD"]:
-            return "main"
-        if args[:3] == ["rev-parse", "--abbrev-ref", "--symbolic-full-name"]:
-            return ""  # no @{u}
-        if args[:2] == ["rev-parse", "--verify"] and args[2] == "origin/main":
-            return "deadbeef"
+        if args[0] == "for-each-ref" and "refs/heads" in args:
+            return "*\0main\0\0"  # current branch without @{u}
+        if args[0] == "for-each-ref" and "refs/remotes" in args:
+            return "refs/remotes/origin/HEAD\0origin/main\nrefs/remotes/origin/main\0"
         if args[:3] == ["rev-list", "--left-right", "--count"]:
             return "0 3"
         if args == ["remote"]:
             return "origin"
-        if args[:2] == ["symbolic-ref", "-q"]:
-            return "origin/main"
         return ""
 
     monkeypatch.setattr(git, "run_git", fake_run_git)
@@ -138,10 +134,8 @@ def test_repo_status_skips_origin_inference_for_detached_head(monkeypatch):
 
     def fake_run_git(_path, args):
         tried.append(list(args))
-        if args == ["rev-parse", "--abbrev-ref", "HEAD"]:
-            return "HEAD"  # detached — get_branch() maps this to None
-        if args[:3] == ["rev-parse", "--abbrev-ref", "--symbolic-full-name"]:
-            return ""
+        if args[0] == "for-each-ref" and "refs/heads" in args:
+            return " \0main\0origin/main\0"  # detached — no branch is marked as HEAD
         if args == ["remote"]:
             return ""
         return ""
@@ -157,3 +151,71 @@ def test_repo_status_skips_origin_inference_for_detached_head(monkeypatch):
     assert status["upstream_inferred"] is False
     assert status["upstream_ahead"] is None
     assert status["upstream_behind"] is None
+
+
+def test_get_branch_tracking_parses_single_for_each_ref_call(monkeypatch):
+    calls = []
+
+    def fake_run_git(_path, args):
+        calls.append(args)
+        return "\0feature\0origin/feature\0ahead 1\n*\0main\0origin/main\0ahead 2, behind 5"
+
+    monkeypatch.setattr(git, "run_git", fake_run_git)
+
+    assert git.get_branch_tracking("/fake/repo") == ("main", "origin/main", (2, 5))
+    assert len(calls) == 1
+
+
+def test_get_branch_tracking_drops_gone_upstream(monkeypatch):
+    monkeypatch.setattr(git, "run_git", lambda _path, _args: "*\0main\0origin/main\0gone")
+
+    assert git.get_branch_tracking("/fake/repo") == ("main", None, None)
+
+
+def test_repo_status_resolves_default_refs_once(monkeypatch):
+    calls = []
+
+    def fake_run_git(_path, args):
+        calls.append(list(args))
+        if args[0] == "for-each-ref" and "refs/heads" in args:
+            return "*\0main\0origin/main\0"
+        if args == ["remote"]:
+            return "origin\nupstream"
+        if args[0] == "for-each-ref" and "refs/remotes" in args:
+            return "refs/remotes/origin/HEAD\0origin/main\nrefs/remotes/upstream/master\0\nrefs/remotes/upstream/main\0"
+        if args[:3] == ["rev-list", "--left-right", "--count"]:
+            return "1 0"
+        return ""
+
+    monkeypatch.setattr(git, "run_git", fake_run_git)
+    status = git.repo_status("/fake/repo")
+
+    assert status["main_ref"] == "origin/main"
+    assert status["default_refs"] == "origin/main, upstream/main"
+    assert calls.count(["remote"]) == 1
+    assert sum(args[0] == "for-each-ref" and "refs/remotes" in args for args in calls) == 1
+    assert not any(args[0] in {"symbolic-ref", "rev-parse"} for args in calls)
+
+
+def test_fetch_all_args_adds_jobs_only_on_supporting_git(monkeypatch):
+    monkeypatch.setattr(git, "version", lambda: (2, 43, 0))
+    assert git.fetch_all_args(4) == ["fetch", "--prune", "--all", "--jobs=4"]
+    assert git.fetch_all_args(1) == ["fetch", "--prune", "--all"]
+
+    monkeypatch.setattr(git, "version", lambda: (2, 20, 1))
+    assert git.fetch_all_args(4) == ["fetch", "--prune", "--all"]
+
+
+def test_has_in_progress_operation_reads_git_dir_without_git(monkeypatch, tmp_path):
+    plain = tmp_path / "plain"
+    (plain / ".git").mkdir(parents=True)
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text("gitdir: ../plain/.git/worktrees/wt\n", encoding="utf-8")
+    (plain / ".git" / "worktrees" / "wt" / "rebase-merge").mkdir(parents=True)
+    monkeypatch.setattr(subprocess, "run", lambda *_args, **_kwargs: (_ for _ in ()).throw(AssertionError("forked git")))
+
+    assert git.has_in_progress_operation(str(plain)) is False
+    (plain / ".git" / "MERGE_HEAD").write_text("deadbeef\n", encoding="utf-8")
+    assert git.has_in_progress_operation(str(plain)) is True
+    assert git.has_in_progress_operation(str(worktree)) is True
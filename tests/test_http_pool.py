@@ -0,0 +1,177 @@
+import http.server
+import json
+import threading
+import urllib.error
+
+import pytest
+
+from lantern import http_pool
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers = []
+    statuses = []
+    posts = []
+    flaky = 0
+
+    def do_GET(self):
+        _Handler.peers.append((self.client_address, self.path, self.headers.get("Authorization")))
+        if self.path == "/moved":
+            self._send(302, b"", {"Location": "/items?page=2"})
+        elif self.path == "/missing":
+            self._send(404, b'{"message": "Not Found"}')
+        elif self.path == "/flaky" and _Handler.flaky:
+            _Handler.flaky -= 1
+            self._send(503, b"", {"Retry-After": "2"})
+        elif self.path == "/fresh":
+            self._send(200, b'{"fresh": true}', {"ETag": '"f1"', "Cache-Control": "private, max-age=60"})
+        elif self.headers.get("If-None-Match") == '"v1"':
+            self._send(304, b"", {"ETag": '"v1"'})
+        else:
+            self._send(200, json.dumps({"path": self.path}).encode("utf-8"), {"ETag": '"v1"'})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        _Handler.posts.append((self.client_address, self.path, body))
+        if self.path == "/drop":
+            # Processed, then the connection is lost before any response is written.
+            self.close_connection = True
+            return
+        self._send(201, body)
+
+    def _send(self, status, body, headers=None):
+        _Handler.statuses.append(status)
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    for name in ("http_proxy", "HTTP_PROXY", "https_proxy", "HTTPS_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    _Handler.peers = []
+    _Handler.statuses = []
+    _Handler.posts = []
+    _Handler.flaky = 0
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        http_pool.close()
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_request_reuses_connection_across_calls(server):
+    first, headers = http_pool.request("GET", f"{server}/items?page=1", {"Authorization": "token abc"})
+    second, _headers = http_pool.request("GET", f"{server}/items?page=2")
+
+    assert json.loads(first) == {"path": "/items?page=1"}
+    assert json.loads(second) == {"path": "/items?page=2"}
+    assert headers["ETag"] == '"v1"'
+    assert _Handler.peers[0][0] == _Handler.peers[1][0]
+    assert _Handler.peers[0][2] == "token abc"
+
+
+def test_request_reuses_connection_across_threads(server):
+    http_pool.request("GET", f"{server}/items?page=1")
+    worker = threading.Thread(target=http_pool.request, args=("GET", f"{server}/items?page=2"))
+    worker.start()
+    worker.join()
+
+    assert len(_Handler.peers) == 2
+    assert _Handler.peers[0][0] == _Handler.peers[1][0]
+
+
+def test_post_is_sent_once_when_the_connection_drops(server):
+    http_pool.request("GET", f"{server}/items?page=1")
+
+    with pytest.raises(urllib.error.URLError):
+        http_pool.request("POST", f"{server}/drop", body=b'{"title": "x"}')
+
+    assert [(path, body) for _peer, path, body in _Handler.posts] == [("/drop", b'{"title": "x"}')]
+    # The idle keep-alive connection from the GET was not used for the POST.
+    assert _Handler.posts[0][0] != _Handler.peers[0][0]
+
+
+def test_request_follows_redirects_and_raises_http_errors(server):
+    body, _headers = http_pool.request("GET", f"{server}/moved")
+    assert json.loads(body) == {"path": "/items?page=2"}
+
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        http_pool.request("GET", f"{server}/missing")
+    assert excinfo.value.code == 404
+    assert json.loads(excinfo.value.read()) == {"message": "Not Found"}
+
+
+def test_request_retries_unavailable_responses_honouring_retry_after(server, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(http_pool.time, "sleep", sleeps.append)
+    _Handler.flaky = 2
+
+    body, _headers = http_pool.request("GET", f"{server}/flaky")
+
+    assert json.loads(body) == {"path": "/flaky"}
+    assert sleeps == [2.0, 2.0]
+
+    _Handler.flaky = 5
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        http_pool.request("GET", f"{server}/flaky")
+    assert excinfo.value.code == 503
+    assert len(sleeps) == 2 + http_pool._MAX_RETRIES
+
+
+def test_retry_delay_uses_backoff_without_retry_after():
+    assert http_pool._retry_delay(None, 0) == http_pool._BACKOFF_FACTOR
+    assert http_pool._retry_delay("", 2) == http_pool._BACKOFF_FACTOR * 4
+    assert http_pool._retry_delay("3600", 0) == http_pool._MAX_RETRY_DELAY
+
+
+def test_decode_json_parses_bytes():
+    assert http_pool.decode_json('[{"name": "café"}]'.encode("utf-8")) == [{"name": "café"}]
+    assert http_pool.decode_json(http_pool.encode_json({"files": {"a.txt": None}})) == {"files": {"a.txt": None}}
+    with pytest.raises(ValueError):
+        http_pool.decode_json(b"{not json")
+
+
+def test_encode_json_is_compact_without_orjson(monkeypatch):
+    monkeypatch.setattr(http_pool, "orjson", None)
+
+    assert http_pool.encode_json({"files": {"café.txt": {"content": "a b"}}}) == (
+        '{"files":{"café.txt":{"content":"a b"}}}'.encode("utf-8")
+    )
+
+
+def test_cached_request_revalidates_with_etag(server, monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    first, _headers = http_pool.request("GET", f"{server}/items", {"Authorization": "token abc"}, cache=True)
+    second, headers = http_pool.request("GET", f"{server}/items", {"Authorization": "token abc"}, cache=True)
+    other, _headers = http_pool.request("GET", f"{server}/items", {"Authorization": "token xyz"}, cache=True)
+
+    assert first == second == other
+    assert headers["ETag"] == '"v1"'
+    assert _Handler.statuses == [200, 304, 200]
+    for entry in (tmp_path / "git-lantern" / "http").iterdir():
+        assert entry.stat().st_mode & 0o077 == 0
+
+
+def test_cached_request_reuses_fresh_response_without_round_trip(server, monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    first, _headers = http_pool.request("GET", f"{server}/fresh", cache=True)
+    second, headers = http_pool.request("GET", f"{server}/fresh", cache=True)
+
+    assert first == second == b'{"fresh": true}'
+    assert headers["ETag"] == '"f1"'
+    assert _Handler.statuses == [200]
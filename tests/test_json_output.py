@@ -0,0 +1,78 @@
+import io
+import json
+
+from lantern import cli
+
+
+def _streamed(header, key, items):
+    handle = io.StringIO()
+    cli._dump_json_with_items(handle, header, key, items)
+    return handle.getvalue()
+
+
+def test_dump_json_with_items_matches_json_dump():
+    items = [
+        {"name": "alpha", "nested": {"list": [1, 2], "empty": {}}, "text": "line\nbreak"},
+        {"name": "beta", "files": [], "value": None},
+    ]
+    header = {"root": "/tmp/workspace", "selected_orgs": ["org-a"]}
+
+    assert _streamed(header, "repos", iter(items)) == json.dumps({**header, "repos": items}, indent=2)
+
+
+def test_dump_json_with_items_handles_empty_inputs():
+    assert _streamed({"user": "alice"}, "gists", []) == json.dumps({"user": "alice", "gists": []}, indent=2)
+    assert _streamed({}, "repos", [{"a": 1}]) == json.dumps({"repos": [{"a": 1}]}, indent=2)
+
+
+def _report_args(tmp_path, fmt, output=""):
+    import argparse
+
+    input_path = tmp_path / "repos.json"
+    input_path.write_text(
+        json.dumps(
+            {
+                "root": "/tmp/workspace",
+                "repos": [
+                    {"name": "beta", "branch": "main", "origin": None},
+                    {"name": "alpha", "branch": "dev", "origin": "git@example.com:a/alpha.git"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return argparse.Namespace(input=str(input_path), format=fmt, columns="name,branch,origin", output=output)
+
+
+def test_cmd_report_markdown_rows(tmp_path, capsys):
+    assert cli.cmd_report(_report_args(tmp_path, "md")) == 0
+
+    assert capsys.readouterr().out == (
+        "| name | branch | origin |\n"
+        "| --- | --- | --- |\n"
+        "| alpha | dev | git@example.com:a/alpha.git |\n"
+        "| beta | main | None |\n"
+    )
+
+
+def test_cmd_report_csv_rows(tmp_path):
+    output_path = tmp_path / "out" / "report.csv"
+    assert cli.cmd_report(_report_args(tmp_path, "csv", str(output_path))) == 0
+
+    assert output_path.read_bytes().decode("utf-8") == (
+        "name,branch,origin\r\n"
+        "alpha,dev,git@example.com:a/alpha.git\r\n"
+        "beta,main,\r\n"
+    )
+
+
+def test_add_divergence_fields_formats_counts():
+    records = [
+        {"up_ahead": "0", "up_behind": "0", "main_ahead": "2", "main_behind": None},
+        {"up_ahead": None, "up_behind": None, "main_ahead": 1, "main_behind": "4"},
+        {"up_ahead": ["bad"], "up_behind": "0", "main_ahead": "0", "main_behind": "0"},
+    ]
+
+    cells = [(rec["up"], rec["main"]) for rec in map(cli.add_divergence_fields, records)]
+
+    assert cells == [("≡", "2↑/-↓"), ("-", "1↑/4↓"), ("-↑/0↓", "≡")]
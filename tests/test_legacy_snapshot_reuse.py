@@ -60,7 +60,7 @@ def test_cmd_sync_uses_snapshot_state_for_skip_checks(monkeypatch, capsys):
 
 def test_build_fleet_snapshot_defaults_missing_fetch_and_skips_server_context_for_local_only(monkeypatch):
     monkeypatch.setattr(cli, "find_repos", lambda *_args, **_kwargs: [])
-    monkeypatch.setattr(cli, "_collect_repo_records_with_progress", lambda repos, fetch, label: [] if not repos and fetch is False and label == "snapshot" else None)
+    monkeypatch.setattr(cli, "_collect_repo_records_with_progress", lambda repos, fetch, label, **_kwargs: [] if not repos and fetch is False and label == "snapshot" else None)
     monkeypatch.setattr(
         cli,
         "_fleet_server_context",
@@ -72,3 +72,115 @@ def test_build_fleet_snapshot_defaults_missing_fetch_and_skips_server_context_fo
 
     assert snapshot_payload["repos"] == []
     assert meta["remote_count"] == 0
+
+
+def test_collect_repo_records_keeps_input_order_when_parallel(monkeypatch):
+    monkeypatch.setattr(cli, "build_repo_record", lambda path, fetch: {"name": path.rsplit("/", 1)[-1], "path": path})
+    monkeypatch.setattr(cli, "_progress_line", lambda *_args, **_kwargs: None)
+    paths = [f"/tmp/repo-{idx:02d}" for idx in range(20)]
+
+    records = cli._collect_repo_records_with_progress(paths, False, "scan", jobs=4)
+
+    assert [record["path"] for record in records] == paths
+
+
+def test_cmd_sync_runs_repo_actions_with_jobs(monkeypatch, capsys):
+    snapshot_payload = {
+        "repos": [
+            {"repo": "beta", "path": "/tmp/beta", "git_operation_in_progress": "no", "upstream_branch": "origin/main"},
+            {"repo": "alpha", "path": "/tmp/alpha", "git_operation_in_progress": "no", "upstream_branch": "origin/main"},
+        ]
+    }
+    monkeypatch.setattr(cli, "_build_fleet_snapshot", lambda *_args, **_kwargs: (snapshot_payload, {}))
+    monkeypatch.setattr(cli, "_repo_head", lambda _path: "abc123")
+    monkeypatch.setattr(cli, "_repo_branch_name", lambda _path: "main")
+    monkeypatch.setattr(cli, "render_table", lambda rows, cols: "\n".join(f"{row['name']}:{row['result']}" for row in rows))
+
+    args = argparse.Namespace(
+        root="/tmp/workspace",
+        max_depth=3,
+        include_hidden=False,
+        fetch=True,
+        pull=False,
+        push=False,
+        dry_run=True,
+        only_clean=False,
+        only_upstream=False,
+        jobs=2,
+    )
+
+    rc = cli.cmd_sync(args)
+
+    out = capsys.readouterr().out
+    assert rc == 0
+    assert out.splitlines() == ["alpha:fetch:dry-run", "beta:fetch:dry-run"]
+
+
+def test_cmd_sync_writes_issue_log_in_repo_order(tmp_path, monkeypatch, capsys):
+    import json
+    import threading
+
+    snapshot_payload = {
+        "repos": [
+            {"repo": "beta", "path": "/tmp/beta", "git_operation_in_progress": "no", "upstream_branch": "origin/main"},
+            {"repo": "alpha", "path": "/tmp/alpha", "git_operation_in_progress": "no", "upstream_branch": "origin/main"},
+        ]
+    }
+    beta_done = threading.Event()
+
+    def fake_sync(path, _actions, _dry_run):
+        # alpha only fails after beta, so completion order is the reverse of name order.
+        if path == "/tmp/alpha":
+            beta_done.wait(5)
+        else:
+            beta_done.set()
+        return ["fetch:error"], {"action": "fetch", "error": f"failed {path}"}
+
+    monkeypatch.setattr(cli, "_build_fleet_snapshot", lambda *_args, **_kwargs: (snapshot_payload, {}))
+    monkeypatch.setattr(cli, "_sync_repo_actions", fake_sync)
+
+    args = argparse.Namespace(
+        root=str(tmp_path),
+        max_depth=3,
+        include_hidden=False,
+        fetch=True,
+        pull=False,
+        push=False,
+        dry_run=False,
+        only_clean=False,
+        only_upstream=False,
+        jobs=2,
+    )
+
+    assert cli.cmd_sync(args) == 0
+
+    capsys.readouterr()
+    (log_path,) = (tmp_path / "data" / "sync-logs").iterdir()
+    payload = json.loads(log_path.read_text(encoding="utf-8"))
+    assert [issue["repo"] for issue in payload["issues"]] == ["alpha", "beta"]
+    assert [record["name"] for record in payload["results"]] == ["alpha", "beta"]
+
+
+def test_origin_url_is_memoized_until_git_config_changes(tmp_path, monkeypatch):
+    import os
+
+    config_path = tmp_path / ".git" / "config"
+    config_path.parent.mkdir()
+    config_path.write_text("[core]\n", encoding="utf-8")
+    calls = []
+
+    def fake_origin(path):
+        calls.append(path)
+        return f"git@example.com:team/repo-{len(calls)}.git"
+
+    monkeypatch.setattr(cli.git, "get_origin_url", fake_origin)
+
+    first = cli._origin_url(str(tmp_path))
+    assert cli._origin_url(str(tmp_path)) == first
+    assert len(calls) == 1
+
+    stat_result = config_path.stat()
+    os.utime(config_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+    assert cli._origin_url(str(tmp_path)) != first
+    assert len(calls) == 2
@@ -1,11 +1,13 @@
 import os
 import sys
+import threading
 import unittest
 import argparse
 from urllib.parse import parse_qs, urlsplit
 from unittest.mock import patch
 
 
+# Kept alongside tests/conftest.py so the module still runs directly via unittest.main().
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 SRC = os.path.join(ROOT, "src")
 if SRC not in sys.path:
@@ -16,6 +18,10 @@ from lantern import cli  # noqa: E402
 from lantern import forge, github  # noqa: E402
 
 
+def _without_headers(fake_request):
+    return lambda url, token: (fake_request(url, token), {})
+
+
 class OrgSupportTests(unittest.TestCase):
     def test_get_server_organizations_normalizes_list_and_dict_shapes(self) -> None:
         server = {
@@ -124,7 +130,7 @@ class OrgSupportTests(unittest.TestCase):
                 ]
             return []
 
-        with patch("lantern.github._request", side_effect=fake_request):
+        with patch("lantern.github._request_with_headers", side_effect=_without_headers(fake_request)):
             repos = github.fetch_repos(
                 user="alice",
                 token="main-token",
@@ -180,7 +186,7 @@ class OrgSupportTests(unittest.TestCase):
                 ]
             return []
 
-        with patch("lantern.github._request", side_effect=fake_request):
+        with patch("lantern.github._request_with_headers", side_effect=_without_headers(fake_request)):
             repos = github.fetch_repos(
                 user="alice",
                 token="main-token",
@@ -214,7 +220,7 @@ class OrgSupportTests(unittest.TestCase):
         def fake_request(_url: str, _token: str):
             return {"message": "API error"}
 
-        with patch("lantern.github._request", side_effect=fake_request):
+        with patch("lantern.github._request_with_headers", side_effect=_without_headers(fake_request)):
             with self.assertRaisesRegex(ValueError, r"Expected list of repositories"):
                 github.fetch_repos(
                     user="alice",
@@ -232,7 +238,7 @@ class OrgSupportTests(unittest.TestCase):
             seen_urls.append(url)
             return []
 
-        with patch("lantern.github._request", side_effect=fake_request):
+        with patch("lantern.github._request_with_headers", side_effect=_without_headers(fake_request)):
             github.fetch_repos(
                 user="alice/team",
                 token=None,
@@ -245,6 +251,106 @@ class OrgSupportTests(unittest.TestCase):
         self.assertTrue(any("/users/alice%2Fteam/repos" in url for url in seen_urls))
         self.assertTrue(any("/orgs/org%2Fteam/repos" in url for url in seen_urls))
 
+    def test_github_fetch_repos_fetches_linked_pages_concurrently_in_order(self) -> None:
+        seen_pages = []
+
+        def fake_request(url: str, _token: str):
+            page = int(parse_qs(urlsplit(url).query)["page"][0])
+            seen_pages.append(page)
+            headers = {}
+            if page == 1:
+                headers["Link"] = (
+                    '<https://api.github.com/user/repos?affiliation=owner&per_page=100&page=2>; rel="next", '
+                    '<https://api.github.com/user/repos?affiliation=owner&per_page=100&page=3>; rel="last"'
+                )
+            repos = [{"full_name": f"alice/repo-{page}", "owner": {"login": "alice"}}] if page <= 3 else []
+            return repos, headers
+
+        with patch("lantern.github._request_with_headers", side_effect=fake_request):
+            repos = github.fetch_repos(user="alice", token="main-token", include_forks=False)
+
+        self.assertEqual([repo["name"] for repo in repos], ["alice/repo-1", "alice/repo-2", "alice/repo-3"])
+        self.assertEqual(sorted(seen_pages), [1, 2, 3])
+
+    def test_gitlab_fetch_repos_uses_total_pages_header(self) -> None:
+        def fake_request(url: str, _headers):
+            page = int(parse_qs(urlsplit(url).query)["page"][0])
+            repos = [{"path_with_namespace": f"alice/repo-{page}"}] if page <= 2 else []
+            return repos, {"X-Total-Pages": "2"}
+
+        with patch("lantern.forge._request", side_effect=fake_request) as request:
+            repos = forge.fetch_repos("gitlab", "alice", "tok", False, "")
+
+        self.assertEqual([repo["name"] for repo in repos], ["alice/repo-1", "alice/repo-2"])
+        self.assertEqual(request.call_count, 2)
+
+    def test_github_fetch_repos_fetches_orgs_concurrently_and_merges_in_order(self) -> None:
+        # Every listing waits until all three are in flight at once.
+        started = threading.Barrier(3, timeout=5)
+
+        def fake_request(url: str, _token: str):
+            owner = urlsplit(url).path.split("/")[2]
+            started.wait()
+            return [{"full_name": f"{owner}/{name}", "owner": {"login": owner}} for name in ("x", "y")], {}
+
+        with patch("lantern.github._request_with_headers", side_effect=fake_request):
+            repos = github.fetch_repos(
+                user="alice",
+                token="tok",
+                include_forks=False,
+                organizations=[{"name": name, "token": ""} for name in ("org-b", "org-a", "org-c")],
+                include_user=False,
+            )
+
+        self.assertEqual(
+            [(repo["name"], repo["org"]) for repo in repos],
+            [
+                ("org-b/x", "org-b"),
+                ("org-b/y", "org-b"),
+                ("org-a/x", "org-a"),
+                ("org-a/y", "org-a"),
+                ("org-c/x", "org-c"),
+                ("org-c/y", "org-c"),
+            ],
+        )
+
+    def test_iter_pages_stops_after_short_page_without_page_count(self) -> None:
+        requested = []
+
+        def fetch_page(page: int):
+            requested.append(page)
+            return ([page] * (2 if page < 3 else 1)), {}
+
+        pages = list(github.iter_pages(fetch_page, lambda _headers: 0, per_page=2))
+
+        self.assertEqual(pages, [[1, 1], [2, 2], [3]])
+        self.assertEqual(requested, [1, 2, 3])
+
+    def test_last_page_parses_link_header(self) -> None:
+        link = '<https://api.github.com/x?page=2>; rel="next", <https://api.github.com/x?per_page=100&page=7>; rel="last"'
+        self.assertEqual(github._last_page(link), 7)
+        self.assertEqual(github._last_page('<https://api.github.com/x?page=2>; rel="next"'), 0)
+        self.assertEqual(github._last_page(None), 0)
+
+    def test_open_pull_requests_drop_stale_entries_by_updated_at(self) -> None:
+        cutoff, cutoff_iso = github._stale_cutoff(30)
+        fresh = (cutoff + github.timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        stale = (cutoff - github.timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        payload = [
+            {"number": 1, "updated_at": fresh, "head": {"ref": "a"}},
+            {"number": 2, "updated_at": stale, "head": {"ref": "b"}},
+            {"number": 3, "updated_at": stale.replace("Z", ".000+00:00"), "head": {"ref": "c"}},
+            {"number": 4, "updated_at": "", "head": {"ref": "d"}},
+        ]
+
+        with patch("lantern.github.fetch_open_pull_requests_via_gh", return_value=None), patch(
+            "lantern.github._request", return_value=payload
+        ):
+            prs = github.fetch_open_pull_requests("alice", "repo", "tok", stale_days=30)
+
+        self.assertEqual([pr["number"] for pr in prs], [1, 4])
+        self.assertFalse(github._updated_before("not-a-date", cutoff, cutoff_iso))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -270,3 +270,19 @@ def test_cmd_status_warns_when_pr_lookup_fails(monkeypatch, capsys):
     captured = capsys.readouterr()
     assert rc == 0
     assert "Warning: failed to fetch pull requests for owner/repo: boom" in captured.err
+
+
+def test_fetch_pull_requests_by_repo_keeps_key_order_across_workers(monkeypatch, capsys):
+    def _fake_fetch(**kwargs):
+        if kwargs["repo"] == "broken":
+            raise RuntimeError("boom")
+        return [{"number": len(kwargs["repo"])}]
+
+    monkeypatch.setattr(cli.github, "fetch_open_pull_requests", _fake_fetch)
+
+    prs = cli._fetch_pull_requests_by_repo(["o/alpha", "o/broken", "o/be"], "token", 30, "", jobs=4)
+
+    assert list(prs) == ["o/alpha", "o/broken", "o/be"]
+    assert prs["o/alpha"] == [{"number": 5}]
+    assert prs["o/broken"] == []
+    assert "failed to fetch pull requests for o/broken: boom" in capsys.readouterr().err
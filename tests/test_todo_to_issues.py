@@ -1,12 +1,14 @@
+import http.server
+import json
 import os
 import sys
+import threading
 
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-SRC = os.path.join(ROOT, "src")
-if SRC not in sys.path:
-    sys.path.insert(0, SRC)
+import pytest
 
-from lantern import todo_issues  # noqa: E402
+from lantern import todo_issues
+
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(todo_issues.__file__)))
 
 
 def test_parse_todo_items_basic():
@@ -177,6 +179,20 @@ def test_main_reports_missing_gh(tmp_path, monkeypatch, capsys):
     assert "gh CLI not found" in captured.err
 
 
+def test_main_dry_run_with_empty_todo_block(tmp_path, monkeypatch, capsys):
+    todo_file = tmp_path / "TODO.txt"
+    todo_file.write_text("[TODO]\n[/TODO]\n", encoding="utf-8")
+    monkeypatch.setattr(todo_issues, "fetch_existing_issues", lambda *_args: set())
+
+    assert todo_issues.main(["--todo-file", str(todo_file), "--dry-run"]) == 0
+    assert "No TODO items found." in capsys.readouterr().out
+
+
+# Spawning an interpreter dominates the suite's wall time; opt in to cover the -m entry point.
+@pytest.mark.skipif(
+    not os.environ.get("LANTERN_RUN_SUBPROCESS_SMOKE"),
+    reason="set LANTERN_RUN_SUBPROCESS_SMOKE=1 to run the subprocess smoke test",
+)
 def test_main_executes_as_module_smoke(tmp_path):
     todo_file = tmp_path / "TODO.txt"
     todo_file.write_text("[TODO]\n[/TODO]\n", encoding="utf-8")
@@ -235,3 +251,120 @@ def test_main_skips_closed_issue_duplicate_by_matching_title_and_body_fingerprin
     assert rc == 0
     assert not create_calls
     assert "[SKIPPED] Duplicate title/body fingerprint: Sync TODO import" in captured.out
+
+
+def test_resolve_issue_endpoint_uses_gh_once_for_repo_and_token(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        todo_issues,
+        "run_gh_json",
+        lambda cmd: calls.append(cmd) or {"nameWithOwner": "acme/tool", "url": "https://ghe.acme.dev/acme/tool"},
+    )
+    monkeypatch.setattr(todo_issues, "run_gh_text", lambda cmd: calls.append(cmd) or "tok")
+
+    endpoint = todo_issues.resolve_issue_endpoint("acme/tool")
+
+    assert endpoint == todo_issues.IssueEndpoint("https://ghe.acme.dev/api/v3/repos/acme/tool/issues", "tok")
+    assert calls == [
+        ["gh", "repo", "view", "--json", "nameWithOwner,url", "acme/tool"],
+        ["gh", "auth", "token", "--hostname", "ghe.acme.dev"],
+    ]
+
+
+def test_main_posts_issues_over_one_resolved_endpoint(tmp_path, monkeypatch, capsys):
+    todo_file = tmp_path / "TODO.txt"
+    todo_file.write_text(
+        "[TODO]\nID: 1\nTitle: First\nDescription: One\nID: 2\nTitle: Second\nDescription: Two\n[/TODO]\n",
+        encoding="utf-8",
+    )
+    endpoint = todo_issues.IssueEndpoint("https://api.github.com/repos/acme/tool/issues", "tok")
+    resolved = []
+    posted = []
+    monkeypatch.setattr(todo_issues, "fetch_existing_issues", lambda *_args: set())
+    monkeypatch.setattr(todo_issues, "resolve_issue_endpoint", lambda repo: resolved.append(repo) or endpoint)
+    monkeypatch.setattr(
+        todo_issues.subprocess, "run", lambda *_args, **_kwargs: (_ for _ in ()).throw(AssertionError("spawned gh"))
+    )
+
+    def fake_request(method, url, headers=None, body=None, **_kwargs):
+        posted.append((method, url, headers["Authorization"], todo_issues.http_pool.decode_json(body)))
+        return b'{"html_url": "https://github.com/acme/tool/issues/%d"}' % len(posted), {}
+
+    monkeypatch.setattr(todo_issues.http_pool, "request", fake_request)
+
+    rc = todo_issues.main(["--todo-file", str(todo_file), "--label", "todo"])
+
+    out = capsys.readouterr().out
+    assert rc == 0
+    assert resolved == [None]
+    assert [entry[3] for entry in posted] == [
+        {"title": "First", "body": "ID: 1\n\nOne", "labels": ["todo"]},
+        {"title": "Second", "body": "ID: 2\n\nTwo", "labels": ["todo"]},
+    ]
+    assert {entry[:3] for entry in posted} == {("POST", endpoint.url, "token tok")}
+    assert "[CREATED] https://github.com/acme/tool/issues/2" in out
+
+
+def test_main_posts_each_issue_once_when_the_connection_drops(tmp_path, monkeypatch, capsys):
+    for name in ("http_proxy", "HTTP_PROXY", "https_proxy", "HTTPS_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    posted = []
+
+    class _IssueHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            posted.append(payload["title"])
+            if payload["title"] == "Second":
+                # The issue is created, then the connection drops before the response.
+                self.close_connection = True
+                return
+            body = json.dumps({"html_url": f"https://github.com/acme/tool/issues/{len(posted)}"}).encode("utf-8")
+            self.send_response(201)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            pass
+
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _IssueHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    todo_file = tmp_path / "TODO.txt"
+    todo_file.write_text(
+        "[TODO]\nID: 1\nTitle: First\nDescription: One\n"
+        "ID: 2\nTitle: Second\nDescription: Two\n"
+        "ID: 3\nTitle: Third\nDescription: Three\n[/TODO]\n",
+        encoding="utf-8",
+    )
+    endpoint = todo_issues.IssueEndpoint(f"http://127.0.0.1:{httpd.server_address[1]}/repos/acme/tool/issues", "tok")
+    monkeypatch.setattr(todo_issues, "fetch_existing_issues", lambda *_args: set())
+    monkeypatch.setattr(todo_issues, "resolve_issue_endpoint", lambda _repo: endpoint)
+
+    try:
+        rc = todo_issues.main(["--todo-file", str(todo_file)])
+    finally:
+        todo_issues.http_pool.close()
+        httpd.shutdown()
+        httpd.server_close()
+
+    captured = capsys.readouterr()
+    assert rc == 0
+    assert posted == ["First", "Second", "Third"]
+    assert "[ERROR] Failed to create issue: Second" in captured.err
+    assert "Done. Created: 2, Skipped duplicates: 0, Parsed: 3" in captured.out
+
+
+def test_main_falls_back_to_gh_issue_create_when_endpoint_is_unresolved(tmp_path, monkeypatch):
+    todo_file = tmp_path / "TODO.txt"
+    todo_file.write_text("[TODO]\nTitle: First\nDescription: One\n[/TODO]\n", encoding="utf-8")
+    created = []
+    monkeypatch.setattr(todo_issues, "fetch_existing_issues", lambda *_args: set())
+    monkeypatch.setattr(
+        todo_issues, "resolve_issue_endpoint", lambda _repo: (_ for _ in ()).throw(ValueError("no token"))
+    )
+    monkeypatch.setattr(todo_issues, "create_issue", lambda *args: created.append(args))
+
+    assert todo_issues.main(["--todo-file", str(todo_file)]) == 0
+    assert created[0][-1] is None